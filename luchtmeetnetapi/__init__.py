@@ -1,5 +1,6 @@
 """Asynchronous Python client for luchtmeetnet."""
 
 from .client import LuchtmeetNetClient
+from .sync_client import LuchtmeetNetSyncClient
 
-__all__ = ["LuchtmeetNetClient"]
+__all__ = ["LuchtmeetNetClient", "LuchtmeetNetSyncClient"]
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+
 from .const import (
     COMPONENT_API,
     COMPONENTS_API,
@@ -24,17 +29,77 @@ from .models import (
     StationMeasurements,
     Stations,
 )
+from .projection import decode_page
 from .request_client import HttpRequestClient
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Executor
+
+    from .model_cache import ModelCache
+    from .models import PagedResult
+
+M = TypeVar("M", bound=DataClassORJSONMixin)
+
 
 class LuchtmeetNetApi(HttpRequestClient):
     """Luchtmeetnet API."""
 
+    decode_offload_threshold: int | None = None
+    decode_executor: Executor | None = None
+    model_cache: ModelCache | None = None
+
+    async def _decode(self, model: type[M], text: str) -> M:
+        """Decode a response into a model.
+
+        Responses of at least `decode_offload_threshold` characters are decoded
+        in `decode_executor`, or the default executor of the loop, so large
+        pages do not block the event loop.
+        """
+        if (
+            self.decode_offload_threshold is None
+            or len(text) < self.decode_offload_threshold
+        ):
+            return model.from_json(text)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.decode_executor, model.from_json, text)
+
+    async def _get_model(self, model: type[M], path: str) -> M:
+        """Retrieve a model, using the `model_cache` when it is set."""
+        if self.model_cache is not None:
+            cached = self.model_cache.get(path)
+            if cached is not None:
+                return cached
+        text = await self._make_request(path)
+        result = await self._decode(model, text)
+        if self.model_cache is not None:
+            self.model_cache.set(path, result, len(text))
+        return result
+
+    async def _get_rows(
+        self,
+        path: str,
+        params: dict[str, str | None],
+        fields: Sequence[str],
+        row_type: Callable[..., Any] | None = None,
+    ) -> PagedResult[Any]:
+        """Retrieve a page, decoding only the given fields of its rows."""
+        text = await self._make_request(path, params)
+        if (
+            self.decode_offload_threshold is None
+            or len(text) < self.decode_offload_threshold
+        ):
+            return decode_page(text, fields, row_type)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.decode_executor, decode_page, text, fields, row_type
+        )
+
     async def get_component(self, component_name: str) -> Component:
         """Retrieve the specifics of a selected component."""
         path = COMPONENT_API.format(component_name)
 
-        return Component.from_json(await self._make_request(path))
+        return await self._get_model(Component, path)
 
     async def get_components(
         self, page: int = 1, order_by: str | None = None
@@ -42,16 +107,17 @@ class LuchtmeetNetApi(HttpRequestClient):
         """Retrieve components."""
         path = COMPONENTS_API
 
-        return Components.from_json(
-            await self._make_request(path, {"page": str(page), "order_by": order_by})
+        return await self._decode(
+            Components,
+            await self._make_request(path, {"page": str(page), "order_by": order_by}),
         )
 
     async def get_organisations(self, page: int = 1) -> Organisations:
         """Retrieve organisations."""
         path = ORGANISATIONS_API
 
-        return Organisations.from_json(
-            await self._make_request(path, {"page": str(page)})
+        return await self._decode(
+            Organisations, await self._make_request(path, {"page": str(page)})
         )
 
     async def get_stations(
@@ -63,7 +129,8 @@ class LuchtmeetNetApi(HttpRequestClient):
         """Retrieve stations."""
         path = STATIONS_API
 
-        return Stations.from_json(
+        return await self._decode(
+            Stations,
             await self._make_request(
                 path,
                 {
@@ -71,14 +138,14 @@ class LuchtmeetNetApi(HttpRequestClient):
                     "order_by": order_by,
                     "organisation_id": organisation_id,
                 },
-            )
+            ),
         )
 
     async def get_station(self, station_number: str) -> Station:
         """Retrieve station information."""
         path = STATION_API.format(station_number)
 
-        return Station.from_json(await self._make_request(path))
+        return await self._get_model(Station, path)
 
     async def get_station_measurements(  # pylint: disable=R0913, R0917
         self,
@@ -91,7 +158,8 @@ class LuchtmeetNetApi(HttpRequestClient):
         """Retrieve station information."""
         path = STATION_MEASUREMENTS_API.format(station_number)
 
-        return StationMeasurements.from_json(
+        return await self._decode(
+            StationMeasurements,
             await self._make_request(
                 path,
                 {
@@ -100,7 +168,7 @@ class LuchtmeetNetApi(HttpRequestClient):
                     "order_direction": order_direction,
                     "formula": formula,
                 },
-            )
+            ),
         )
 
     async def get_measurements(  # pylint: disable=R0913, R0917  # noqa: PLR0913
@@ -116,7 +184,8 @@ class LuchtmeetNetApi(HttpRequestClient):
         """Retrieve measurements."""
         path = MEASUREMENTS_API
 
-        return Measurements.from_json(
+        return await self._decode(
+            Measurements,
             await self._make_request(
                 path,
                 {
@@ -128,7 +197,7 @@ class LuchtmeetNetApi(HttpRequestClient):
                     "order_direction": order_direction,
                     "formula": formula,
                 },
-            )
+            ),
         )
 
     async def get_lki(  # pylint: disable=R0913, R0917  # noqa: PLR0913
@@ -143,7 +212,8 @@ class LuchtmeetNetApi(HttpRequestClient):
         """Retrieve calculate LKI values."""
         path = LKI_API
 
-        return LkiValues.from_json(
+        return await self._decode(
+            LkiValues,
             await self._make_request(
                 path,
                 {
@@ -154,7 +224,7 @@ class LuchtmeetNetApi(HttpRequestClient):
                     "order_by": order_by,
                     "order_direction": order_direction,
                 },
-            )
+            ),
         )
 
     async def get_concentrations(  # pylint: disable=R0913, R0917  # noqa: PLR0913
@@ -169,7 +239,8 @@ class LuchtmeetNetApi(HttpRequestClient):
         """Retrieve calculate LKI values."""
         path = CONCENTRATIONS_API
 
-        return Concentrations.from_json(
+        return await self._decode(
+            Concentrations,
             await self._make_request(
                 path,
                 {
@@ -180,5 +251,5 @@ class LuchtmeetNetApi(HttpRequestClient):
                     "latitude": str(latitude),
                     "longitude": str(longitude),
                 },
-            )
+            ),
         )
@@ -0,0 +1,157 @@
+"""Backends storing cached responses."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import os
+
+
+class CacheBackend(ABC):
+    """Base backend storing responses by key, with a time to live.
+
+    Methods are coroutines, so backends can be out-of-process stores.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Get a response, or None when it is not cached or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Cache a response for `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a response."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all responses."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release resources of the backend, nothing by default."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Backend keeping responses in memory, only shared within the process."""
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        self._entries: dict[str, tuple[str, float]] = {}
+
+    async def get(self, key: str) -> str | None:
+        """Get a response, or None when it is not cached or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            del self._entries[key]
+            return None
+        return entry[0]
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Cache a response for `ttl` seconds."""
+        self._entries[key] = (value, time.time() + ttl)
+
+    async def delete(self, key: str) -> None:
+        """Remove a response."""
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        """Remove all responses."""
+        self._entries.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Backend keeping responses in a SQLite database file.
+
+    The database uses write-ahead logging, so it can be shared by all
+    processes on a host: one process warms the cache for all others. Queries
+    run in a thread to keep the event loop responsive while the database is
+    locked by another process, for at most `busy_timeout` seconds.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], busy_timeout: float = 5.0) -> None:
+        """Initialize the backend."""
+        self.path = Path(path)
+        self.busy_timeout = busy_timeout
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the connection, creating the database when needed."""
+        if self._connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses"
+                " (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _execute(self, sql: str, parameters: tuple[object, ...] = ()) -> list[tuple]:
+        """Execute a statement and return all rows."""
+        with self._lock:
+            return self._connect().execute(sql, parameters).fetchall()
+
+    async def get(self, key: str) -> str | None:
+        """Get a response, or None when it is not cached or expired."""
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT value FROM responses WHERE key = ? AND expires > ?",
+            (key, time.time()),
+        )
+        return rows[0][0] if rows else None
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Cache a response for `ttl` seconds."""
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl),
+        )
+
+    async def delete(self, key: str) -> None:
+        """Remove a response."""
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM responses WHERE key = ?", (key,)
+        )
+
+    async def clear(self) -> None:
+        """Remove all responses."""
+        await asyncio.to_thread(self._execute, "DELETE FROM responses")
+
+    async def purge(self) -> None:
+        """Remove all expired responses."""
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM responses WHERE expires <= ?", (time.time(),)
+        )
+
+    def _close(self) -> None:
+        """Close the connection, waiting for running queries."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def close(self) -> None:
+        """Close the connection to the database.
+
+        The connection is opened again when the backend is used after closing.
+        """
+        await asyncio.to_thread(self._close)
@@ -0,0 +1,75 @@
+"""In-memory catalog of components."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import LuchtmeetNetClient
+    from .models import ComponentData, ComponentLimit
+
+
+class ComponentCatalog:
+    """Index of all components, including their limits, by formula.
+
+    All components are fetched concurrently in one warm up, after which
+    lookups are served from memory. Call `ensure_fresh` to refresh the
+    catalog once it is older than `refresh_interval` seconds.
+    """
+
+    def __init__(
+        self, client: LuchtmeetNetClient, refresh_interval: float = 24 * 60 * 60
+    ) -> None:
+        """Initialize the catalog."""
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.updated: float | None = None
+        self._components: dict[str, ComponentData] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def expired(self) -> bool:
+        """Return whether the catalog needs to be refreshed."""
+        return (
+            self.updated is None
+            or time.monotonic() - self.updated >= self.refresh_interval
+        )
+
+    async def refresh(self) -> None:
+        """Fetch all components and their details."""
+        components = await self.client.get_all_components()
+        details = await asyncio.gather(
+            *(self.client.get_component(component.formula) for component in components)
+        )
+        self._components = {detail.data.formula: detail.data for detail in details}
+        self.updated = time.monotonic()
+
+    async def ensure_fresh(self) -> None:
+        """Refresh the catalog when it is expired."""
+        async with self._lock:
+            if self.expired:
+                await self.refresh()
+
+    def get(self, formula: str) -> ComponentData | None:
+        """Get a component by formula."""
+        return self._components.get(formula)
+
+    def limits(self, formula: str) -> list[ComponentLimit]:
+        """Get the limits of a component, empty when it is unknown."""
+        component = self._components.get(formula)
+        return [] if component is None else component.limits
+
+    @property
+    def formulas(self) -> list[str]:
+        """Get the formulas of all components."""
+        return list(self._components)
+
+    def __contains__(self, formula: object) -> bool:
+        """Return whether a component is in the catalog."""
+        return formula in self._components
+
+    def __len__(self) -> int:
+        """Return the number of components."""
+        return len(self._components)
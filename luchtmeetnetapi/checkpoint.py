@@ -0,0 +1,91 @@
+"""Checkpoints for resumable paginated pulls."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+import os
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from mashumaro.codecs.basic import BasicDecoder
+import orjson
+
+T = TypeVar("T")
+
+
+class PaginationCheckpoint(Generic[T]):
+    """Persist the progress of a paginated pull to a local state file.
+
+    The state file records the query, the next page to fetch and the amount of
+    output written so far. Items of completed pages are appended to a
+    `.jsonl` file next to it. Loading the checkpoint truncates that file to
+    the last recorded page, so a page is never stored twice.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        query: dict[str, str | None],
+        item_type: type[T],
+    ) -> None:
+        """Initialize the checkpoint."""
+        self.path = Path(path)
+        self.items_path = self.path.with_name(f"{self.path.name}.jsonl")
+        self.query = query
+        self._decoder = BasicDecoder(item_type)
+        self._offset = 0
+
+    def load(self) -> tuple[int, list[T]]:
+        """Load the next page to fetch and the items retrieved so far.
+
+        Returns the first page and no items when there is no checkpoint for
+        this query, or when the state file cannot be read.
+        """
+        state = None
+        if self.path.exists() and self.items_path.exists():
+            with suppress(orjson.JSONDecodeError):
+                state = orjson.loads(self.path.read_bytes())
+        if state is None or state["query"] != self.query:
+            self.remove()
+            self._offset = 0
+            return 1, []
+
+        self._offset = state["offset"]
+        with self.items_path.open("r+b") as file:
+            file.truncate(self._offset)
+            file.seek(0)
+            items = [self._decoder.decode(orjson.loads(line)) for line in file]
+        return state["next_page"], items
+
+    def save(self, next_page: int, items: list[T]) -> None:
+        """Save the items of a completed page and the next page to fetch."""
+        with self.items_path.open("ab") as file:
+            for item in items:
+                file.write(orjson.dumps(item) + b"\n")
+            file.flush()
+            os.fsync(file.fileno())
+            self._offset = file.tell()
+
+        state = {"query": self.query, "next_page": next_page, "offset": self._offset}
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with temp_path.open("wb") as file:
+            file.write(orjson.dumps(state))
+            file.flush()
+            os.fsync(file.fileno())
+        temp_path.replace(self.path)
+        _fsync_directory(self.path.parent)
+
+    def remove(self) -> None:
+        """Remove the checkpoint."""
+        self.path.unlink(missing_ok=True)
+        self.items_path.unlink(missing_ok=True)
+
+
+def _fsync_directory(path: Path) -> None:
+    """Flush a directory entry to disk, where the platform supports it."""
+    with suppress(OSError):
+        descriptor = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
@@ -0,0 +1,217 @@
+"""Command line interface for bulk downloads from Luchtmeetnet.nl."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import nullcontext
+import csv
+from dataclasses import asdict
+from pathlib import Path
+import sys
+import time
+from typing import IO, TYPE_CHECKING, Any
+
+import orjson
+
+from .client import LuchtmeetNetClient
+from .limits import AdaptiveConcurrencyLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from .models import PagedResult
+
+FORMATS = ("jsonl", "json", "csv")
+PROGRESS_INTERVAL = 0.5
+
+
+def _flatten(row: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Flatten nested dicts to dotted keys."""
+    flat: dict[str, Any] = {}
+    for key, value in row.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+class RowWriter:
+    """Write rows to a stream in one of the supported formats."""
+
+    def __init__(self, stream: IO[str], output_format: str) -> None:
+        """Initialize the writer."""
+        self.stream = stream
+        self.format = output_format
+        self.rows = 0
+        self._csv: csv.DictWriter[str] | None = None
+
+    def write(self, row: dict[str, Any]) -> None:
+        """Write a single row."""
+        if self.format == "csv":
+            row = _flatten(row)
+            if self._csv is None:
+                self._csv = csv.DictWriter(self.stream, fieldnames=list(row))
+                self._csv.writeheader()
+            self._csv.writerow(row)
+        elif self.format == "json":
+            self.stream.write("[\n" if self.rows == 0 else ",\n")
+            self.stream.write(orjson.dumps(row).decode())
+        else:
+            self.stream.write(orjson.dumps(row).decode() + "\n")
+        self.rows += 1
+
+    def close(self) -> None:
+        """Finish the output."""
+        if self.format == "json":
+            self.stream.write("[]\n" if self.rows == 0 else "\n]\n")
+        self.stream.flush()
+
+
+class Progress:
+    """Report live and final download progress on stderr."""
+
+    def __init__(self, client: LuchtmeetNetClient, stream: IO[str]) -> None:
+        """Initialize the progress reporter."""
+        self.client = client
+        self.stream = stream
+        self.rows = 0
+        self.started = time.monotonic()
+
+    def line(self) -> str:
+        """Get the progress line."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        requests = self.client.stats.requests
+        return (
+            f"{self.rows} rows ({self.rows / elapsed:.1f} rows/s), "
+            f"{requests} requests ({requests / elapsed:.1f} requests/s), "
+            f"concurrency {self.client.stats.concurrency_limit}, "
+            f"{elapsed:.1f}s"
+        )
+
+    async def report(self) -> None:
+        """Keep reporting progress until cancelled."""
+        while True:
+            await asyncio.sleep(PROGRESS_INTERVAL)
+            self.stream.write(f"\r{self.line()}")
+            self.stream.flush()
+
+    def summary(self) -> None:
+        """Write the final timing summary."""
+        self.stream.write(f"\rDone: {self.line()}\n")
+        self.stream.flush()
+
+
+def _queries(
+    client: LuchtmeetNetClient, args: argparse.Namespace
+) -> list[AsyncIterator[PagedResult[Any]]]:
+    """Get the page iterators for the requested command."""
+    if args.command == "stations":
+        return [
+            client.iter_pages(
+                lambda page: client.get_stations(
+                    page=page, organisation_id=args.organisation_id
+                )
+            )
+        ]
+    if args.command == "components":
+        return [client.iter_pages(lambda page: client.get_components(page=page))]
+
+    def lki_pages(station: str | None) -> AsyncIterator[PagedResult[Any]]:
+        return client.iter_pages(
+            lambda page: client.get_lki(
+                page=page, station_number=station, start=args.start, end=args.end
+            )
+        )
+
+    def measurement_pages(station: str | None) -> AsyncIterator[PagedResult[Any]]:
+        return client.iter_pages(
+            lambda page: client.get_measurements(
+                page=page,
+                station_number=station,
+                formula=args.formula,
+                start=args.start,
+                end=args.end,
+            )
+        )
+
+    get_pages = lki_pages if args.command == "lki" else measurement_pages
+    return [get_pages(station) for station in args.station or [None]]
+
+
+async def _download(args: argparse.Namespace, writer: RowWriter) -> None:
+    """Download all pages of the requested command."""
+    async with LuchtmeetNetClient() as client:
+        client.rate_limit = args.rate_limit
+        client.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=min(4, args.concurrency), max_limit=args.concurrency
+        )
+        progress = Progress(client, sys.stderr)
+
+        async def consume(pages: AsyncIterator[PagedResult[Any]]) -> None:
+            async for result in pages:
+                for item in result.data:
+                    writer.write(asdict(item))
+                progress.rows += len(result.data)
+
+        reporter = None
+        if not args.no_progress:
+            reporter = asyncio.create_task(progress.report())
+        try:
+            await asyncio.gather(*(consume(pages) for pages in _queries(client, args)))
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+        if not args.no_progress:
+            progress.summary()
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="luchtmeetnet", description="Bulk download data from luchtmeetnet.nl."
+    )
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("--output", "-o", help="output file, defaults to stdout")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="maximum number of concurrent requests, adapted to the API load",
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, help="maximum number of requests per second"
+    )
+    parser.add_argument(
+        "--no-progress", action="store_true", help="do not report progress"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stations = commands.add_parser("stations", help="download stations")
+    stations.add_argument("--organisation-id")
+    commands.add_parser("components", help="download components")
+    for name in ("measurements", "lki"):
+        command = commands.add_parser(name, help=f"download {name}")
+        command.add_argument(
+            "--station", action="append", help="station number, can be repeated"
+        )
+        command.add_argument("--start", help="start timestamp, e.g. 2024-10-01T00:00")
+        command.add_argument("--end", help="end timestamp, e.g. 2024-10-02T00:00")
+        if name == "measurements":
+            command.add_argument("--formula")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface."""
+    args = _parser().parse_args(argv)
+    with (
+        Path(args.output).open("w", encoding="utf-8", newline="")
+        if args.output is not None
+        else nullcontext(sys.stdout)
+    ) as stream:
+        writer = RowWriter(stream, args.format)
+        asyncio.run(_download(args, writer))
+        writer.close()
+    return 0
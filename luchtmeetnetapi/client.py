@@ -2,33 +2,84 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypeVar
+import asyncio
+from collections import deque
+import contextvars
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Coroutine, TypeVar
 
 from .api import LuchtmeetNetApi
 from .cache import STATION_COORDINATES
-from .util import get_approximate_distance
+from .checkpoint import PaginationCheckpoint
+from .const import (
+    COMPONENTS_API,
+    LKI_API,
+    MEASUREMENTS_API,
+    ORGANISATIONS_API,
+    STATION_MEASUREMENTS_API,
+    STATIONS_API,
+)
+from .deadline import CURRENT_DEADLINE
+from .exceptions import LuchtmeetNetDeadlineError
+from .frame import MeasurementFrameBuilder
+from .limits import REQUEST_FLOW, REQUEST_PRIORITY, Priority
+from .models import Components, LkiValuesData, MeasurementData, Organisations, Stations
+from .poll import PollResult, content_digest
+from .projection import MEASUREMENT_FIELDS
+from .snapshot import LKI_FIELDS, build_snapshot
+from .station_index import StationIndex
+from .util import format_timestamp, get_approximate_distance, parse_timestamp
+from .watch import StationPoller
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    import os
+
+    from .interval_cache import MeasurementIntervalCache
     from .models import (
         ComponentsData,
-        LkiValuesData,
-        MeasurementData,
         OrganisationsData,
         PagedResult,
         StationMeasurementData,
         StationsData,
     )
+    from .snapshot import NetworkSnapshot
+    from .swr import StaleWhileRevalidateCache
 
 T = TypeVar("T")
 
 
-class LuchtmeetNetClient(LuchtmeetNetApi):
+class LuchtmeetNetClient(LuchtmeetNetApi):  # pylint: disable=too-many-public-methods
     """Client for LuchtmeetNetApi."""
 
-    async def get_closest_station(
-        self, latitude: float, longitude: float, use_cache: bool = True
+    prefetch_pages: int = 1
+    measurement_cache: MeasurementIntervalCache | None = None
+    station_index: StationIndex | None = None
+    latest_cache: StaleWhileRevalidateCache | None = None
+
+    def __init__(self) -> None:
+        """Initialize the client."""
+        super().__init__()
+        self._pollers: dict[tuple[str, frozenset[str] | None], StationPoller] = {}
+        self._polled_pages: dict[str, dict[int, tuple[bytes, Any]]] = {}
+
+    async def get_closest_station(  # pylint: disable=R0913, R0917
+        self,
+        latitude: float,
+        longitude: float,
+        use_cache: bool = True,
+        formula: str | None = None,
+        max_distance: float | None = None,
     ) -> str | None:
-        """Get closest station by coordinate."""
+        """Get closest station by coordinate.
+
+        When a `formula` or a `max_distance` in km is given, the closest
+        station measuring that component within that distance is looked up in
+        the `station_index`, which is built on first use.
+        """
+        if formula is not None or max_distance is not None:
+            index = await self._get_station_index()
+            return index.closest(latitude, longitude, formula, max_distance)
         stations = await self.get_all_stations()
 
         coord = (longitude, latitude)
@@ -42,6 +93,26 @@ class LuchtmeetNetClient(LuchtmeetNetApi):
                 closest_distance = station_distance
         return closest_station
 
+    async def assign_stations(
+        self, points: Iterable[tuple[float, float]], formula: str | None = None
+    ) -> list[str | None]:
+        """Get the closest station to each `(latitude, longitude)` point.
+
+        Points are looked up in a thread, in a precomputed grid of the
+        stations measuring `formula` when given, which is built once and
+        reused for all batches.
+        """
+        index = await self._get_station_index()
+        grid = await index.grid(formula)
+        return await asyncio.to_thread(grid.assign, points)
+
+    async def _get_station_index(self) -> StationIndex:
+        """Get the station index, building or refreshing it when needed."""
+        if self.station_index is None:
+            self.station_index = StationIndex(self)
+        await self.station_index.ensure_fresh()
+        return self.station_index
+
     async def get_station_coordinate(
         self, station_number: str, use_cache: bool = True
     ) -> tuple[float, float]:
@@ -72,6 +143,60 @@ class LuchtmeetNetClient(LuchtmeetNetApi):
             lambda page: self.get_stations(page=page, organisation_id=organisation_id)
         )
 
+    async def poll_all_components(self) -> PollResult[ComponentsData]:
+        """Get all components, with whether they changed since the last poll."""
+        return await self._poll_all(Components, COMPONENTS_API, {})
+
+    async def poll_all_organisations(self) -> PollResult[OrganisationsData]:
+        """Get all organisations, with whether they changed since the last poll."""
+        return await self._poll_all(Organisations, ORGANISATIONS_API, {})
+
+    async def poll_all_stations(
+        self, organisation_id: str | None = None
+    ) -> PollResult[StationsData]:
+        """Get all stations, with whether they changed since the last poll."""
+        return await self._poll_all(
+            Stations, STATIONS_API, {"organisation_id": organisation_id}
+        )
+
+    async def _poll_all(
+        self,
+        model: type[PagedResult[T]],
+        path: str,
+        params: dict[str, str | None],
+    ) -> PollResult[T]:
+        """Get all data from all pages, reusing the pages of the last poll.
+
+        Pages are identified by the digest of their response. A page that is
+        identical to the same page in the last poll of the query is not
+        decoded again, its data is reused, so it should not be modified.
+        A result cut short by a partial deadline always counts as changed.
+        """
+        key = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        previous = self._polled_pages.get(key, {})
+        pages: dict[int, tuple[bytes, PagedResult[T]]] = {}
+
+        async def get_page(page: int) -> PagedResult[T]:
+            text = await self._make_request(path, {**params, "page": str(page)})
+            digest = content_digest(text)
+            known = previous.get(page)
+            if known is not None and known[0] == digest:
+                result = known[1]
+            else:
+                result = await self._decode(model, text)
+            pages[page] = (digest, result)
+            return result
+
+        data = await self._get_all(get_page)
+        deadline = CURRENT_DEADLINE.get()
+        if deadline is not None and deadline.exceeded:
+            return PollResult(data, changed=True)
+        changed = pages.keys() != previous.keys() or any(
+            digest != previous[page][0] for page, (digest, _) in pages.items()
+        )
+        self._polled_pages[key] = pages
+        return PollResult(data, changed)
+
     async def get_all_station_measurements(
         self,
         station_number: str,
@@ -90,8 +215,34 @@ class LuchtmeetNetClient(LuchtmeetNetApi):
         end: str | None = None,
         station_number: str | None = None,
         formula: str | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
     ) -> list[MeasurementData]:
-        """Get all measurements."""
+        """Get all measurements.
+
+        When a `checkpoint` file is given, progress is saved after every page
+        and a rerun with the same query resumes where the previous one stopped.
+
+        When a `measurement_cache` is set and the station, formula, start and
+        end are all given, only the parts of the time range that are not
+        cached yet are fetched, and measurements are ordered by timestamp.
+        """
+        if (  # pylint: disable=too-many-boolean-expressions
+            self.measurement_cache is not None
+            and checkpoint is None
+            and start is not None
+            and end is not None
+            and station_number is not None
+            and formula is not None
+        ):
+            return await self._get_cached_measurements(
+                self.measurement_cache, station_number, formula, start, end
+            )
+        query = {
+            "start": start,
+            "end": end,
+            "station_number": station_number,
+            "formula": formula,
+        }
         return await self._get_all(
             lambda page: self.get_measurements(
                 page=page,
@@ -99,6 +250,145 @@ class LuchtmeetNetClient(LuchtmeetNetApi):
                 formula=formula,
                 start=start,
                 end=end,
+            ),
+            None
+            if checkpoint is None
+            else PaginationCheckpoint(checkpoint, query, MeasurementData),
+        )
+
+    async def _get_cached_measurements(  # pylint: disable=R0913, R0914, R0917
+        self,
+        cache: MeasurementIntervalCache,
+        station_number: str,
+        formula: str,
+        start: str,
+        end: str,
+    ) -> list[MeasurementData]:
+        """Get measurements, fetching only the gaps missing from the cache.
+
+        The cached rows are taken before fetching the gaps, as the entry may
+        be evicted by other queries while the gaps are fetched.
+        """
+        key = (station_number, formula)
+        start_time, end_time = parse_timestamp(start), parse_timestamp(end)
+        gaps = cache.missing(key, start_time, end_time)
+        rows = {
+            parse_timestamp(row.timestamp_measured): row
+            for row in cache.get(key, start_time, end_time)
+        }
+
+        async def get_gap(
+            gap_start: datetime, gap_end: datetime
+        ) -> list[MeasurementData]:
+            return await self._get_all(
+                lambda page: self.get_measurements(
+                    page=page,
+                    station_number=station_number,
+                    formula=formula,
+                    start=format_timestamp(gap_start.astimezone(UTC)),
+                    end=format_timestamp(gap_end.astimezone(UTC)),
+                )
+            )
+
+        results = await asyncio.gather(*(get_gap(*gap) for gap in gaps))
+        # Gaps cut short by a partial deadline are incomplete, caching them
+        # would mark the missing measurements as covered.
+        deadline = CURRENT_DEADLINE.get()
+        complete = deadline is None or not deadline.exceeded
+        for (gap_start, gap_end), gap_rows in zip(gaps, results, strict=True):
+            if complete:
+                cache.add(key, gap_start, gap_end, gap_rows)
+            for row in gap_rows:
+                timestamp = parse_timestamp(row.timestamp_measured)
+                if start_time <= timestamp <= end_time:
+                    rows[timestamp] = row
+        return [rows[timestamp] for timestamp in sorted(rows)]
+
+    async def get_all_measurement_rows(  # pylint: disable=R0913, R0917  # noqa: PLR0913
+        self,
+        fields: Sequence[str] = MEASUREMENT_FIELDS,
+        start: str | None = None,
+        end: str | None = None,
+        station_number: str | None = None,
+        formula: str | None = None,
+        row_type: Callable[..., Any] | None = None,
+    ) -> list[Any]:
+        """Get only the given fields of all measurements.
+
+        Rows are tuples of the field values, or instances of `row_type`, like
+        a NamedTuple, when given. Skipping the models makes this considerably
+        faster for large pulls.
+        """
+        return await self._get_all_rows(
+            MEASUREMENTS_API,
+            {
+                "start": start,
+                "end": end,
+                "station_number": station_number,
+                "formula": formula,
+            },
+            fields,
+            row_type,
+        )
+
+    async def get_all_measurements_frame(  # pylint: disable=R0913, R0917
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        station_number: str | None = None,
+        formula: str | None = None,
+        backend: str = "pandas",
+    ) -> Any:
+        """Get all measurements as a pandas or polars data frame.
+
+        The frame is built column by column from the decoded pages, with
+        categorical station and formula columns and UTC timestamps.
+        """
+        builder = MeasurementFrameBuilder()
+        params = {
+            "start": start,
+            "end": end,
+            "station_number": station_number,
+            "formula": formula,
+        }
+        async for result in self.iter_pages(
+            lambda page: self._get_rows(
+                MEASUREMENTS_API, {**params, "page": str(page)}, MEASUREMENT_FIELDS
+            )
+        ):
+            builder.add(result.data)
+        return builder.build(backend)
+
+    async def get_all_station_rows(
+        self,
+        fields: Sequence[str] = ("number", "location"),
+        organisation_id: str | None = None,
+        row_type: Callable[..., Any] | None = None,
+    ) -> list[Any]:
+        """Get only the given fields of all stations."""
+        return await self._get_all_rows(
+            STATIONS_API, {"organisation_id": organisation_id}, fields, row_type
+        )
+
+    async def get_all_component_rows(
+        self,
+        fields: Sequence[str] = ("formula", "name.NL"),
+        row_type: Callable[..., Any] | None = None,
+    ) -> list[Any]:
+        """Get only the given fields of all components."""
+        return await self._get_all_rows(COMPONENTS_API, {}, fields, row_type)
+
+    async def _get_all_rows(
+        self,
+        path: str,
+        params: dict[str, str | None],
+        fields: Sequence[str],
+        row_type: Callable[..., Any] | None,
+    ) -> list[Any]:
+        """Get the given fields of the rows of all pages."""
+        return await self._get_all(
+            lambda page: self._get_rows(
+                path, {**params, "page": str(page)}, fields, row_type
             )
         )
 
@@ -107,25 +397,228 @@ class LuchtmeetNetClient(LuchtmeetNetApi):
         start: str | None = None,
         end: str | None = None,
         station_number: str | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
     ) -> list[LkiValuesData]:
-        """Get all lki."""
+        """Get all lki.
+
+        When a `checkpoint` file is given, progress is saved after every page
+        and a rerun with the same query resumes where the previous one stopped.
+        """
+        query = {"start": start, "end": end, "station_number": station_number}
         return await self._get_all(
             lambda page: self.get_lki(
                 page=page,
                 station_number=station_number,
                 start=start,
                 end=end,
+            ),
+            None
+            if checkpoint is None
+            else PaginationCheckpoint(checkpoint, query, LkiValuesData),
+        )
+
+    async def get_network_snapshot(
+        self, lookback: float = 3 * 60 * 60
+    ) -> NetworkSnapshot:
+        """Get the latest value of every component at every station, and its LKI.
+
+        The station list, and the measurements and LKI of the last `lookback`
+        seconds, are fetched concurrently in bulk, paginated as usual, so the
+        number of requests does not grow with the number of stations.
+        Components not measured within `lookback` are missing.
+        """
+        start = format_timestamp(datetime.now(UTC) - timedelta(seconds=lookback))
+        stations, measurements, lki = await asyncio.gather(
+            self.get_all_stations(),
+            self.get_all_measurement_rows(start=start),
+            self._get_all_rows(
+                LKI_API,
+                {"start": start, "end": None, "station_number": None},
+                LKI_FIELDS,
+                None,
+            ),
+        )
+        return build_snapshot(
+            [station.number for station in stations], measurements, lki
+        )
+
+    async def get_latest_station_measurements(
+        self, station_number: str, formula: str | None = None
+    ) -> list[StationMeasurementData]:
+        """Get the latest measurement of each component measured by a station.
+
+        When a `latest_cache` is set, a cached result is returned without
+        waiting for the API while it is not older than the cache allows.
+        """
+
+        async def fetch() -> list[StationMeasurementData]:
+            result = await self.get_station_measurements(
+                station_number,
+                order="timestamp_measured",
+                order_direction="desc",
+                formula=formula,
             )
+            latest: dict[str, StationMeasurementData] = {}
+            for item in result.data:
+                current = latest.get(item.formula)
+                if current is None or item.timestamp_measured > (
+                    current.timestamp_measured
+                ):
+                    latest[item.formula] = item
+            return list(latest.values())
+
+        key = f"{STATION_MEASUREMENTS_API.format(station_number)}?formula={formula}"
+        return await self._get_latest(key, fetch)
+
+    async def get_latest_lki(self, station_number: str) -> LkiValuesData | None:
+        """Get the latest LKI of a station, None when there is none.
+
+        When a `latest_cache` is set, a cached result is returned without
+        waiting for the API while it is not older than the cache allows.
+        """
+
+        async def fetch() -> LkiValuesData | None:
+            result = await self.get_lki(
+                station_number=station_number,
+                order_by="timestamp_measured",
+                order_direction="desc",
+            )
+            return max(
+                result.data, key=lambda item: item.timestamp_measured, default=None
+            )
+
+        return await self._get_latest(
+            f"{LKI_API}?station_number={station_number}", fetch
         )
 
+    async def _get_latest(
+        self, key: str, fetch: Callable[[], Coroutine[Any, Any, T]]
+    ) -> T:
+        """Get a latest value through the `latest_cache`, when set."""
+        if self.latest_cache is None:
+            return await fetch()
+        return await self.latest_cache.get(key, fetch)
+
+    async def watch(
+        self,
+        station_number: str,
+        formulas: Iterable[str] | None = None,
+        interval: float = 60,
+    ) -> AsyncIterator[list[StationMeasurementData]]:
+        """Watch the latest measurements of a station.
+
+        Yields the current measurements first, and after that only new or
+        changed measurements. All watchers of the same station and formulas
+        share one poller, which polls every `interval` seconds as set by the
+        first watcher. The watch ends when the client is closed, and raises
+        the error when polling fails unexpectedly.
+        """
+        key = (station_number, None if formulas is None else frozenset(formulas))
+        poller = self._pollers.get(key)
+        if poller is None:
+            poller = StationPoller(self, station_number, key[1], interval)
+            self._pollers[key] = poller
+        queue = poller.subscribe()
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            poller.unsubscribe(queue)
+            if poller.idle and self._pollers.get(key) is poller:
+                del self._pollers[key]
+
+    async def close(self) -> None:
+        """Stop all pollers and refreshes, and close the session."""
+        for poller in self._pollers.values():
+            poller.stop()
+        self._pollers.clear()
+        if self.latest_cache is not None:
+            self.latest_cache.close()
+        await super().close()
+
+    async def iter_pages(
+        self,
+        get_func: Callable[[int], Coroutine[Any, Any, PagedResult[T]]],
+        first_page: int = 1,
+    ) -> AsyncIterator[PagedResult[T]]:
+        """Iterate over all pages, starting at `first_page`.
+
+        While the caller handles a page, up to `prefetch_pages` following pages
+        are already being requested and decoded.
+
+        Pages are requested with bulk priority, unless a priority is set by
+        the caller with `request_priority`, as a flow of their own that takes
+        turns with other flows.
+        """
+        context = contextvars.copy_context()
+        if REQUEST_PRIORITY.get() is None:
+            context.run(REQUEST_PRIORITY.set, Priority.BULK)
+        context.run(REQUEST_FLOW.set, object())
+        loop = asyncio.get_running_loop()
+
+        def start(page: int) -> asyncio.Task[PagedResult[T]]:
+            return loop.create_task(get_func(page), context=context)
+
+        pending: deque[asyncio.Task[PagedResult[T]]] = deque([start(first_page)])
+        scheduled = first_page
+
+        def schedule(next_page: int, last_page: int, depth: int) -> None:
+            nonlocal scheduled
+            if not pending:
+                scheduled = next_page
+                pending.append(start(scheduled))
+            while len(pending) < depth and scheduled < last_page:
+                scheduled += 1
+                pending.append(start(scheduled))
+
+        try:
+            while True:
+                result = await pending.popleft()
+                next_page = result.pagination.get_next_page()
+                if next_page is None:
+                    yield result
+                    break
+                last_page = max(result.pagination.last_page, next_page)
+                if self.prefetch_pages > 0:
+                    schedule(next_page, last_page, self.prefetch_pages)
+                yield result
+                schedule(next_page, last_page, 1)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _get_all(
-        self, get_func: Callable[[int], Coroutine[Any, Any, PagedResult[T]]]
+        self,
+        get_func: Callable[[int], Coroutine[Any, Any, PagedResult[T]]],
+        checkpoint: PaginationCheckpoint[T] | None = None,
     ) -> list[T]:
-        """Get all data from all pages."""
-        items = []
-        page: int | None = 1
-        while page is not None:
-            result = await get_func(page)
-            items.extend(result.data)
-            page = result.pagination.get_next_page()
+        """Get all data from all pages.
+
+        When a partial deadline passes, the items retrieved so far are returned.
+        """
+        items: list[T] = []
+        first_page = 1
+        if checkpoint is not None:
+            first_page, items = checkpoint.load()
+        try:
+            async for result in self.iter_pages(get_func, first_page):
+                items.extend(result.data)
+                next_page = result.pagination.get_next_page()
+                if checkpoint is not None and next_page is not None:
+                    checkpoint.save(next_page, result.data)
+        except LuchtmeetNetDeadlineError:
+            deadline = CURRENT_DEADLINE.get()
+            if deadline is None or not deadline.partial:
+                raise
+            # The checkpoint is kept, so the pull can be resumed later.
+            deadline.exceeded = True
+            return items
+        if checkpoint is not None:
+            checkpoint.remove()
         return items
@@ -11,3 +11,13 @@ STATION_MEASUREMENTS_API = "stations/{}/measurements"
 MEASUREMENTS_API = "measurements"
 LKI_API = "lki"
 CONCENTRATIONS_API = "concentrations"
+
+# Seconds responses are cached by resource, reference data changes rarely
+RESPONSE_CACHE_TTLS = {
+    "components": 24 * 60 * 60,
+    "organisations": 24 * 60 * 60,
+    "stations": 24 * 60 * 60,
+    "measurements": 5 * 60,
+    "lki": 5 * 60,
+    "concentrations": 5 * 60,
+}
@@ -0,0 +1,55 @@
+"""Deadlines spanning all requests of a call."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Deadline:  # pylint: disable=too-few-public-methods
+    """Point in time, in event loop time, by which requests must be done.
+
+    When `partial` is set, paginated calls return the items retrieved so far
+    once the deadline passes, and `exceeded` is set, instead of raising.
+    """
+
+    def __init__(self, when: float, partial: bool = False) -> None:
+        """Initialize the deadline."""
+        self.when = when
+        self.partial = partial
+        self.exceeded = False
+
+    @property
+    def remaining(self) -> float:
+        """Get the number of seconds left."""
+        return self.when - asyncio.get_running_loop().time()
+
+
+CURRENT_DEADLINE: ContextVar[Deadline | None] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: float, partial: bool = False) -> Iterator[Deadline]:
+    """Limit all requests made within the context to `seconds` in total.
+
+    The deadline carries over to tasks started within the context, like the
+    prefetched pages of paginated calls. A nested deadline never extends the
+    deadline it is nested in. Must be entered while the event loop runs.
+    """
+    when = asyncio.get_running_loop().time() + seconds
+    outer = CURRENT_DEADLINE.get()
+    if outer is not None:
+        when = min(when, outer.when)
+    current = Deadline(when, partial)
+    token = CURRENT_DEADLINE.set(current)
+    try:
+        yield current
+    finally:
+        CURRENT_DEADLINE.reset(token)
@@ -0,0 +1,167 @@
+"""Streaming evaluation of measurements against component limits."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .util import parse_timestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from .models import ComponentLimit, MeasurementData
+
+
+@dataclass(frozen=True)
+class BandChange:
+    """Change of the limit band the rolling mean of a station is in."""
+
+    station_number: str
+    formula: str
+    timestamp_measured: str
+    mean: float
+    previous: ComponentLimit | None
+    current: ComponentLimit | None
+
+
+class RollingStatistics:
+    """Mean, maximum and exceedances of the values within a time window.
+
+    Only values measured less than `window` seconds before the latest value
+    are included. Adding a value takes constant amortized time, whatever the
+    number of values in the window. Values that are not newer than the latest
+    value, like measurements polled twice, are ignored.
+    """
+
+    def __init__(self, window: float, threshold: float | None = None) -> None:
+        """Initialize the statistics."""
+        self.window = window
+        self.threshold = threshold
+        self.total = 0.0
+        self.exceedances = 0
+        self.latest: float | None = None
+        self._values: deque[tuple[float, float]] = deque()
+        # Values that can still become the maximum, in decreasing order.
+        self._maxima: deque[tuple[float, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of values in the window."""
+        return len(self._values)
+
+    @property
+    def mean(self) -> float | None:
+        """Get the mean of the values in the window."""
+        return self.total / len(self._values) if self._values else None
+
+    @property
+    def max(self) -> float | None:
+        """Get the maximum of the values in the window."""
+        return self._maxima[0][1] if self._maxima else None
+
+    def add(self, timestamp: float, value: float) -> bool:
+        """Add a value measured at a POSIX timestamp, return whether it was added."""
+        if self.latest is not None and timestamp <= self.latest:
+            return False
+        self.latest = timestamp
+        self._values.append((timestamp, value))
+        self.total += value
+        if self.threshold is not None and value > self.threshold:
+            self.exceedances += 1
+        while self._maxima and self._maxima[-1][1] <= value:
+            self._maxima.pop()
+        self._maxima.append((timestamp, value))
+
+        start = timestamp - self.window
+        while self._values[0][0] <= start:
+            _, expired = self._values.popleft()
+            self.total -= expired
+            if self.threshold is not None and expired > self.threshold:
+                self.exceedances -= 1
+        while self._maxima[0][0] <= start:
+            self._maxima.popleft()
+        return True
+
+
+class RollingEvaluator:
+    """Evaluate the rolling mean of every station and component against limits.
+
+    Feed new measurements with `add` or `extend`. Rolling statistics are kept
+    per station and component, over the last `window` seconds, counting values
+    above the `thresholds` of components as exceedances. Whenever the rolling
+    mean moves into another band of the component `limits`, a BandChange is
+    returned, also for the first band of a station. Bands include their lower
+    bound and exclude their upper bound. Components without limits are only
+    tracked.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Sequence[ComponentLimit]],
+        window: float = 24 * 60 * 60,
+        thresholds: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize the evaluator."""
+        self.window = window
+        self.thresholds = thresholds or {}
+        self.statistics: dict[tuple[str, str], RollingStatistics] = {}
+        self.bands: dict[tuple[str, str], ComponentLimit | None] = {}
+        self._limits: dict[str, tuple[list[float], list[ComponentLimit]]] = {}
+        for formula, component_limits in limits.items():
+            ordered = sorted(component_limits, key=_lowerband)
+            self._limits[formula] = ([_lowerband(limit) for limit in ordered], ordered)
+
+    def band(self, formula: str, value: float) -> ComponentLimit | None:
+        """Get the limit band of a component a value is in."""
+        limits = self._limits.get(formula)
+        if limits is None:
+            return None
+        lowerbands, ordered = limits
+        index = bisect_right(lowerbands, value) - 1
+        if index < 0:
+            return None
+        limit = ordered[index]
+        if limit.upperband is not None and value >= limit.upperband:
+            return None
+        return limit
+
+    def add(self, measurement: MeasurementData) -> BandChange | None:
+        """Add a measurement, returning the band change it caused, if any."""
+        key = (measurement.station_number, measurement.formula)
+        statistics = self.statistics.get(key)
+        if statistics is None:
+            statistics = self.statistics[key] = RollingStatistics(
+                self.window, self.thresholds.get(measurement.formula)
+            )
+        timestamp = parse_timestamp(measurement.timestamp_measured).timestamp()
+        if not statistics.add(timestamp, measurement.value):
+            return None
+        mean = statistics.total / len(statistics)
+        current = self.band(measurement.formula, mean)
+        previous = self.bands.get(key)
+        if current == previous:
+            return None
+        self.bands[key] = current
+        return BandChange(
+            measurement.station_number,
+            measurement.formula,
+            measurement.timestamp_measured,
+            mean,
+            previous,
+            current,
+        )
+
+    def extend(self, measurements: Iterable[MeasurementData]) -> list[BandChange]:
+        """Add measurements in order, returning the band changes they caused."""
+        return [
+            change
+            for measurement in measurements
+            if (change := self.add(measurement)) is not None
+        ]
+
+
+def _lowerband(limit: ComponentLimit) -> float:
+    """Get the lower bound of a band, which is unbounded when not set."""
+    return float("-inf") if limit.lowerband is None else limit.lowerband
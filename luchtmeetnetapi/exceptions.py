@@ -7,3 +7,7 @@ class LuchtmeetNetError(Exception):
 
 class LuchtmeetNetConnectionError(LuchtmeetNetError):
     """LuchtmeetNet connection exception."""
+
+
+class LuchtmeetNetDeadlineError(LuchtmeetNetError):
+    """LuchtmeetNet deadline exceeded exception."""
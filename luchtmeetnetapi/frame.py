@@ -0,0 +1,152 @@
+"""Construction of data frames from measurements.
+
+Requires pandas or polars, which are optional dependencies.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import LuchtmeetNetError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+FRAME_BACKENDS = ("pandas", "polars")
+
+
+class _Categories:
+    """Codes of values, keeping only one copy of every distinct value."""
+
+    def __init__(self) -> None:
+        """Initialize the categories."""
+        self.index: dict[str, int] = {}
+        self.codes = array("q")
+
+    def append(self, value: str) -> None:
+        """Append the code of a value."""
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.index)
+        self.codes.append(code)
+
+    @property
+    def categories(self) -> list[str]:
+        """Get the distinct values, ordered by code."""
+        return list(self.index)
+
+
+class MeasurementFrameBuilder:
+    """Build a data frame of measurements column by column.
+
+    Rows are `(station_number, formula, value, timestamp_measured)` tuples, as
+    returned by the projection decoding. Stations, formulas and timestamps
+    are stored as codes of their distinct values and values in a float
+    array, so the memory used stays close to that of the final frame.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the builder."""
+        self.station_numbers = _Categories()
+        self.formulas = _Categories()
+        self.values = array("d")
+        self.timestamps = _Categories()
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.values)
+
+    def add(self, rows: Iterable[tuple[str, str, float, str]]) -> None:
+        """Add rows to the frame."""
+        for station_number, formula, value, timestamp in rows:
+            self.station_numbers.append(station_number)
+            self.formulas.append(formula)
+            self.values.append(value)
+            self.timestamps.append(timestamp)
+
+    def build(self, backend: str = "pandas") -> Any:
+        """Build the data frame with pandas or polars."""
+        if backend == "pandas":
+            return self._build_pandas()
+        if backend == "polars":
+            return self._build_polars()
+        msg = f"Unknown frame backend {backend!r}, expected one of {FRAME_BACKENDS}"
+        raise LuchtmeetNetError(msg)
+
+    def _build_pandas(self) -> Any:
+        """Build a pandas data frame."""
+        try:
+            import numpy as np  # pylint: disable=import-outside-toplevel
+            import pandas as pd  # type: ignore[import-untyped]  # pylint: disable=C0415
+        except ImportError as exception:
+            msg = "pandas is required to build a pandas data frame"
+            raise LuchtmeetNetError(msg) from exception
+
+        def categorical(column: _Categories) -> Any:
+            return pd.Categorical.from_codes(
+                np.frombuffer(column.codes, dtype=np.int64),
+                column.categories,
+            )
+
+        timestamps = pd.to_datetime(
+            self.timestamps.categories, utc=True, format="ISO8601"
+        )
+        return pd.DataFrame(
+            {
+                "station_number": categorical(self.station_numbers),
+                "formula": categorical(self.formulas),
+                "value": np.frombuffer(self.values, dtype=np.float64),
+                "timestamp_measured": timestamps.take(
+                    np.frombuffer(self.timestamps.codes, dtype=np.int64)
+                ),
+            }
+        )
+
+    def _build_polars(self) -> Any:
+        """Build a polars data frame."""
+        try:
+            import polars as pl  # pylint: disable=import-outside-toplevel
+        except ImportError as exception:
+            msg = "polars is required to build a polars data frame"
+            raise LuchtmeetNetError(msg) from exception
+
+        def gather(column: _Categories, series: Any) -> Any:
+            return series.gather(pl.Series(column.codes, dtype=pl.Int64))
+
+        return pl.DataFrame(
+            [
+                gather(
+                    self.station_numbers,
+                    pl.Series(
+                        "station_number",
+                        self.station_numbers.categories,
+                        dtype=pl.Categorical,
+                    ),
+                ),
+                gather(
+                    self.formulas,
+                    pl.Series(
+                        "formula", self.formulas.categories, dtype=pl.Categorical
+                    ),
+                ),
+                pl.Series("value", self.values, dtype=pl.Float64),
+                gather(
+                    self.timestamps,
+                    pl.Series(
+                        "timestamp_measured",
+                        self.timestamps.categories,
+                        dtype=pl.String,
+                    ).str.to_datetime(time_zone="UTC"),
+                ),
+            ]
+        )
+
+
+def to_frame(
+    rows: Iterable[tuple[str, str, float, str]], backend: str = "pandas"
+) -> Any:
+    """Build a data frame from `(station_number, formula, value, timestamp)` rows."""
+    builder = MeasurementFrameBuilder()
+    builder.add(rows)
+    return builder.build(backend)
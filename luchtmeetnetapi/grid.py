@@ -0,0 +1,114 @@
+"""Lookup grid assigning points to their closest station."""
+
+from __future__ import annotations
+
+from math import floor
+from typing import TYPE_CHECKING
+
+from .util import get_approximate_distance
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+# Bounding box of the Netherlands as (west, south, east, north)
+NL_BOUNDS = (3.2, 50.7, 7.3, 53.6)
+
+COARSE_FACTOR = 10
+
+Candidates = tuple[tuple[str, tuple[float, float]], ...]
+
+
+def _candidates(
+    stations: Candidates, latitude: float, longitude: float, size: float
+) -> Candidates:
+    """Get the stations that can be closest to a point of a cell."""
+    if len(stations) <= 1:
+        return stations
+    half = size / 2
+    center = (longitude, latitude)
+    radius = max(
+        get_approximate_distance(center, (longitude + half, latitude - half)),
+        get_approximate_distance(center, (longitude + half, latitude + half)),
+    )
+    distances = [
+        (get_approximate_distance(center, station[1]), station) for station in stations
+    ]
+    limit = min(distance for distance, _ in distances) + 2 * radius
+    return tuple(station for distance, station in distances if distance <= limit)
+
+
+class StationGrid:
+    """Grid over an area, with the stations that can be closest per cell.
+
+    For every cell the stations are kept that lie within the distance of the
+    closest station to the cell centre plus the cell diagonal, which always
+    includes the closest station to any point in the cell. Most cells have a
+    single candidate, the others need an exact check of a few stations.
+    Points outside the grid are checked against all stations.
+
+    Coordinates of stations are `(longitude, latitude)`, like in the station
+    cache, points are `(latitude, longitude)`, like in `get_closest_station`.
+    """
+
+    def __init__(
+        self,
+        stations: Mapping[str, tuple[float, float]],
+        cell_size: float = 0.01,
+        bounds: tuple[float, float, float, float] = NL_BOUNDS,
+    ) -> None:
+        """Initialize the grid."""
+        self.stations: Candidates = tuple(stations.items())
+        self.cell_size = cell_size
+        self.bounds = bounds
+        west, south, east, north = bounds
+        self.columns = max(1, round((east - west) / cell_size))
+        self.rows = max(1, round((north - south) / cell_size))
+        # The candidates of a cell are a subset of those of any larger cell
+        # containing it, so cells are filled from the candidates of coarse cells.
+        coarse_size = cell_size * COARSE_FACTOR
+        coarse: dict[tuple[int, int], Candidates] = {}
+        self.cells: list[Candidates] = []
+        for row in range(self.rows):
+            for column in range(self.columns):
+                key = (row // COARSE_FACTOR, column // COARSE_FACTOR)
+                if key not in coarse:
+                    coarse[key] = _candidates(
+                        self.stations,
+                        south + (key[0] + 0.5) * coarse_size,
+                        west + (key[1] + 0.5) * coarse_size,
+                        coarse_size,
+                    )
+                self.cells.append(
+                    _candidates(
+                        coarse[key],
+                        south + (row + 0.5) * cell_size,
+                        west + (column + 0.5) * cell_size,
+                        cell_size,
+                    )
+                )
+
+    def closest(self, latitude: float, longitude: float) -> str | None:
+        """Get the closest station to a point."""
+        west, south, _, _ = self.bounds
+        row = floor((latitude - south) / self.cell_size)
+        column = floor((longitude - west) / self.cell_size)
+        if 0 <= row < self.rows and 0 <= column < self.columns:
+            candidates = self.cells[row * self.columns + column]
+        else:
+            candidates = self.stations
+        if len(candidates) == 1:
+            return candidates[0][0]
+        coord = (longitude, latitude)
+        closest_station = None
+        closest_distance = float("inf")
+        for station, coordinate in candidates:
+            distance = get_approximate_distance(coord, coordinate)
+            if distance < closest_distance:
+                closest_station = station
+                closest_distance = distance
+        return closest_station
+
+    def assign(self, points: Iterable[tuple[float, float]]) -> list[str | None]:
+        """Get the closest station to each `(latitude, longitude)` point."""
+        closest = self.closest
+        return [closest(latitude, longitude) for latitude, longitude in points]
@@ -0,0 +1,154 @@
+"""Multi-process harvester for bulk measurement backfills."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import heapq
+from multiprocessing.util import Finalize
+from typing import TYPE_CHECKING
+
+from .client import LuchtmeetNetClient
+from .exceptions import LuchtmeetNetError
+from .util import format_timestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from multiprocessing.context import BaseContext
+
+    from .models import MeasurementData
+
+
+class _WorkerState:  # pylint: disable=too-few-public-methods
+    """Event loop and client of a worker process."""
+
+    loop: asyncio.AbstractEventLoop | None = None
+    client: LuchtmeetNetClient | None = None
+
+
+_worker = _WorkerState()
+
+
+@dataclass(frozen=True)
+class HarvestShard:
+    """A single unit of harvest work: one station over one time range."""
+
+    station_number: str
+    start: str
+    end: str
+    formula: str | None = None
+
+
+def partition(
+    stations: Iterable[str],
+    start: datetime,
+    end: datetime,
+    chunk: timedelta,
+    formula: str | None = None,
+) -> list[HarvestShard]:
+    """Partition stations and a time range into harvest shards."""
+    shards = []
+    for station_number in stations:
+        chunk_start = start
+        while chunk_start < end:
+            chunk_end = min(chunk_start + chunk, end)
+            shards.append(
+                HarvestShard(
+                    station_number,
+                    format_timestamp(chunk_start),
+                    format_timestamp(chunk_end),
+                    formula,
+                )
+            )
+            chunk_start = chunk_end
+    return shards
+
+
+def _init_worker(rate_limit: float | None) -> None:
+    """Set up the event loop and client of a worker process."""
+    _worker.loop = asyncio.new_event_loop()
+    _worker.client = LuchtmeetNetClient()
+    _worker.client.rate_limit = rate_limit
+    Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker() -> None:
+    """Close the event loop and client of a worker process."""
+    if _worker.loop is not None and _worker.client is not None:
+        _worker.loop.run_until_complete(_worker.client.close())
+        _worker.loop.close()
+    _worker.loop = _worker.client = None
+
+
+def _harvest_shard(shard: HarvestShard) -> list[MeasurementData]:
+    """Retrieve all measurements of a shard, sorted by timestamp."""
+    if _worker.loop is None or _worker.client is None:
+        msg = "Harvest worker is not initialized"
+        raise LuchtmeetNetError(msg)
+    items = _worker.loop.run_until_complete(
+        _worker.client.get_all_measurements(
+            start=shard.start,
+            end=shard.end,
+            station_number=shard.station_number,
+            formula=shard.formula,
+        )
+    )
+    return sorted(items, key=_sort_key)
+
+
+def _sort_key(item: MeasurementData) -> tuple[str, str, str]:
+    """Get the key measurements are ordered by."""
+    return (item.timestamp_measured, item.station_number, item.formula)
+
+
+def merge(results: Iterable[list[MeasurementData]]) -> Iterator[MeasurementData]:
+    """Merge sorted shard results into one ordered stream without duplicates."""
+    previous = None
+    for item in heapq.merge(*results, key=_sort_key):
+        key = _sort_key(item)
+        if key != previous:
+            previous = key
+            yield item
+
+
+class Harvester:  # pylint: disable=too-few-public-methods
+    """Harvest measurements for many stations using a pool of worker processes.
+
+    Stations and the requested time range are partitioned into shards, which
+    are fetched by worker processes that each run their own client session.
+    The `rate_limit` is a global ceiling in requests per second, evenly
+    divided over the workers.
+    """
+
+    def __init__(  # pylint: disable=R0913, R0917  # noqa: PLR0913
+        self,
+        stations: Iterable[str],
+        start: datetime,
+        end: datetime,
+        formula: str | None = None,
+        chunk: timedelta = timedelta(days=7),
+        max_workers: int = 4,
+        rate_limit: float | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Initialize the harvester."""
+        self.shards = partition(stations, start, end, chunk, formula)
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        self.mp_context = mp_context
+
+    def run(self) -> list[MeasurementData]:
+        """Harvest all shards and return the merged, ordered measurements."""
+        worker_rate = None
+        if self.rate_limit is not None:
+            worker_rate = self.rate_limit / self.max_workers
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(worker_rate,),
+        ) as executor:
+            results = list(executor.map(_harvest_shard, self.shards))
+        return list(merge(results))
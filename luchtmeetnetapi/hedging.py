@@ -0,0 +1,61 @@
+"""Hedged requests for the Luchtmeetnet API."""
+
+from __future__ import annotations
+
+from collections import deque
+
+
+def endpoint_of(path: str) -> str:
+    """Get the endpoint of a path, with the identifiers left out.
+
+    For example `stations/NL01491/measurements` is an endpoint of
+    `stations/{}/measurements`.
+    """
+    return "/".join(
+        "{}" if index % 2 else part for index, part in enumerate(path.split("/"))
+    )
+
+
+class HedgePolicy:
+    """Send a second, hedged request when a request is slow.
+
+    A hedge is sent once a request has been running for `delay` seconds. When
+    no `delay` is set, the `quantile` of the latency observed for the
+    endpoint is used, once `min_samples` requests have completed. The first
+    response wins and the other request is cancelled. At most `max_share` of
+    all requests are hedges, so hedging cannot double the load on the API
+    when it slows down.
+    """
+
+    def __init__(  # pylint: disable=R0913, R0917
+        self,
+        delay: float | None = None,
+        quantile: float = 0.95,
+        max_share: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        """Initialize the policy."""
+        self.delay = delay
+        self.quantile = quantile
+        self.max_share = max_share
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies: dict[str, deque[float]] = {}
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Record the latency of a call to an endpoint."""
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+    def hedge_delay(self, endpoint: str) -> float | None:
+        """Get the seconds after which a request is hedged, None for never."""
+        if self.delay is not None:
+            return self.delay
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        return ordered[min(int(len(ordered) * self.quantile), len(ordered) - 1)]
@@ -0,0 +1,116 @@
+"""Interval-aware cache of measurements."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from .util import parse_timestamp
+
+if TYPE_CHECKING:
+    from .models import MeasurementData
+
+CacheKey = tuple[str, str]
+
+
+class _Entry:  # pylint: disable=too-few-public-methods
+    """Cached measurements of one station and formula."""
+
+    def __init__(self) -> None:
+        """Initialize the entry."""
+        self.intervals: list[tuple[datetime, datetime]] = []
+        self.rows: dict[datetime, MeasurementData] = {}
+        self.timestamps: list[datetime] = []
+
+    def add_interval(self, start: datetime, end: datetime) -> None:
+        """Add a covered interval, merging overlapping intervals."""
+        merged: list[tuple[datetime, datetime]] = []
+        for interval in sorted([*self.intervals, (start, end)]):
+            if merged and interval[0] <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], interval[1]))
+            else:
+                merged.append(interval)
+        self.intervals = merged
+
+
+class MeasurementIntervalCache:
+    """Cache measurements per station and formula with the time ranges they cover.
+
+    Queries are answered from the cached ranges, only the uncovered gaps need
+    to be fetched. Recent measurements may still be published or revised, so
+    only the time up to `settle_margin` ago is recorded as covered. At most
+    `max_rows` measurements are kept, the least recently used station and
+    formula is evicted first.
+    """
+
+    def __init__(
+        self, max_rows: int = 1_000_000, settle_margin: timedelta = timedelta(hours=2)
+    ) -> None:
+        """Initialize the cache."""
+        self.max_rows = max_rows
+        self.settle_margin = settle_margin
+        self.rows = 0
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+
+    def missing(
+        self, key: CacheKey, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Get the parts of a time range that are not cached."""
+        entry = self._entries.get(key)
+        intervals = [] if entry is None else entry.intervals
+        gaps = []
+        cursor = start
+        for interval_start, interval_end in intervals:
+            if interval_end < cursor:
+                continue
+            if interval_start > end:
+                break
+            if interval_start > cursor:
+                gaps.append((cursor, interval_start))
+            cursor = max(cursor, interval_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def add(
+        self,
+        key: CacheKey,
+        start: datetime,
+        end: datetime,
+        rows: list[MeasurementData],
+    ) -> None:
+        """Add the measurements retrieved for a time range."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry()
+        self._entries.move_to_end(key)
+        settled = min(end, datetime.now(UTC) - self.settle_margin)
+        if start < settled:
+            entry.add_interval(start, settled)
+        self.rows -= len(entry.rows)
+        for row in rows:
+            entry.rows[parse_timestamp(row.timestamp_measured)] = row
+        entry.timestamps = sorted(entry.rows)
+        self.rows += len(entry.rows)
+        while self.rows > self.max_rows and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.rows -= len(evicted.rows)
+
+    def get(
+        self, key: CacheKey, start: datetime, end: datetime
+    ) -> list[MeasurementData]:
+        """Get the cached measurements of a time range, ordered by timestamp."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return []
+        self._entries.move_to_end(key)
+        first = bisect_left(entry.timestamps, start)
+        last = bisect_right(entry.timestamps, end)
+        return [entry.rows[timestamp] for timestamp in entry.timestamps[first:last]]
+
+    def clear(self) -> None:
+        """Remove all cached measurements."""
+        self._entries.clear()
+        self.rows = 0
@@ -0,0 +1,200 @@
+"""Request limits for the Luchtmeetnet API."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+import heapq
+from itertools import count
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Priority(IntEnum):
+    """Priority class of requests, lower values are started first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+REQUEST_PRIORITY: ContextVar[Priority | None] = ContextVar(
+    "request_priority", default=None
+)
+# Requests of the same flow, like the pages of one pagination, share a queue.
+REQUEST_FLOW: ContextVar[object | None] = ContextVar("request_flow", default=None)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run all requests made within the context with the given priority."""
+    token = REQUEST_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        REQUEST_PRIORITY.reset(token)
+
+
+def _priority(priority: Priority | None) -> Priority:
+    """Get the priority of a request, defaulting to the priority of the context."""
+    if priority is None:
+        priority = REQUEST_PRIORITY.get()
+    if priority is None:
+        priority = Priority.INTERACTIVE
+    return priority
+
+
+class RateLimiter:  # pylint: disable=too-few-public-methods
+    """Limit the rate at which requests are started.
+
+    Requests are spaced evenly at `1 / rate` seconds apart.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the rate limiter with a maximum of `rate` requests per second."""
+        self.rate = rate
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the next request is allowed to start."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + 1 / self.rate
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit the number of concurrent requests, adapting the limit with AIMD.
+
+    While latency stays within `latency_tolerance` times the baseline latency,
+    the limit grows by one for every full limit of completed requests. When a
+    request is throttled, fails with a server error or times out, the limit
+    is multiplied by `backoff`.
+
+    Waiting requests are started by priority. Within a priority, flows of
+    requests take turns with start-time fair queueing, so one large flow does
+    not hold up others, and requests of a flow start in order of arrival.
+    Bulk requests leave `interactive_reserve` slots free, so interactive
+    requests can start without waiting for bulk requests.
+    """
+
+    def __init__(  # pylint: disable=R0913, R0917  # noqa: PLR0913
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+        interactive_reserve: int = 1,
+    ) -> None:
+        """Initialize the limiter."""
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.interactive_reserve = interactive_reserve
+        self.in_flight = 0
+        self.baseline_latency: float | None = None
+        self._waiters: list[
+            tuple[Priority, int, int, object | None, asyncio.Future[None]]
+        ] = []
+        self._order = count()
+        self._virtual_time = 0
+        self._flow_tags: dict[object | None, int] = {}
+
+    @property
+    def current_limit(self) -> int:
+        """Get the current number of allowed concurrent requests."""
+        return max(int(self.limit), self.min_limit)
+
+    def capacity(self, priority: Priority) -> int:
+        """Get the number of concurrent requests a priority may start."""
+        if priority == Priority.INTERACTIVE:
+            return self.current_limit
+        return max(self.current_limit - self.interactive_reserve, 1)
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait until a request is allowed to start.
+
+        Without a `priority`, the priority of the context is used, which is
+        interactive by default.
+        """
+        priority = _priority(priority)
+        if self.try_acquire(priority):
+            return
+        flow = REQUEST_FLOW.get()
+        tag = max(self._virtual_time, self._flow_tags.get(flow, 0)) + 1
+        self._flow_tags[flow] = tag
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, tag, next(self._order), flow, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.cancelled():
+                # The slot was handed over just before cancellation.
+                self.in_flight -= 1
+            # Cancelled waiters are skipped once they reach the front.
+            self._wake_up()
+            raise
+
+    def try_acquire(self, priority: Priority | None = None) -> bool:
+        """Start a request when that is allowed without waiting.
+
+        Returns whether the request was started.
+        """
+        priority = _priority(priority)
+        while self._waiters and self._waiters[0][4].done():
+            self._pop()
+        if self.in_flight < self.capacity(priority) and (
+            not self._waiters or self._waiters[0][0] > priority
+        ):
+            self.in_flight += 1
+            return True
+        return False
+
+    def release(self, latency: float | None = None, overloaded: bool = False) -> None:
+        """Release a request slot and adapt the limit to its outcome.
+
+        A `latency` of None means the request did not complete, for example
+        because it was cancelled, and does not change the limit.
+        """
+        self.in_flight -= 1
+        if overloaded:
+            self.limit = max(self.limit * self.backoff, float(self.min_limit))
+        elif latency is not None:
+            if self.baseline_latency is None or latency < self.baseline_latency:
+                self.baseline_latency = latency
+            else:
+                # Let the baseline follow slow upward drift of the latency.
+                self.baseline_latency += (latency - self.baseline_latency) * 0.01
+            if latency <= self.baseline_latency * self.latency_tolerance:
+                self.limit = min(self.limit + 1 / self.limit, float(self.max_limit))
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        """Start waiting requests by priority while there is room."""
+        while self._waiters:
+            priority, *_, waiter = self._waiters[0]
+            if waiter.done():
+                self._pop()
+            elif self.in_flight < self.capacity(priority):
+                self._pop()
+                self.in_flight += 1
+                waiter.set_result(None)
+            else:
+                break
+
+    def _pop(self) -> None:
+        """Remove the first waiter, advancing the virtual time of the queue."""
+        _, tag, _, flow, _ = heapq.heappop(self._waiters)
+        self._virtual_time = max(self._virtual_time, tag)
+        if self._flow_tags.get(flow, 0) <= self._virtual_time:
+            self._flow_tags.pop(flow, None)
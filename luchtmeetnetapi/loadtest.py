@@ -0,0 +1,334 @@
+"""Load test of the client against a local stand-in for the Luchtmeetnet API.
+
+Runs growing numbers of concurrent callers against a local server with a
+configurable response latency, and reports throughput, latency percentiles,
+event loop lag and memory for every step, for example::
+
+    python -m luchtmeetnetapi.loadtest --callers 10 100 1000 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import random
+import sys
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any, TypeVar
+
+from aiohttp import web
+import orjson
+
+from .client import LuchtmeetNetClient
+from .exceptions import LuchtmeetNetError
+from .hedging import endpoint_of
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Sequence
+
+T = TypeVar("T")
+
+LAG_INTERVAL = 0.01
+# Memory use of the process in pages, on Linux.
+STATM_PATH = Path("/proc/self/statm")
+STATION_NUMBER = "NL01491"
+
+_PAGINATION = {
+    "current_page": 1,
+    "next_page": 1,
+    "prev_page": 1,
+    "page_list": [1],
+    "first_page": 1,
+    "last_page": 1,
+}
+# Response bodies of the stand-in server by endpoint.
+BODIES = {
+    "stations/{}": orjson.dumps(
+        {
+            "data": {
+                "type": "Regional",
+                "components": ["NO2", "PM10"],
+                "geometry": {"type": "point", "coordinates": [4.4307, 51.93858]},
+                "municipality": "Rotterdam",
+                "url": "",
+                "province": "Zuid-Holland",
+                "organisation": "DCMR",
+                "location": "Rotterdam",
+                "year_start": "2000",
+                "description": {"EN": "", "NL": ""},
+            }
+        }
+    ),
+    "lki": orjson.dumps(
+        {
+            "pagination": _PAGINATION,
+            "data": [
+                {
+                    "station_number": STATION_NUMBER,
+                    "value": hour % 10 + 1,
+                    "timestamp_measured": f"2024-10-19T{hour:02}:00:00+00:00",
+                    "formula": "LKI",
+                }
+                for hour in range(24)
+            ],
+        }
+    ),
+}
+
+# Calls made by the simulated callers.
+OPERATIONS: dict[str, Callable[[LuchtmeetNetClient], Coroutine[Any, Any, Any]]] = {
+    "lki": lambda client: client.get_lki(station_number=STATION_NUMBER),
+    "station": lambda client: client.get_station(STATION_NUMBER),
+}
+
+
+@dataclass
+class LoadTestResult:  # pylint: disable=too-many-instance-attributes
+    """Outcome of one load test step."""
+
+    callers: int
+    requests: int
+    errors: int
+    throughput: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    loop_lag_p99: float
+    loop_lag_max: float
+    max_rss: float | None
+    concurrency_limit: int
+
+
+class StandInServer:
+    """Local server answering API requests after `latency` seconds.
+
+    Latencies are drawn uniformly between `latency - jitter` and
+    `latency + jitter` seconds. The server runs an event loop of its own in
+    a separate thread, so the work of serving does not show up as latency
+    or event loop lag of the client under test.
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0) -> None:
+        """Initialize the server."""
+        self.latency = latency
+        self.jitter = jitter
+        self.url: str | None = None
+        self._runner: web.AppRunner | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Answer a request with the body of its endpoint."""
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)  # noqa: S311
+        await asyncio.sleep(max(delay, 0))
+        body = BODIES.get(endpoint_of(request.match_info["path"]))
+        if body is None:
+            return web.Response(status=404)
+        return web.Response(body=body, content_type="application/json")
+
+    async def start(self) -> str:
+        """Start the server on a free local port, returning its URL."""
+        loop = self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=loop.run_forever, name="stand-in-server", daemon=True
+        )
+        self._thread.start()
+        self.url = await _run_on(loop, self._serve())
+        return self.url
+
+    async def _serve(self) -> str:
+        """Serve the API on the loop of the server."""
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        """Stop the server and its thread."""
+        if self._loop is None or self._thread is None or self._runner is None:
+            return
+        await _run_on(self._loop, self._runner.cleanup())
+        self._runner = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        await asyncio.to_thread(self._thread.join)
+        self._loop.close()
+        self._loop = self._thread = None
+
+
+async def _run_on(
+    loop: asyncio.AbstractEventLoop, coroutine: Coroutine[Any, Any, T]
+) -> T:
+    """Run a coroutine on the loop of another thread and wait for its result."""
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+
+def _percentile(ordered: Sequence[float], quantile: float) -> float:
+    """Get a percentile of sorted values, 0 when there are none."""
+    if not ordered:
+        return 0.0
+    return ordered[min(int(len(ordered) * quantile), len(ordered) - 1)]
+
+
+def _rss() -> float | None:
+    """Get the current resident memory of the process in MiB, where supported."""
+    try:
+        with STATM_PATH.open(encoding="ascii") as statm:
+            pages = int(statm.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+async def _monitor(lags: list[float], rss: list[float]) -> None:
+    """Record event loop lag and resident memory, until cancelled.
+
+    Lag is how late the event loop wakes up a sleeping task.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append(loop.time() - started - LAG_INTERVAL)
+        if (current := _rss()) is not None:
+            rss.append(current)
+
+
+async def run_step(
+    client: LuchtmeetNetClient, callers: int, duration: float, operation: str
+) -> LoadTestResult:
+    """Let `callers` concurrent callers call the client for `duration` seconds."""
+    call = OPERATIONS[operation]
+    latencies: list[float] = []
+    lags: list[float] = []
+    rss: list[float] = []
+    errors = 0
+    loop = asyncio.get_running_loop()
+    stop = loop.time() + duration
+
+    async def caller() -> None:
+        nonlocal errors
+        while loop.time() < stop:
+            started = time.perf_counter()
+            try:
+                await call(client)
+            except LuchtmeetNetError:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - started)
+
+    monitor = asyncio.create_task(_monitor(lags, rss))
+    started = loop.time()
+    try:
+        await asyncio.gather(*(caller() for _ in range(callers)))
+    finally:
+        monitor.cancel()
+    elapsed = loop.time() - started
+    latencies.sort()
+    lags.sort()
+    return LoadTestResult(
+        callers=callers,
+        requests=len(latencies) + errors,
+        errors=errors,
+        throughput=len(latencies) / elapsed,
+        latency_p50=_percentile(latencies, 0.5),
+        latency_p95=_percentile(latencies, 0.95),
+        latency_p99=_percentile(latencies, 0.99),
+        loop_lag_p99=_percentile(lags, 0.99),
+        loop_lag_max=lags[-1] if lags else 0.0,
+        max_rss=max(rss, default=_rss()),
+        concurrency_limit=client.stats.concurrency_limit,
+    )
+
+
+async def run_load_test(  # pylint: disable=R0913, R0917  # noqa: PLR0913
+    callers: Sequence[int],
+    duration: float = 5.0,
+    latency: float = 0.05,
+    jitter: float = 0.0,
+    operation: str = "lki",
+    client: LuchtmeetNetClient | None = None,
+) -> list[LoadTestResult]:
+    """Run a step for every number of callers against a stand-in server.
+
+    All steps share one client, like a long running service does, so the
+    adaptive concurrency limit carries over from step to step.
+    """
+    server = StandInServer(latency, jitter)
+    url = await server.start()
+    owned = client is None
+    if client is None:
+        client = LuchtmeetNetClient()
+    client.endpoint = url
+    try:
+        return [await run_step(client, count, duration, operation) for count in callers]
+    finally:
+        if owned:
+            await client.close()
+        await server.stop()
+
+
+def format_results(results: Sequence[LoadTestResult]) -> str:
+    """Format results as a table, with latencies in milliseconds."""
+    lines = [
+        f"{'callers':>8} {'requests':>9} {'errors':>7} {'req/s':>9} "
+        f"{'p50':>8} {'p95':>8} {'p99':>8} {'lag p99':>8} {'lag max':>8} "
+        f"{'rss MiB':>8} {'limit':>6}"
+    ]
+    lines.extend(
+        f"{result.callers:>8} {result.requests:>9} {result.errors:>7} "
+        f"{result.throughput:>9.1f} {result.latency_p50 * 1000:>8.1f} "
+        f"{result.latency_p95 * 1000:>8.1f} {result.latency_p99 * 1000:>8.1f} "
+        f"{result.loop_lag_p99 * 1000:>8.1f} {result.loop_lag_max * 1000:>8.1f} "
+        f"{'-' if result.max_rss is None else f'{result.max_rss:.1f}':>8} "
+        f"{result.concurrency_limit:>6}"
+        for result in results
+    )
+    return "\n".join(lines)
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m luchtmeetnetapi.loadtest",
+        description="Load test the client against a local stand-in server.",
+    )
+    parser.add_argument(
+        "--callers",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 1000],
+        help="numbers of concurrent callers, one step each",
+    )
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per step")
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="server latency in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="server latency jitter in seconds"
+    )
+    parser.add_argument("--operation", choices=sorted(OPERATIONS), default="lki")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None, stream: IO[str] | None = None) -> int:
+    """Run the load test and print the results."""
+    args = _parser().parse_args(argv)
+    results = asyncio.run(
+        run_load_test(
+            args.callers, args.duration, args.latency, args.jitter, args.operation
+        )
+    )
+    (stream or sys.stdout).write(format_results(results) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Bounded cache of decoded models."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import time
+from typing import Any
+
+
+@dataclass
+class ModelCacheStats:
+    """Statistics of a model cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ModelCache:
+    """Least recently used cache of decoded models, like stations and components.
+
+    The cache holds at most `max_entries` models and, when given, models of at
+    most `max_bytes` in total, where the size of a model is approximated by
+    the size of the response it was decoded from. Models expire `ttl` seconds
+    after they are added. Cached models are shared, so they should not be
+    modified.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        ttl: float | None = 60 * 60,
+    ) -> None:
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.bytes = 0
+        self.stats = ModelCacheStats()
+        self._entries: OrderedDict[str, tuple[Any, int, float | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached models."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached model, or None when it is not cached or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: Any, size: int = 0) -> None:
+        """Add a model of approximately `size` bytes to the cache."""
+        if key in self._entries:
+            self._remove(key)
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (value, size, expires)
+        self.bytes += size
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None
+            and self.bytes > self.max_bytes
+            and len(self._entries) > 1
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Remove a model from the cache, or all models when no key is given."""
+        if key is None:
+            self._entries.clear()
+            self.bytes = 0
+        elif key in self._entries:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry."""
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
@@ -0,0 +1,22 @@
+"""Polling of reference data, skipping unchanged pages."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class PollResult(Generic[T]):
+    """Result of a poll, with whether it changed since the previous poll."""
+
+    data: list[T]
+    changed: bool
+
+
+def content_digest(text: str) -> bytes:
+    """Get the digest of a response body."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
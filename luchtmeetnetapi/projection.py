@@ -0,0 +1,64 @@
+"""Decoding of selected fields, skipping the full models."""
+
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from .models import PagedResult, Pagination
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+MEASUREMENT_FIELDS = ("station_number", "formula", "value", "timestamp_measured")
+
+
+def _field_getter(field: str) -> Callable[[dict[str, Any]], Any]:
+    """Get a getter for a field, nested fields are separated by dots."""
+    keys = field.split(".")
+    if len(keys) == 1:
+        return itemgetter(field)
+
+    def get_nested(row: dict[str, Any]) -> Any:
+        value: Any = row
+        for key in keys:
+            value = value[key]
+        return value
+
+    return get_nested
+
+
+def project(
+    rows: list[dict[str, Any]],
+    fields: Sequence[str],
+    row_type: Callable[..., Any] | None = None,
+) -> list[Any]:
+    """Extract the given fields of decoded JSON rows into tuples.
+
+    When a `row_type`, like a NamedTuple, is given, it is called with the
+    field values instead.
+    """
+    if all("." not in field for field in fields) and len(fields) > 1:
+        getter = itemgetter(*fields)
+        values = [getter(row) for row in rows]
+    else:
+        getters = [_field_getter(field) for field in fields]
+        values = [tuple(get(row) for get in getters) for row in rows]
+    if row_type is None:
+        return values
+    return [row_type(*value) for value in values]
+
+
+def decode_page(
+    text: str,
+    fields: Sequence[str],
+    row_type: Callable[..., Any] | None = None,
+) -> PagedResult[Any]:
+    """Decode a page, extracting only the given fields of its rows."""
+    page = orjson.loads(text)
+    return PagedResult(
+        Pagination.from_dict(page["pagination"]),
+        project(page["data"], fields, row_type),
+    )
@@ -3,17 +3,39 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 import socket
+import time
 from typing import TYPE_CHECKING, Mapping
 
 from aiohttp import ClientError, ClientResponseError, ClientSession
 
-from .const import ENDPOINT
-from .exceptions import LuchtmeetNetConnectionError
+from .const import ENDPOINT, RESPONSE_CACHE_TTLS
+from .deadline import CURRENT_DEADLINE, Deadline, deadline
+from .exceptions import LuchtmeetNetConnectionError, LuchtmeetNetDeadlineError
+from .hedging import HedgePolicy, endpoint_of
+from .limits import AdaptiveConcurrencyLimiter, RateLimiter
+from .transport import AiohttpTransport, Transport, TransportResponse
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
     from typing_extensions import Self
 
+    from .cache_backend import CacheBackend
+
+
+@dataclass
+class RequestStats:
+    """Request statistics."""
+
+    requests: int = 0
+    errors: int = 0
+    concurrency_limit: int = 0
+    cache_hits: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
 
 class HttpRequestClient:
     """Request Client for the LuchtmeetNet API."""
@@ -21,23 +43,205 @@ class HttpRequestClient:
     endpoint = ENDPOINT
     session: ClientSession | None = None
     request_timeout: int = 10
+    rate_limit: float | None = None
+    transport: Transport | None = None
+    response_cache: CacheBackend | None = None
+    response_cache_ttls: Mapping[str, float] = RESPONSE_CACHE_TTLS
+    hedge_policy: HedgePolicy | None = None
+    _rate_limiter: RateLimiter | None = None
+
+    def __init__(self) -> None:
+        """Initialize the request client."""
+        self.stats = RequestStats()
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter()
+        self.stats.concurrency_limit = self.concurrency_limiter.current_limit
+
+    def deadline(
+        self, seconds: float, partial: bool = False
+    ) -> AbstractContextManager[Deadline]:
+        """Limit all requests made within the context to `seconds` in total.
+
+        Requests still running when the deadline passes are cancelled, and a
+        LuchtmeetNetDeadlineError is raised. With `partial`, paginated calls
+        return the items retrieved so far instead, see `Deadline`.
+        """
+        return deadline(seconds, partial)
 
     async def _make_request(
         self, path: str, params: dict[str, str | None] | None = None
     ) -> str:
-        """Make request to api and return response."""
-        if self.session is None:
-            self.session = ClientSession()
+        """Make request to api and return response, within the deadline if set."""
+        current = CURRENT_DEADLINE.get()
+        if current is None:
+            return await self._request(path, params)
+        msg = "Deadline exceeded while communicating with luchtmeetnet.nl"
+        if current.remaining <= 0:
+            raise LuchtmeetNetDeadlineError(msg)
+        try:
+            async with asyncio.timeout_at(current.when):
+                return await self._request(path, params)
+        except TimeoutError as exception:
+            raise LuchtmeetNetDeadlineError(msg) from exception
+
+    async def _request(
+        self, path: str, params: dict[str, str | None] | None = None
+    ) -> str:
+        """Make request to api and return response.
 
+        When a `response_cache` is set, successful responses are cached for
+        the time to live of their resource in `response_cache_ttls`. When a
+        `hedge_policy` is set, slow requests are hedged.
+        """
         get_params: Mapping[str, str] | None = None
         if params is not None:
             get_params = {k: v for k, v in params.items() if v is not None}
 
+        cache = self.response_cache
+        ttl = None if cache is None else self._cache_ttl(path)
+        cache_key = (
+            path
+            + "?"
+            + "&".join(f"{k}={v}" for k, v in sorted((get_params or {}).items()))
+        )
+        if cache is not None and ttl is not None:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+
+        if self.rate_limit is not None:
+            if self._rate_limiter is None or self._rate_limiter.rate != self.rate_limit:
+                self._rate_limiter = RateLimiter(self.rate_limit)
+            await self._rate_limiter.acquire()
+
+        limiter = self.concurrency_limiter
+        await limiter.acquire()
+        started = time.monotonic()
+        latency: float | None = None
+        overloaded = False
+        try:
+            if self.hedge_policy is None:
+                response = await self._get(path, get_params)
+            else:
+                response = await self._get_hedged(self.hedge_policy, path, get_params)
+        except LuchtmeetNetConnectionError:
+            overloaded = True
+            raise
+        else:
+            latency = time.monotonic() - started
+            overloaded = response.status == 429 or response.status >= 500
+        finally:
+            limiter.release(latency, overloaded)
+            self.stats.concurrency_limit = limiter.current_limit
+
+        if response.status != 200:
+            self.stats.errors += 1
+            msg = "Unexpected response from luchtmeetnet.nl"
+            raise LuchtmeetNetConnectionError(
+                msg,
+                {"Content-Type": response.content_type, "response": response.text},
+            )
+
+        if cache is not None and ttl is not None:
+            await cache.set(cache_key, response.text, ttl)
+        return response.text
+
+    def _cache_ttl(self, path: str) -> float | None:
+        """Get the time to live of responses of a path, None when not cached.
+
+        Nested resources like the measurements of a station use the time to
+        live of the nested resource.
+        """
+        parts = path.split("/")
+        ttl = self.response_cache_ttls.get(parts[-1])
+        if ttl is None:
+            ttl = self.response_cache_ttls.get(parts[0])
+        return ttl
+
+    async def _get_hedged(
+        self, policy: HedgePolicy, path: str, params: Mapping[str, str] | None
+    ) -> TransportResponse:
+        """Get a path, sending a hedged request when the first one is slow.
+
+        The latency recorded for the policy is the latency the caller sees,
+        from sending the first request until a response wins. Recording only
+        the requests that complete would leave out the slow requests that
+        lost to their hedge, and make the hedge delay shrink.
+        """
+        endpoint = endpoint_of(path)
+        started = time.monotonic()
+        response = await self._get_first(
+            policy, policy.hedge_delay(endpoint), path, params
+        )
+        policy.record(endpoint, time.monotonic() - started)
+        return response
+
+    async def _get_first(
+        self,
+        policy: HedgePolicy,
+        delay: float | None,
+        path: str,
+        params: Mapping[str, str] | None,
+    ) -> TransportResponse:
+        """Get the first response to a path, hedging after `delay` seconds.
+
+        The hedge takes its own concurrency slot, and is only sent when a slot
+        is free and the share of hedges stays within the policy.
+        """
+        primary = asyncio.create_task(self._get(path, params))
+        hedge: asyncio.Task[TransportResponse] | None = None
+        limiter = self.concurrency_limiter
+        try:
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if (
+                done
+                or self.stats.hedges >= policy.max_share * self.stats.requests
+                or not limiter.try_acquire()
+            ):
+                return await primary
+
+            self.stats.hedges += 1
+            hedge = asyncio.create_task(self._get(path, params))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+            # Both requests failed, report the error of the first one.
+            return primary.result()
+        finally:
+            losers = [task for task in (primary, hedge) if task and not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.wait(losers)
+            if hedge is not None:
+                limiter.release()
+
+    async def _get(
+        self, path: str, params: Mapping[str, str] | None
+    ) -> TransportResponse:
+        """Get a path using the configured transport."""
+        transport = self.transport
+        if transport is None:
+            if self.session is None:
+                self.session = ClientSession()
+            transport = AiohttpTransport(self.session)
+
+        self.stats.requests += 1
         try:
             async with asyncio.timeout(self.request_timeout):
                 url = f"{self.endpoint}/{path}"
-                response = await self.session.get(url, params=get_params)
+                response = await transport.get(url, params)
         except TimeoutError as exception:
+            self.stats.errors += 1
             msg = "Timeout occurred while connecting to luchtmeetnet.nl"
             raise LuchtmeetNetConnectionError(msg) from exception
         except (
@@ -45,22 +249,18 @@ class HttpRequestClient:
             ClientResponseError,
             socket.gaierror,
         ) as exception:
+            self.stats.errors += 1
             msg = "Error occurred while communicating with luchtmeetnet.nl"
             raise LuchtmeetNetConnectionError(msg) from exception
 
-        if response.status != 200:
-            content_type = response.headers.get("Content-Type", "")
-            text = await response.text()
-            msg = "Unexpected response from luchtmeetnet.nl"
-            raise LuchtmeetNetConnectionError(
-                msg,
-                {"Content-Type": content_type, "response": text},
-            )
-
-        return await response.text()
+        return response
 
     async def close(self) -> None:
-        """Close the session."""
+        """Close the session, transport and response cache."""
+        if self.response_cache is not None:
+            await self.response_cache.close()
+        if self.transport is not None:
+            await self.transport.close()
         if self.session is not None:
             await self.session.close()
             self.session = None
@@ -0,0 +1,197 @@
+"""Snapshot of the latest values of the whole measurement network."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import sys
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import orjson
+
+from .util import parse_timestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+# Fields of the rows a snapshot is built from.
+LKI_FIELDS = ("station_number", "value", "timestamp_measured")
+
+# Arrays of a snapshot in serialization order, with their type codes and
+# whether they have an item per cell or per station.
+_ARRAYS = (
+    ("readings", "d", True),
+    ("timestamps", "q", True),
+    ("mask", "B", True),
+    ("lki", "d", False),
+    ("lki_timestamps", "q", False),
+    ("lki_mask", "B", False),
+)
+
+
+@dataclass
+class NetworkSnapshot:  # pylint: disable=too-many-instance-attributes
+    """Latest value of every component at every station, and their LKI.
+
+    Readings form a dense matrix of stations by formulas, stored row by row in
+    flat arrays, with the measurement time as POSIX timestamp. A mask of 1
+    marks the cells that have a value. Stations and formulas are mapped to
+    their row and column by `station_index` and `formula_index`, so reading
+    a cell takes constant time.
+    """
+
+    stations: list[str]
+    formulas: list[str]
+    readings: array[float]
+    timestamps: array[int]
+    mask: array[int]
+    lki: array[float]
+    lki_timestamps: array[int]
+    lki_mask: array[int]
+
+    def __post_init__(self) -> None:
+        """Index the stations and formulas."""
+        self.station_index = {number: row for row, number in enumerate(self.stations)}
+        self.formula_index = {
+            formula: column for column, formula in enumerate(self.formulas)
+        }
+
+    def _cell(self, station_number: str, formula: str) -> int | None:
+        """Get the position of a cell that has a value."""
+        row = self.station_index.get(station_number)
+        column = self.formula_index.get(formula)
+        if row is None or column is None:
+            return None
+        cell = row * len(self.formulas) + column
+        return cell if self.mask[cell] else None
+
+    def value(self, station_number: str, formula: str) -> float | None:
+        """Get the latest value of a component at a station."""
+        cell = self._cell(station_number, formula)
+        return None if cell is None else self.readings[cell]
+
+    def timestamp(self, station_number: str, formula: str) -> datetime | None:
+        """Get the time the latest value of a component at a station was measured."""
+        cell = self._cell(station_number, formula)
+        return None if cell is None else _datetime(self.timestamps[cell])
+
+    def station(self, station_number: str) -> dict[str, float]:
+        """Get the latest value of every component measured at a station."""
+        row = self.station_index.get(station_number)
+        if row is None:
+            return {}
+        start = row * len(self.formulas)
+        return {
+            formula: self.readings[start + column]
+            for column, formula in enumerate(self.formulas)
+            if self.mask[start + column]
+        }
+
+    def station_lki(self, station_number: str) -> tuple[float, datetime] | None:
+        """Get the latest LKI of a station and the time it was measured."""
+        row = self.station_index.get(station_number)
+        if row is None or not self.lki_mask[row]:
+            return None
+        return self.lki[row], _datetime(self.lki_timestamps[row])
+
+    def to_bytes(self) -> bytes:
+        """Serialize the snapshot, storing the arrays as they are in memory."""
+        header = orjson.dumps(
+            {
+                "stations": self.stations,
+                "formulas": self.formulas,
+                "byteorder": sys.byteorder,
+            }
+        )
+        return b"".join(
+            [
+                len(header).to_bytes(4, "little"),
+                header,
+                *(getattr(self, name).tobytes() for name, _, _ in _ARRAYS),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> NetworkSnapshot:
+        """Deserialize a snapshot serialized with `to_bytes`."""
+        header_end = 4 + int.from_bytes(data[:4], "little")
+        header = orjson.loads(data[4:header_end])
+        rows = len(header["stations"])
+        cells = rows * len(header["formulas"])
+        arrays: dict[str, Any] = {}
+        offset = header_end
+        for name, typecode, per_cell in _ARRAYS:
+            values = array(typecode)
+            end = offset + (cells if per_cell else rows) * values.itemsize
+            values.frombytes(data[offset:end])
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+            arrays[name] = values
+            offset = end
+        return cls(header["stations"], header["formulas"], **arrays)
+
+
+def build_snapshot(
+    stations: Sequence[str],
+    measurements: Iterable[tuple[str, str, float, str]],
+    lki: Iterable[tuple[str, float, str]],
+) -> NetworkSnapshot:
+    """Build a snapshot of the latest measurement and LKI rows.
+
+    Measurement rows are `(station_number, formula, value, timestamp)` and
+    LKI rows `(station_number, value, timestamp)` tuples. Stations that are
+    not in `stations` are added after them.
+    """
+    latest = _latest(
+        ((station_number, formula), value, timestamp)
+        for station_number, formula, value, timestamp in measurements
+    )
+    latest_lki = _latest(lki)
+
+    numbers = list(dict.fromkeys([*stations, *(key[0] for key in latest), *latest_lki]))
+    formulas = sorted({formula for _, formula in latest})
+    cells = len(numbers) * len(formulas)
+    snapshot = NetworkSnapshot(
+        numbers,
+        formulas,
+        array("d", [0.0]) * cells,
+        array("q", [0]) * cells,
+        array("B", [0]) * cells,
+        array("d", [0.0]) * len(numbers),
+        array("q", [0]) * len(numbers),
+        array("B", [0]) * len(numbers),
+    )
+    for (station_number, formula), (measured, value) in latest.items():
+        cell = (
+            snapshot.station_index[station_number] * len(formulas)
+            + snapshot.formula_index[formula]
+        )
+        snapshot.readings[cell] = value
+        snapshot.timestamps[cell] = measured
+        snapshot.mask[cell] = 1
+    for station_number, (measured, value) in latest_lki.items():
+        row = snapshot.station_index[station_number]
+        snapshot.lki[row] = value
+        snapshot.lki_timestamps[row] = measured
+        snapshot.lki_mask[row] = 1
+    return snapshot
+
+
+K = TypeVar("K")
+
+
+def _latest(rows: Iterable[tuple[K, float, str]]) -> dict[K, tuple[int, float]]:
+    """Get the POSIX timestamp and value of the latest row by key."""
+    latest: dict[K, tuple[int, float]] = {}
+    for key, value, timestamp in rows:
+        measured = int(parse_timestamp(timestamp).timestamp())
+        current = latest.get(key)
+        if current is None or measured > current[0]:
+            latest[key] = (measured, value)
+    return latest
+
+
+def _datetime(timestamp: int) -> datetime:
+    """Get the datetime of a POSIX timestamp."""
+    return datetime.fromtimestamp(timestamp, UTC)
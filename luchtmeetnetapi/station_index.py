@@ -0,0 +1,140 @@
+"""In-memory index of station locations and components."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING
+
+from .grid import StationGrid
+from .util import get_approximate_distance
+
+if TYPE_CHECKING:
+    from .client import LuchtmeetNetClient
+
+
+@dataclass(frozen=True)
+class IndexedStation:
+    """Location and components of a station."""
+
+    number: str
+    coordinate: tuple[float, float]
+    components: frozenset[str]
+
+
+class StationIndex:
+    """Index of all stations with their coordinates and measured components.
+
+    All stations are fetched concurrently in one warm up, after which
+    nearest station queries are answered from memory. Call `ensure_fresh` to
+    refresh the index once it is older than `refresh_interval` seconds.
+    """
+
+    def __init__(
+        self, client: LuchtmeetNetClient, refresh_interval: float = 24 * 60 * 60
+    ) -> None:
+        """Initialize the index."""
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.updated: float | None = None
+        self.stations: dict[str, IndexedStation] = {}
+        self._by_formula: dict[str, list[IndexedStation]] = {}
+        self._grids: dict[str | None, StationGrid] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def expired(self) -> bool:
+        """Return whether the index needs to be refreshed."""
+        return (
+            self.updated is None
+            or time.monotonic() - self.updated >= self.refresh_interval
+        )
+
+    async def refresh(self) -> None:
+        """Fetch all stations and their details."""
+        stations = await self.client.get_all_stations()
+        details = await asyncio.gather(
+            *(self.client.get_station(station.number) for station in stations)
+        )
+        self.stations = {}
+        self._by_formula = {}
+        self._grids = {}
+        for station, detail in zip(stations, details, strict=True):
+            coordinates = detail.data.geometry.coordinates
+            indexed = IndexedStation(
+                station.number,
+                (coordinates[0], coordinates[1]),
+                frozenset(detail.data.components),
+            )
+            self.stations[station.number] = indexed
+            for formula in indexed.components:
+                self._by_formula.setdefault(formula, []).append(indexed)
+        self.updated = time.monotonic()
+
+    async def ensure_fresh(self) -> None:
+        """Refresh the index when it is expired."""
+        async with self._lock:
+            if self.expired:
+                await self.refresh()
+
+    def measuring(self, formula: str) -> list[str]:
+        """Get the numbers of the stations measuring a component."""
+        return [station.number for station in self._by_formula.get(formula, [])]
+
+    async def grid(self, formula: str | None = None) -> StationGrid:
+        """Get the lookup grid of the stations measuring a component.
+
+        Grids are built in a thread on first use, and kept until the index is
+        refreshed.
+        """
+        grid = self._grids.get(formula)
+        if grid is None:
+            stations = (
+                self.stations.values()
+                if formula is None
+                else self._by_formula.get(formula, [])
+            )
+            grid = await asyncio.to_thread(
+                StationGrid,
+                {station.number: station.coordinate for station in stations},
+            )
+            self._grids[formula] = grid
+        return grid
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        formula: str | None = None,
+        max_distance: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Get stations ordered by distance in km, nearest first.
+
+        Only stations measuring `formula` and within `max_distance` km are
+        included when given.
+        """
+        candidates = (
+            self.stations.values()
+            if formula is None
+            else self._by_formula.get(formula, [])
+        )
+        coord = (longitude, latitude)
+        distances = [
+            (station.number, get_approximate_distance(coord, station.coordinate))
+            for station in candidates
+        ]
+        if max_distance is not None:
+            distances = [item for item in distances if item[1] <= max_distance]
+        return sorted(distances, key=lambda item: item[1])
+
+    def closest(
+        self,
+        latitude: float,
+        longitude: float,
+        formula: str | None = None,
+        max_distance: float | None = None,
+    ) -> str | None:
+        """Get the closest station, see `nearest`."""
+        stations = self.nearest(latitude, longitude, formula, max_distance)
+        return stations[0][0] if stations else None
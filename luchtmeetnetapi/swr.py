@@ -0,0 +1,129 @@
+"""Stale-while-revalidate serving of latest values."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .deadline import CURRENT_DEADLINE
+from .exceptions import LuchtmeetNetDeadlineError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+T = TypeVar("T")
+
+
+@dataclass
+class StaleCacheStats:
+    """Statistics of a stale-while-revalidate cache."""
+
+    fresh_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+
+class StaleWhileRevalidateCache:
+    """Serve cached values at once, refreshing stale ones in the background.
+
+    Values younger than `fresh_for` seconds are returned as they are. Older
+    values are returned as well while younger than `max_stale` seconds, and a
+    single background request refreshes them, no matter how many callers ask
+    for them meanwhile. Only missing values and values older than `max_stale`
+    are waited for, sharing one request between all callers. A failed
+    background refresh keeps the stale value. At most `max_entries` values
+    are kept, the least recently refreshed ones are removed first.
+    """
+
+    def __init__(
+        self,
+        fresh_for: float = 60,
+        max_stale: float = 15 * 60,
+        max_entries: int = 1024,
+    ) -> None:
+        """Initialize the cache."""
+        self.fresh_for = fresh_for
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self.stats = StaleCacheStats()
+        self._entries: dict[str, tuple[Any, float]] = {}
+        self._refreshes: dict[str, asyncio.Task[Any]] = {}
+
+    async def get(self, key: str, fetch: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Get a value, using `fetch` to retrieve it when it is missing or stale."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, fetched = entry
+            age = time.monotonic() - fetched
+            if age < self.fresh_for:
+                self.stats.fresh_hits += 1
+                return value
+            if age < self.max_stale:
+                self.stats.stale_hits += 1
+                self._refresh(key, fetch)
+                return value
+        self.stats.misses += 1
+        # A cancelled caller must not cancel the request other callers wait for.
+        refresh = asyncio.shield(self._refresh(key, fetch))
+        current = CURRENT_DEADLINE.get()
+        if current is None:
+            return await refresh
+        # The refresh is not bound to the deadline, but the caller still is.
+        try:
+            async with asyncio.timeout_at(current.when):
+                return await refresh
+        except TimeoutError as exception:
+            msg = "Deadline exceeded while communicating with luchtmeetnet.nl"
+            raise LuchtmeetNetDeadlineError(msg) from exception
+
+    def _refresh(
+        self, key: str, fetch: Callable[[], Coroutine[Any, Any, T]]
+    ) -> asyncio.Task[T]:
+        """Start refreshing a value, unless it is already being refreshed.
+
+        The refresh runs in a context of its own, so it is not bound to the
+        deadline or priority of the caller that happened to start it.
+        """
+        task = self._refreshes.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._fetch(key, fetch), context=contextvars.Context()
+            )
+            self._refreshes[key] = task
+            task.add_done_callback(lambda task: self._refreshed(key, task))
+        return task
+
+    async def _fetch(self, key: str, fetch: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Fetch a value and store it."""
+        value = await fetch()
+        self._entries.pop(key, None)
+        self._entries[key] = (value, time.monotonic())
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self.stats.refreshes += 1
+        return value
+
+    def _refreshed(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Finish a refresh, retrieving its error so it is never left unhandled."""
+        if self._refreshes.get(key) is task:
+            del self._refreshes[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.stats.refresh_errors += 1
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Remove a value, or all values when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def close(self) -> None:
+        """Cancel all running refreshes."""
+        for task in self._refreshes.values():
+            task.cancel()
+        self._refreshes.clear()
@@ -0,0 +1,140 @@
+"""Synchronous client for Luchtmeetnet.nl."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import wraps
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Concatenate,
+    Coroutine,
+    ParamSpec,
+    TypeVar,
+)
+
+from .client import LuchtmeetNetClient
+from .exceptions import LuchtmeetNetError
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def _blocking(
+    method: Callable[Concatenate[LuchtmeetNetClient, P], Coroutine[Any, Any, T]],
+) -> Callable[Concatenate[LuchtmeetNetSyncClient, P], T]:
+    """Create a blocking version of an async client method."""
+
+    @wraps(method)
+    def wrapper(self: LuchtmeetNetSyncClient, *args: P.args, **kwargs: P.kwargs) -> T:
+        return self.run(getattr(self.client, method.__name__)(*args, **kwargs))
+
+    return wrapper
+
+
+class LuchtmeetNetSyncClient:
+    """Blocking client for LuchtmeetNetApi.
+
+    All calls are executed on a single background event loop thread, which
+    keeps one pooled session for every caller. Methods can be called from
+    multiple threads at once. The client state is bound to that loop, so the
+    client cannot be used anymore once it is closed.
+    """
+
+    def __init__(self, client: LuchtmeetNetClient | None = None) -> None:
+        """Initialize the sync client."""
+        self.client = client if client is not None else LuchtmeetNetClient()
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting it when needed."""
+        with self._lock:
+            if self._closed:
+                msg = "The client is closed"
+                raise LuchtmeetNetError(msg)
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="luchtmeetnet-event-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background event loop and wait for the result."""
+        try:
+            loop = self._get_loop()
+        except LuchtmeetNetError:
+            coro.close()
+            raise
+        if threading.current_thread() is self._thread:
+            coro.close()
+            msg = "Blocking calls are not allowed from the client event loop"
+            raise LuchtmeetNetError(msg)
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """Close the session and stop the background event loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            self._closed = True
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.client.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def __enter__(self) -> Self:
+        """Enter."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Exit."""
+        self.close()
+
+    get_component = _blocking(LuchtmeetNetClient.get_component)
+    get_components = _blocking(LuchtmeetNetClient.get_components)
+    get_organisations = _blocking(LuchtmeetNetClient.get_organisations)
+    get_stations = _blocking(LuchtmeetNetClient.get_stations)
+    get_station = _blocking(LuchtmeetNetClient.get_station)
+    get_station_measurements = _blocking(LuchtmeetNetClient.get_station_measurements)
+    get_measurements = _blocking(LuchtmeetNetClient.get_measurements)
+    get_lki = _blocking(LuchtmeetNetClient.get_lki)
+    get_concentrations = _blocking(LuchtmeetNetClient.get_concentrations)
+    get_closest_station = _blocking(LuchtmeetNetClient.get_closest_station)
+    get_station_coordinate = _blocking(LuchtmeetNetClient.get_station_coordinate)
+    get_latest_station_measurements = _blocking(
+        LuchtmeetNetClient.get_latest_station_measurements
+    )
+    get_latest_lki = _blocking(LuchtmeetNetClient.get_latest_lki)
+    get_network_snapshot = _blocking(LuchtmeetNetClient.get_network_snapshot)
+    assign_stations = _blocking(LuchtmeetNetClient.assign_stations)
+    get_all_components = _blocking(LuchtmeetNetClient.get_all_components)
+    get_all_organisations = _blocking(LuchtmeetNetClient.get_all_organisations)
+    get_all_stations = _blocking(LuchtmeetNetClient.get_all_stations)
+    poll_all_components = _blocking(LuchtmeetNetClient.poll_all_components)
+    poll_all_organisations = _blocking(LuchtmeetNetClient.poll_all_organisations)
+    poll_all_stations = _blocking(LuchtmeetNetClient.poll_all_stations)
+    get_all_station_measurements = _blocking(
+        LuchtmeetNetClient.get_all_station_measurements
+    )
+    get_all_measurements = _blocking(LuchtmeetNetClient.get_all_measurements)
+    get_all_lki = _blocking(LuchtmeetNetClient.get_all_lki)
+    get_all_measurement_rows = _blocking(LuchtmeetNetClient.get_all_measurement_rows)
+    get_all_measurements_frame = _blocking(
+        LuchtmeetNetClient.get_all_measurements_frame
+    )
+    get_all_station_rows = _blocking(LuchtmeetNetClient.get_all_station_rows)
+    get_all_component_rows = _blocking(LuchtmeetNetClient.get_all_component_rows)
@@ -0,0 +1,174 @@
+"""Transports used by the request client to talk to the Luchtmeetnet API."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import defaultdict, deque
+from dataclasses import dataclass
+import gzip
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientSession
+import orjson
+
+from .exceptions import LuchtmeetNetConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    import os
+
+
+@dataclass
+class TransportResponse:
+    """Response returned by a transport."""
+
+    status: int
+    content_type: str
+    text: str
+
+
+@dataclass
+class Recording:
+    """A recorded request and its response."""
+
+    url: str
+    params: dict[str, str]
+    status: int
+    content_type: str
+    text: str
+    elapsed: float
+
+
+def _recording_key(url: str, params: Mapping[str, str] | None) -> str:
+    """Get the key a request is recorded under."""
+    return url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+
+
+class Transport(ABC):
+    """Base transport, performing GET requests."""
+
+    @abstractmethod
+    async def get(
+        self, url: str, params: Mapping[str, str] | None
+    ) -> TransportResponse:
+        """Perform a GET request."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release resources of the transport, nothing by default."""
+
+
+class AiohttpTransport(Transport):
+    """Transport performing requests with an aiohttp session.
+
+    A session is created on first use when none is given, and is closed when
+    the transport is closed.
+    """
+
+    def __init__(self, session: ClientSession | None = None) -> None:
+        """Initialize the transport."""
+        self.session = session
+        self._close_session = session is None
+
+    async def get(
+        self, url: str, params: Mapping[str, str] | None
+    ) -> TransportResponse:
+        """Perform a GET request."""
+        if self.session is None:
+            self.session = ClientSession()
+        response = await self.session.get(url, params=params)
+        return TransportResponse(
+            response.status,
+            response.headers.get("Content-Type", ""),
+            await response.text(),
+        )
+
+    async def close(self) -> None:
+        """Close the session if it is owned by the transport."""
+        if self.session is not None and self._close_session:
+            await self.session.close()
+            self.session = None
+
+
+class RecordingTransport(Transport):
+    """Transport recording all responses of another transport to a cassette.
+
+    The cassette is a gzip compressed file with one JSON recording per line,
+    and is written when the transport is closed.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], transport: Transport | None = None
+    ) -> None:
+        """Initialize the transport."""
+        self.path = Path(path)
+        self.transport = transport if transport is not None else AiohttpTransport()
+        self.recordings: list[Recording] = []
+
+    async def get(
+        self, url: str, params: Mapping[str, str] | None
+    ) -> TransportResponse:
+        """Perform a GET request and record the response."""
+        started = time.monotonic()
+        response = await self.transport.get(url, params)
+        self.recordings.append(
+            Recording(
+                url,
+                dict(params or {}),
+                response.status,
+                response.content_type,
+                response.text,
+                time.monotonic() - started,
+            )
+        )
+        return response
+
+    def save(self) -> None:
+        """Write the recordings to the cassette."""
+        with gzip.open(self.path, "wb") as file:
+            for recording in self.recordings:
+                file.write(orjson.dumps(recording) + b"\n")
+
+    async def close(self) -> None:
+        """Write the cassette and close the wrapped transport."""
+        self.save()
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Transport replaying responses from a cassette without network access.
+
+    Repeated requests are answered with their recordings in the original
+    order, the last recording is reused once they run out. Responses are
+    returned immediately unless a `latency_scale` is given, in which case the
+    recorded latency multiplied by that factor is simulated.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], latency_scale: float = 0.0
+    ) -> None:
+        """Initialize the transport."""
+        self.latency_scale = latency_scale
+        self._recordings: defaultdict[str, deque[Recording]] = defaultdict(deque)
+        with gzip.open(Path(path), "rb") as file:
+            for line in file:
+                recording = Recording(**orjson.loads(line))
+                key = _recording_key(recording.url, recording.params)
+                self._recordings[key].append(recording)
+
+    async def get(
+        self, url: str, params: Mapping[str, str] | None
+    ) -> TransportResponse:
+        """Replay the recorded response of a GET request."""
+        recordings = self._recordings.get(_recording_key(url, params))
+        if not recordings:
+            msg = "No recorded response for request"
+            raise LuchtmeetNetConnectionError(msg, {"url": url, "params": params})
+        recording = recordings.popleft() if len(recordings) > 1 else recordings[0]
+        if self.latency_scale > 0:
+            await asyncio.sleep(recording.elapsed * self.latency_scale)
+        return TransportResponse(
+            recording.status, recording.content_type, recording.text
+        )
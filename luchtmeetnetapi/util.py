@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from math import atan2, cos, radians, sin, sqrt
 
 EARTH_RADIUS = 6371.0
@@ -27,3 +28,16 @@ def get_approximate_distance(
     c = 2 * atan2(sqrt(a), sqrt(1 - a))
 
     return EARTH_RADIUS * c
+
+
+def format_timestamp(value: datetime) -> str:
+    """Format a datetime as timestamp accepted by the API."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse a timestamp of the API, timestamps without timezone are in UTC."""
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=UTC)
+    return timestamp
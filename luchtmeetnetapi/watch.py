@@ -0,0 +1,108 @@
+"""Shared polling of the latest station measurements."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from .exceptions import LuchtmeetNetError
+
+if TYPE_CHECKING:
+    from .api import LuchtmeetNetApi
+    from .models import StationMeasurementData
+
+# Items of subscriber queues: changes, the error that ended polling, or None
+# when polling was stopped.
+WatchItem = list["StationMeasurementData"] | Exception | None
+
+
+class StationPoller:
+    """Poll the latest measurements of a station on behalf of all subscribers.
+
+    Only one request is made per interval, no matter how many subscribers
+    there are. Subscribers receive the current measurements when they
+    subscribe, and after that only new or changed measurements. When polling
+    stops, subscribers receive None, or the error when it failed.
+    """
+
+    def __init__(
+        self,
+        api: LuchtmeetNetApi,
+        station_number: str,
+        formulas: frozenset[str] | None,
+        interval: float,
+    ) -> None:
+        """Initialize the poller."""
+        self.api = api
+        self.station_number = station_number
+        self.formulas = formulas
+        self.interval = interval
+        self.latest: dict[tuple[str, str], StationMeasurementData] = {}
+        self._queues: set[asyncio.Queue[WatchItem]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def idle(self) -> bool:
+        """Return whether the poller has no subscribers."""
+        return not self._queues
+
+    def subscribe(self) -> asyncio.Queue[WatchItem]:
+        """Subscribe to changes, starting the poller when needed."""
+        queue: asyncio.Queue[WatchItem] = asyncio.Queue()
+        if self.latest:
+            queue.put_nowait(list(self.latest.values()))
+        self._queues.add(queue)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[WatchItem]) -> None:
+        """Unsubscribe from changes, stopping the poller when it becomes idle."""
+        self._queues.discard(queue)
+        if self.idle:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop polling, ending the watch of all subscribers."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._broadcast(None)
+
+    def _broadcast(self, item: WatchItem) -> None:
+        """Send an item to all subscribers."""
+        for queue in self._queues:
+            queue.put_nowait(item)
+
+    async def poll(self) -> None:
+        """Poll once and send new or changed measurements to all subscribers."""
+        formula = None
+        if self.formulas is not None and len(self.formulas) == 1:
+            formula = next(iter(self.formulas))
+        result = await self.api.get_station_measurements(
+            self.station_number,
+            order="timestamp_measured",
+            order_direction="desc",
+            formula=formula,
+        )
+        latest = {
+            (item.formula, item.timestamp_measured): item
+            for item in result.data
+            if self.formulas is None or item.formula in self.formulas
+        }
+        changes = [item for key, item in latest.items() if self.latest.get(key) != item]
+        self.latest = latest
+        if changes:
+            self._broadcast(changes)
+
+    async def _run(self) -> None:
+        """Keep polling until stopped, or until an unexpected error occurs."""
+        try:
+            while True:
+                with suppress(LuchtmeetNetError):
+                    await self.poll()
+                await asyncio.sleep(self.interval)
+        except Exception as exception:  # pylint: disable=broad-exception-caught  # noqa: BLE001
+            self._task = None
+            self._broadcast(exception)
@@ -1,9 +1,32 @@
 """Test package for the Luchtmeetnet API."""
 
 from pathlib import Path
+import re
+
+FIRST_PAGE = 1
+LAST_PAGE = 3
 
 
 def load_fixture(filename: str) -> str:
     """Load a fixture."""
     path = Path(__package__) / "fixtures" / filename
     return path.read_text(encoding="utf-8")
+
+
+def set_pagination(current_page: int, fixture: str, last_page: int = LAST_PAGE) -> str:
+    """Set the pagination of a fixture to the given page."""
+    pagination_fixture = load_fixture("pagination.json")
+    prev_page = current_page - 1 if current_page > FIRST_PAGE else FIRST_PAGE
+    next_page = current_page + 1 if current_page < last_page else last_page
+    page_list = ",".join(map(str, range(FIRST_PAGE, last_page + 1)))
+    pagination = (
+        pagination_fixture.replace('"CURRENT_PAGE"', str(current_page))
+        .replace('"LAST_PAGE"', str(last_page))
+        .replace('"FIRST_PAGE"', str(FIRST_PAGE))
+        .replace('"PREV_PAGE"', str(prev_page))
+        .replace('"NEXT_PAGE"', str(next_page))
+        .replace('"PAGE_LIST"', page_list)
+    )
+    return re.sub(
+        r'("pagination": ){.*?}', r"\1" + pagination, fixture, flags=re.DOTALL
+    )
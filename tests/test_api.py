@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from aiohttp.hdrs import METH_GET
 from aioresponses import aioresponses
@@ -404,3 +405,35 @@ async def test_get_concentrations_all_params(
                 "station_number": STATION_ID,
             },
         )
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Executor counting submitted work."""
+
+    submitted = 0
+
+    def submit(self, *args: Any, **kwargs: Any) -> Future[Any]:
+        """Count and submit work."""
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+async def test_decode_offloaded(
+    responses: aioresponses,
+) -> None:
+    """Test large responses are decoded in the executor."""
+    responses.get(
+        f"{MOCK_URL}/measurements?page=1",
+        status=200,
+        body=load_fixture("get_measurements.json"),
+        repeat=True,
+    )
+    with CountingExecutor(max_workers=1) as executor:
+        async with LuchtmeetNetApi() as client:
+            client.decode_executor = executor
+            client.decode_offload_threshold = 10_000
+            measurements = await client.get_measurements()
+            assert executor.submitted == 0
+            client.decode_offload_threshold = 100
+            assert await client.get_measurements() == measurements
+            assert executor.submitted == 1
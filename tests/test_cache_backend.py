@@ -0,0 +1,124 @@
+"""Tests for the cache backends."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aioresponses import aioresponses
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.cache_backend import (
+    CacheBackend,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from luchtmeetnetapi.exceptions import LuchtmeetNetConnectionError
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+STATION_ID = "TESTA"
+
+
+@pytest.fixture(name="backend", params=["memory", "sqlite"])
+def backend_fixture(request: pytest.FixtureRequest, tmp_path: Path) -> CacheBackend:
+    """Return a cache backend."""
+    if request.param == "memory":
+        return MemoryCacheBackend()
+    return SQLiteCacheBackend(tmp_path / "cache.sqlite")
+
+
+async def test_backend(backend: CacheBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test storing, expiring and removing responses."""
+    now = 1000.0
+    monkeypatch.setattr("luchtmeetnetapi.cache_backend.time.time", lambda: now)
+    assert await backend.get("a") is None
+    await backend.set("a", "1", 10)
+    await backend.set("b", "2", 20)
+    await backend.set("c", "3", 20)
+    assert await backend.get("a") == "1"
+    now += 10
+    assert await backend.get("a") is None
+    assert await backend.get("b") == "2"
+    await backend.delete("b")
+    assert await backend.get("b") is None
+    await backend.clear()
+    assert await backend.get("c") is None
+    await backend.close()
+
+
+async def test_sqlite_shared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test backends on the same file share responses."""
+    now = 1000.0
+    monkeypatch.setattr("luchtmeetnetapi.cache_backend.time.time", lambda: now)
+    first = SQLiteCacheBackend(tmp_path / "cache.sqlite")
+    second = SQLiteCacheBackend(tmp_path / "cache.sqlite")
+    await first.set("a", "1", 10)
+    await first.set("b", "2", 20)
+    assert await second.get("a") == "1"
+    now += 10
+    await second.purge()
+    await first.close()
+    await first.close()
+    assert await first.get("b") == "2"
+    assert first._execute("SELECT key FROM responses") == [("b",)]
+    await first.close()
+    await second.close()
+
+
+async def test_client_response_cache(
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test clients share responses through the cache."""
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}",
+        status=200,
+        body=load_fixture("get_station.json"),
+    )
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}/measurements?page=1",
+        status=500,
+        body="Oops",
+    )
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}/measurements?page=1",
+        status=200,
+        body=load_fixture("get_station_measurements.json"),
+    )
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite")
+    async with LuchtmeetNetClient() as first:
+        first.response_cache = backend
+        await first.get_station(STATION_ID)
+        with pytest.raises(LuchtmeetNetConnectionError):
+            await first.get_station_measurements(STATION_ID)
+        await first.get_station_measurements(STATION_ID)
+        assert first.stats.requests == 3
+    async with LuchtmeetNetClient() as second:
+        second.response_cache = SQLiteCacheBackend(tmp_path / "cache.sqlite")
+        station = await second.get_station(STATION_ID)
+        assert station.data.location == "Nederland"
+        await second.get_station_measurements(STATION_ID)
+        assert second.stats.requests == 0
+        assert second.stats.cache_hits == 2
+    assert backend._connection is None
+
+
+async def test_client_uncached_resource(responses: aioresponses) -> None:
+    """Test resources without a time to live are not cached."""
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}",
+        status=200,
+        body=load_fixture("get_station.json"),
+        repeat=True,
+    )
+    async with LuchtmeetNetClient() as client:
+        client.response_cache = MemoryCacheBackend()
+        client.response_cache_ttls = {"components": 60}
+        await client.get_station(STATION_ID)
+        await client.get_station(STATION_ID)
+        assert client.stats.requests == 2
+        assert client.stats.cache_hits == 0
@@ -0,0 +1,66 @@
+"""Tests for the component catalog."""
+
+from __future__ import annotations
+
+from aioresponses import aioresponses
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.catalog import ComponentCatalog
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+
+def _mock_components(responses: aioresponses) -> None:
+    """Mock the component list and the details of each component."""
+    responses.get(
+        f"{MOCK_URL}/components?page=1",
+        status=200,
+        body=load_fixture("get_components.json"),
+        repeat=True,
+    )
+    fixture = load_fixture("get_component.json")
+    responses.get(f"{MOCK_URL}/components/H2O", status=200, body=fixture, repeat=True)
+    responses.get(
+        f"{MOCK_URL}/components/O2",
+        status=200,
+        body=fixture.replace('"H2O"', '"O2"'),
+        repeat=True,
+    )
+
+
+async def test_catalog_lookups(
+    responses: aioresponses,
+) -> None:
+    """Test the catalog serves lookups from memory after warm up."""
+    _mock_components(responses)
+    async with LuchtmeetNetClient() as client:
+        catalog = ComponentCatalog(client)
+        assert catalog.expired
+        await catalog.ensure_fresh()
+        requests = client.stats.requests
+        assert requests == 3
+        await catalog.ensure_fresh()
+        assert not catalog.expired
+        assert len(catalog) == 2
+        assert "O2" in catalog
+        assert "NO2" not in catalog
+        assert catalog.formulas == ["H2O", "O2"]
+        component = catalog.get("H2O")
+        assert component is not None
+        assert component.name.EN == "Water"
+        assert catalog.get("NO2") is None
+        assert [limit.rating for limit in catalog.limits("O2")] == [1]
+        assert catalog.limits("NO2") == []
+        assert client.stats.requests == requests
+
+
+async def test_catalog_refresh_interval(
+    responses: aioresponses,
+) -> None:
+    """Test the catalog is refreshed once expired."""
+    _mock_components(responses)
+    async with LuchtmeetNetClient() as client:
+        catalog = ComponentCatalog(client, refresh_interval=0)
+        await catalog.ensure_fresh()
+        await catalog.ensure_fresh()
+        assert client.stats.requests == 6
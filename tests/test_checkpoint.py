@@ -0,0 +1,116 @@
+"""Tests for resumable paginated pulls."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aiohttp.hdrs import METH_GET
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.checkpoint import PaginationCheckpoint
+from luchtmeetnetapi.exceptions import LuchtmeetNetConnectionError
+from luchtmeetnetapi.models import MeasurementData
+from tests import FIRST_PAGE, LAST_PAGE, load_fixture, set_pagination
+from tests.const import MOCK_URL
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+QUERY = {"start": None, "end": None, "station_number": None, "formula": None}
+
+
+def _add_page(responses: aioresponses, path: str, fixture: str, page: int) -> None:
+    """Mock a single page."""
+    responses.get(
+        f"{MOCK_URL}/{path}?page={page}",
+        status=200,
+        body=set_pagination(page, load_fixture(fixture)),
+    )
+
+
+async def test_resume_measurements(
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test an interrupted pull resumes after the last completed page."""
+    state_file = tmp_path / "measurements.state"
+    _add_page(responses, "measurements", "get_measurements.json", FIRST_PAGE)
+    responses.get(f"{MOCK_URL}/measurements?page=2", status=500)
+    async with LuchtmeetNetClient() as client:
+        with pytest.raises(LuchtmeetNetConnectionError):
+            await client.get_all_measurements(checkpoint=state_file)
+    assert state_file.exists()
+
+    for page in range(2, LAST_PAGE + 1):
+        _add_page(responses, "measurements", "get_measurements.json", page)
+    async with LuchtmeetNetClient() as client:
+        items = await client.get_all_measurements(checkpoint=state_file)
+    assert len(items) == 2 * LAST_PAGE
+    assert [
+        len(responses.requests[(METH_GET, URL(f"{MOCK_URL}/measurements?page={page}"))])
+        for page in range(FIRST_PAGE, LAST_PAGE + 1)
+    ] == [1, 2, 1]
+    assert not state_file.exists()
+    assert not (tmp_path / "measurements.state.jsonl").exists()
+
+
+async def test_resume_lki_with_other_query(
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test a checkpoint of another query is discarded."""
+    state_file = tmp_path / "lki.state"
+    checkpoint = PaginationCheckpoint(
+        state_file, {"station_number": "OTHER"}, MeasurementData
+    )
+    checkpoint.save(3, [MeasurementData("OTHER", 1.0, "2024-10-19T17:00:00", "LKI")])
+    for page in range(FIRST_PAGE, LAST_PAGE + 1):
+        _add_page(responses, "lki", "get_lki.json", page)
+    async with LuchtmeetNetClient() as client:
+        items = await client.get_all_lki(checkpoint=state_file)
+    assert len(items) == 2 * LAST_PAGE
+    assert {item.station_number for item in items} == {"TESTA"}
+
+
+def test_load_discards_unrecorded_items(tmp_path: Path) -> None:
+    """Test items written after the last saved state are not loaded twice."""
+    checkpoint = PaginationCheckpoint(tmp_path / "state", QUERY, MeasurementData)
+    assert checkpoint.load() == (1, [])
+    item = MeasurementData("TESTA", 1.0, "2024-10-19T17:00:00+00:00", "NO2")
+    checkpoint.save(2, [item])
+    with checkpoint.items_path.open("ab") as file:
+        file.write(b'{"station_number": "TESTA"')
+
+    assert checkpoint.load() == (2, [item])
+    checkpoint.save(3, [item])
+    assert checkpoint.load() == (3, [item, item])
+    checkpoint.remove()
+    assert checkpoint.load() == (1, [])
+
+
+@pytest.mark.parametrize("state", [b"", b'{"query": {"start"'])
+def test_load_truncated_state(tmp_path: Path, state: bytes) -> None:
+    """Test a state file that cannot be decoded restarts the pull."""
+    checkpoint = PaginationCheckpoint(tmp_path / "state", QUERY, MeasurementData)
+    item = MeasurementData("TESTA", 1.0, "2024-10-19T17:00:00+00:00", "NO2")
+    checkpoint.save(2, [item])
+    checkpoint.path.write_bytes(state)
+    assert checkpoint.load() == (1, [])
+    assert not checkpoint.items_path.exists()
+
+
+def test_save_without_directory_sync(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test saving where directories cannot be synced, like on Windows."""
+
+    def open_directory(*_args: object) -> int:
+        raise PermissionError
+
+    checkpoint = PaginationCheckpoint(tmp_path / "state", QUERY, MeasurementData)
+    monkeypatch.setattr("luchtmeetnetapi.checkpoint.os.open", open_directory)
+    checkpoint.save(2, [])
+    assert checkpoint.load() == (2, [])
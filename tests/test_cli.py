@@ -0,0 +1,132 @@
+"""Tests for the command line interface."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aioresponses import aioresponses
+import orjson
+import pytest
+
+from luchtmeetnetapi import cli
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+START = "2024-10-01T00:00:00"
+END = "2024-10-02T00:00:00"
+
+
+def test_stations_jsonl(
+    responses: aioresponses,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test downloading stations as JSON lines."""
+    responses.get(
+        f"{MOCK_URL}/stations?page=1",
+        status=200,
+        body=load_fixture("get_stations.json"),
+    )
+    assert cli.main(["--no-progress", "stations"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [orjson.loads(line)["number"] for line in lines] == ["NL01491", "NL01497"]
+
+
+def test_components_json(
+    responses: aioresponses,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test downloading components as JSON."""
+    responses.get(
+        f"{MOCK_URL}/components?page=1",
+        status=200,
+        body=load_fixture("get_components.json"),
+    )
+    assert cli.main(["--no-progress", "--format", "json", "components"]) == 0
+    components = orjson.loads(capsys.readouterr().out)
+    assert [component["formula"] for component in components] == ["H2O", "O2"]
+
+
+def test_empty_json(
+    responses: aioresponses,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test downloading nothing as JSON."""
+    responses.get(
+        f"{MOCK_URL}/lki?page=1",
+        status=200,
+        body='{"pagination": '
+        '{"current_page": 1, "next_page": 1, "prev_page": 1, "page_list": [1], '
+        '"first_page": 1, "last_page": 1}, "data": []}',
+    )
+    assert cli.main(["--no-progress", "--format", "json", "lki"]) == 0
+    assert orjson.loads(capsys.readouterr().out) == []
+
+
+def test_measurements_csv(
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test downloading measurements of multiple stations as CSV."""
+    for station in ("TESTA", "TESTB"):
+        responses.get(
+            f"{MOCK_URL}/measurements?page=1&station_number={station}"
+            f"&formula=NO2&start={START}&end={END}",
+            status=200,
+            body=load_fixture("get_measurements.json").replace("TESTA", station),
+        )
+    output = tmp_path / "measurements.csv"
+    args = ["--no-progress", "--format", "csv", "--output", str(output)]
+    args += ["--rate-limit", "100", "measurements", "--formula", "NO2"]
+    args += ["--station", "TESTA", "--station", "TESTB", "--start", START]
+    args += ["--end", END]
+    assert cli.main(args) == 0
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "station_number,value,timestamp_measured,formula"
+    assert sorted(line.split(",")[0] for line in lines[1:]) == [
+        "TESTA",
+        "TESTA",
+        "TESTB",
+        "TESTB",
+    ]
+
+
+def test_csv_flattens_nested_fields(
+    responses: aioresponses,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test nested fields are flattened in CSV output."""
+    responses.get(
+        f"{MOCK_URL}/components?page=1",
+        status=200,
+        body=load_fixture("get_components.json"),
+    )
+    assert cli.main(["--no-progress", "--format", "csv", "components"]) == 0
+    assert capsys.readouterr().out.splitlines()[0] == "name.EN,name.NL,formula"
+
+
+def test_progress(
+    responses: aioresponses,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test live progress and the final summary."""
+
+    async def delayed_callback(*_args: object, **_kwargs: object) -> None:
+        """Delay the response so progress is reported."""
+        await cli.asyncio.sleep(0.05)
+
+    monkeypatch.setattr(cli, "PROGRESS_INTERVAL", 0.01)
+    responses.get(
+        f"{MOCK_URL}/lki?page=1&station_number=TESTA",
+        status=200,
+        body=load_fixture("get_lki.json"),
+        callback=delayed_callback,
+    )
+    assert cli.main(["lki", "--station", "TESTA"]) == 0
+    err = capsys.readouterr().err
+    assert "requests/s" in err
+    assert err.endswith("\n")
+    assert "Done: 2 rows" in err
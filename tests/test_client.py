@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Coroutine
 
 from aiohttp.hdrs import METH_GET
 from aioresponses import aioresponses
+import pytest
 
 from luchtmeetnetapi import LuchtmeetNetClient
-from tests import load_fixture
+from luchtmeetnetapi.exceptions import LuchtmeetNetConnectionError
+from luchtmeetnetapi.limits import REQUEST_PRIORITY, Priority, request_priority
+from luchtmeetnetapi.models import Measurements
+from tests import FIRST_PAGE, LAST_PAGE, load_fixture, set_pagination
 from tests.const import MOCK_URL
 
 if TYPE_CHECKING:
@@ -17,8 +21,6 @@ if TYPE_CHECKING:
 
 
 # Some test vars
-FIRST_PAGE = 1
-LAST_PAGE = 3
 STATION_ID = "TESTA"
 CACHED_STATION_ID = "NL01491"
 
@@ -68,7 +70,7 @@ async def test_get_all_components(
     """Test retrieving all components."""
     fixture = load_fixture("get_components.json")
     for page in range(FIRST_PAGE, LAST_PAGE + 1):
-        fixture = _set_pagination(page, fixture)
+        fixture = set_pagination(page, fixture)
         responses.add(f"{MOCK_URL}/components?page={page}", status=200, body=fixture)
     async with LuchtmeetNetClient() as client:
         assert await client.get_all_components() == snapshot
@@ -85,7 +87,7 @@ async def test_get_all_organisations(
     """Test retrieving all organisations."""
     fixture = load_fixture("get_organisations.json")
     for page in range(FIRST_PAGE, LAST_PAGE + 1):
-        fixture = _set_pagination(page, fixture)
+        fixture = set_pagination(page, fixture)
         responses.add(f"{MOCK_URL}/organisations?page={page}", status=200, body=fixture)
     async with LuchtmeetNetClient() as client:
         assert await client.get_all_organisations() == snapshot
@@ -102,7 +104,7 @@ async def test_get_all_stations(
     """Test retrieving all stations."""
     fixture = load_fixture("get_stations.json")
     for page in range(FIRST_PAGE, LAST_PAGE + 1):
-        fixture = _set_pagination(page, fixture)
+        fixture = set_pagination(page, fixture)
         responses.add(f"{MOCK_URL}/stations?page={page}", status=200, body=fixture)
     async with LuchtmeetNetClient() as client:
         assert await client.get_all_stations() == snapshot
@@ -119,7 +121,7 @@ async def test_get_all_station_measurements(
     """Test retrieving all station measurements."""
     fixture = load_fixture("get_station_measurements.json")
     for page in range(FIRST_PAGE, LAST_PAGE + 1):
-        fixture = _set_pagination(page, fixture)
+        fixture = set_pagination(page, fixture)
         responses.add(
             f"{MOCK_URL}/stations/{STATION_ID}/measurements?page={page}",
             status=200,
@@ -145,7 +147,7 @@ async def test_get_all_measurements(
     """Test retrieving all measurements."""
     fixture = load_fixture("get_measurements.json")
     for page in range(FIRST_PAGE, LAST_PAGE + 1):
-        fixture = _set_pagination(page, fixture)
+        fixture = set_pagination(page, fixture)
         responses.add(
             f"{MOCK_URL}/measurements?page={page}",
             status=200,
@@ -168,7 +170,7 @@ async def test_get_all_lki(
     """Test retrieving all lki."""
     fixture = load_fixture("get_lki.json")
     for page in range(FIRST_PAGE, LAST_PAGE + 1):
-        fixture = _set_pagination(page, fixture)
+        fixture = set_pagination(page, fixture)
         responses.add(
             f"{MOCK_URL}/lki?page={page}",
             status=200,
@@ -184,19 +186,161 @@ async def test_get_all_lki(
             )
 
 
-def _set_pagination(current_page: int, fixture: str) -> str:
-    pagination_fixture = load_fixture("pagination.json")
-    prev_page = current_page - 1 if current_page > FIRST_PAGE else FIRST_PAGE
-    next_page = current_page + 1 if current_page < LAST_PAGE else LAST_PAGE
-    page_list = ",".join(map(str, range(FIRST_PAGE, LAST_PAGE + 1)))
-    pagination = (
-        pagination_fixture.replace('"CURRENT_PAGE"', str(current_page))
-        .replace('"LAST_PAGE"', str(LAST_PAGE))
-        .replace('"FIRST_PAGE"', str(FIRST_PAGE))
-        .replace('"PREV_PAGE"', str(prev_page))
-        .replace('"NEXT_PAGE"', str(next_page))
-        .replace('"PAGE_LIST"', page_list)
+def _paged_getter(
+    events: list[str], last_page: int = LAST_PAGE, fail_page: int | None = None
+) -> Callable[[int], Coroutine[Any, Any, Measurements]]:
+    """Get a page getter recording when pages are requested and done."""
+
+    async def get_page(page: int) -> Measurements:
+        events.append(f"request {page}")
+        await asyncio.sleep(0.01)
+        if page == fail_page:
+            raise LuchtmeetNetConnectionError
+        fixture = set_pagination(page, load_fixture("get_measurements.json"), last_page)
+        events.append(f"done {page}")
+        return Measurements.from_json(fixture)
+
+    return get_page
+
+
+async def _consume(
+    client: LuchtmeetNetClient, events: list[str], get_page: Any
+) -> None:
+    """Consume all pages, simulating slow handling of each page."""
+    async for result in client.iter_pages(get_page):
+        events.append(f"handle {result.pagination.current_page}")
+        await asyncio.sleep(0.02)
+        events.append(f"finish {result.pagination.current_page}")
+
+
+@pytest.mark.parametrize(
+    ("prefetch_pages", "expected"),
+    [
+        (
+            0,
+            [
+                *("request 1", "done 1", "handle 1", "finish 1"),
+                *("request 2", "done 2", "handle 2", "finish 2"),
+            ],
+        ),
+        (
+            1,
+            [
+                *("request 1", "done 1", "handle 1", "request 2"),
+                *("done 2", "finish 1", "handle 2", "finish 2"),
+            ],
+        ),
+    ],
+)
+async def test_iter_pages_prefetch(prefetch_pages: int, expected: list[str]) -> None:
+    """Test the next page is requested while the current page is handled."""
+    events: list[str] = []
+    async with LuchtmeetNetClient() as client:
+        client.prefetch_pages = prefetch_pages
+        await _consume(client, events, _paged_getter(events, last_page=2))
+    assert events == expected
+
+
+async def test_iter_pages_prefetch_depth() -> None:
+    """Test multiple pages are prefetched up to the last page."""
+    events: list[str] = []
+    async with LuchtmeetNetClient() as client:
+        client.prefetch_pages = 5
+        await _consume(client, events, _paged_getter(events))
+    assert events[:5] == ["request 1", "done 1", "handle 1", "request 2", "request 3"]
+    assert events.count("request 3") == 1
+    assert events[-1] == "finish 3"
+
+
+async def test_iter_pages_stops_early() -> None:
+    """Test prefetched pages are cancelled when iteration stops early."""
+    events: list[str] = []
+    async with LuchtmeetNetClient() as client:
+        client.prefetch_pages = 2
+        pages = client.iter_pages(_paged_getter(events, fail_page=3))
+        async for _ in pages:
+            await asyncio.sleep(0.05)
+            break
+        await pages.aclose()
+        pages = client.iter_pages(_paged_getter(events))
+        async for _ in pages:
+            break
+        await pages.aclose()
+    assert "done 3" not in events
+
+
+async def test_iter_pages_prefetch_error() -> None:
+    """Test errors of prefetched pages are raised when the page is reached."""
+    events: list[str] = []
+    async with LuchtmeetNetClient() as client:
+        with pytest.raises(LuchtmeetNetConnectionError):
+            await _consume(client, events, _paged_getter(events, fail_page=2))
+    assert events[-1] == "finish 1"
+
+
+async def test_iter_pages_priority() -> None:
+    """Test pages are requested with bulk priority unless set by the caller."""
+    priorities: list[Priority | None] = []
+
+    async def get_page(page: int) -> Measurements:
+        priorities.append(REQUEST_PRIORITY.get())
+        fixture = set_pagination(page, load_fixture("get_measurements.json"), 2)
+        return Measurements.from_json(fixture)
+
+    async with LuchtmeetNetClient() as client:
+        await client._get_all(get_page)
+        with request_priority(Priority.INTERACTIVE):
+            await client._get_all(get_page)
+    assert priorities == [Priority.BULK] * 2 + [Priority.INTERACTIVE] * 2
+    assert REQUEST_PRIORITY.get() is None
+
+
+async def test_get_all_measurement_rows(responses: aioresponses) -> None:
+    """Test retrieving the projected rows of all measurement pages."""
+    for page in range(FIRST_PAGE, LAST_PAGE + 1):
+        responses.get(
+            f"{MOCK_URL}/measurements?formula=H2O&page={page}",
+            status=200,
+            body=set_pagination(page, load_fixture("get_measurements.json")),
+        )
+    async with LuchtmeetNetClient() as client:
+        rows = await client.get_all_measurement_rows(
+            ("station_number", "value"), formula="H2O"
+        )
+    assert rows == [("TESTA", 53.0), ("TESTA", 0.0)] * LAST_PAGE
+
+
+async def test_get_all_station_and_component_rows(responses: aioresponses) -> None:
+    """Test retrieving the projected rows of stations and components."""
+    responses.get(
+        f"{MOCK_URL}/stations?page=1",
+        status=200,
+        body=load_fixture("get_stations.json"),
     )
-    return re.sub(
-        r'("pagination": ){.*?}', r"\1" + pagination, fixture, flags=re.DOTALL
+    responses.get(
+        f"{MOCK_URL}/components?page=1",
+        status=200,
+        body=load_fixture("get_components.json"),
     )
+    async with LuchtmeetNetClient() as client:
+        client.decode_offload_threshold = 0
+        stations = await client.get_all_station_rows()
+        components = await client.get_all_component_rows()
+    assert stations == [("NL01491", "Nederland"), ("NL01497", "Nederland")]
+    assert components == [("H2O", "Water"), ("O2", "Zuurstof")]
+
+
+async def test_get_all_measurements_frame(responses: aioresponses) -> None:
+    """Test retrieving all measurement pages as a data frame."""
+    pytest.importorskip("pandas")
+    for page in range(FIRST_PAGE, LAST_PAGE + 1):
+        responses.get(
+            f"{MOCK_URL}/measurements?page={page}&station_number=TESTA",
+            status=200,
+            body=set_pagination(page, load_fixture("get_measurements.json")),
+        )
+    async with LuchtmeetNetClient() as client:
+        frame = await client.get_all_measurements_frame(station_number=STATION_ID)
+    assert len(frame) == 2 * LAST_PAGE
+    assert frame["formula"].tolist() == ["H2O", "O2"] * LAST_PAGE
+    assert frame["value"].sum() == 53.0 * LAST_PAGE
@@ -0,0 +1,80 @@
+"""Tests for deadlines spanning whole calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+from aioresponses import CallbackResult, aioresponses
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.deadline import CURRENT_DEADLINE
+from luchtmeetnetapi.exceptions import LuchtmeetNetDeadlineError
+from tests import FIRST_PAGE, LAST_PAGE, load_fixture, set_pagination
+from tests.const import MOCK_URL
+
+
+def _mock_slow_pages(responses: aioresponses, delay: float) -> None:
+    """Mock station pages, the pages after the first one are slow."""
+    for page in range(FIRST_PAGE, LAST_PAGE + 1):
+        body = set_pagination(page, load_fixture("get_stations.json"))
+
+        async def respond(
+            *_args: object, body: str = body, page: int = page, **_kwargs: object
+        ) -> CallbackResult:
+            if page > FIRST_PAGE:
+                await asyncio.sleep(delay)
+            return CallbackResult(status=200, body=body)
+
+        responses.get(f"{MOCK_URL}/stations?page={page}", callback=respond)
+
+
+async def test_partial_result(responses: aioresponses) -> None:
+    """Test the items retrieved before the deadline are returned."""
+    _mock_slow_pages(responses, 1)
+    async with LuchtmeetNetClient() as client:
+        with client.deadline(0.1, partial=True) as deadline:
+            stations = await client.get_all_stations()
+        assert deadline.exceeded
+        assert [station.number for station in stations] == ["NL01491", "NL01497"]
+        assert client.concurrency_limiter.in_flight == 0
+    assert CURRENT_DEADLINE.get() is None
+
+
+async def test_deadline_error(responses: aioresponses) -> None:
+    """Test an error is raised when the deadline passes."""
+    _mock_slow_pages(responses, 1)
+    async with LuchtmeetNetClient() as client:
+        with pytest.raises(LuchtmeetNetDeadlineError), client.deadline(0.1):
+            await client.get_all_stations()
+        assert client.concurrency_limiter.in_flight == 0
+
+
+async def test_within_deadline(responses: aioresponses) -> None:
+    """Test calls finishing in time are not affected."""
+    _mock_slow_pages(responses, 0)
+    async with LuchtmeetNetClient() as client:
+        with client.deadline(5, partial=True) as deadline:
+            stations = await client.get_all_stations()
+        assert not deadline.exceeded
+        assert len(stations) == 2 * LAST_PAGE
+
+
+async def test_nested_deadline() -> None:
+    """Test a nested deadline does not extend the outer deadline."""
+    async with LuchtmeetNetClient() as client:
+        with client.deadline(1) as outer:
+            with client.deadline(10) as inner:
+                assert inner.when == outer.when
+                assert 0 < inner.remaining <= 1
+            with client.deadline(0.5) as inner:
+                assert inner.when < outer.when
+            assert CURRENT_DEADLINE.get() is outer
+
+
+async def test_expired_deadline(responses: aioresponses) -> None:
+    """Test no request is made once the deadline has passed."""
+    async with LuchtmeetNetClient() as client:
+        with pytest.raises(LuchtmeetNetDeadlineError), client.deadline(0):
+            await client.get_station("TESTA")
+    assert not responses.requests
@@ -0,0 +1,67 @@
+"""Tests for the streaming evaluator."""
+
+from __future__ import annotations
+
+from luchtmeetnetapi.evaluator import BandChange, RollingEvaluator, RollingStatistics
+from luchtmeetnetapi.models import ComponentLimit, MeasurementData
+
+HOUR = 60 * 60
+GOOD = ComponentLimit(
+    lowerband=None, upperband=40, color="green", rating=1, type="website"
+)
+FAIR = ComponentLimit(
+    lowerband=40, upperband=80, color="orange", rating=2, type="website"
+)
+
+
+def _measurement(hour: int, value: float, station: str = "NL01491") -> MeasurementData:
+    """Create a NO2 measurement of an hour of a day."""
+    return MeasurementData(station, value, f"2024-10-19T{hour:02}:00:00+00:00", "NO2")
+
+
+def test_rolling_statistics() -> None:
+    """Test values leave the window, and the maximum and exceedances follow."""
+    statistics = RollingStatistics(window=3 * HOUR, threshold=50)
+    assert statistics.mean is None
+    assert statistics.max is None
+    for hour, value in enumerate([60, 20, 30, 10]):
+        assert statistics.add(hour * HOUR, value)
+    assert len(statistics) == 3
+    assert statistics.mean == 20
+    assert statistics.max == 30
+    assert statistics.exceedances == 0
+    assert statistics.add(4 * HOUR, 70)
+    assert statistics.max == 70
+    assert statistics.exceedances == 1
+    assert not statistics.add(4 * HOUR, 0)
+    assert statistics.add(10 * HOUR, 5)
+    assert (len(statistics), statistics.max, statistics.exceedances) == (1, 5, 0)
+
+
+def test_band_changes() -> None:
+    """Test band changes of the rolling mean are reported per station."""
+    evaluator = RollingEvaluator({"NO2": [FAIR, GOOD]}, window=2 * HOUR)
+    assert evaluator.add(_measurement(0, 30)) == BandChange(
+        "NL01491", "NO2", "2024-10-19T00:00:00+00:00", 30, None, GOOD
+    )
+    assert evaluator.add(_measurement(1, 40)) is None
+    changes = evaluator.extend(
+        [_measurement(2, 60), _measurement(2, 60), _measurement(0, 10, "NL01497")]
+    )
+    assert [(change.station_number, change.current) for change in changes] == [
+        ("NL01491", FAIR),
+        ("NL01497", GOOD),
+    ]
+    assert changes[0].previous == GOOD
+    assert evaluator.add(_measurement(3, 120)).current is None
+    assert evaluator.statistics["NL01491", "NO2"].max == 120
+
+
+def test_band_bounds() -> None:
+    """Test values outside all bands, and components without limits."""
+    evaluator = RollingEvaluator({"NO2": [FAIR]})
+    assert evaluator.band("NO2", 10) is None
+    assert evaluator.band("NO2", 40) == FAIR
+    assert evaluator.band("NO2", 80) is None
+    assert evaluator.band("PM10", 10) is None
+    assert evaluator.add(_measurement(0, 10)) is None
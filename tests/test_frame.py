@@ -0,0 +1,84 @@
+"""Tests for the data frame construction."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from luchtmeetnetapi.exceptions import LuchtmeetNetError
+from luchtmeetnetapi.frame import MeasurementFrameBuilder, to_frame
+
+pd = pytest.importorskip("pandas")
+pl = pytest.importorskip("polars")
+
+ROWS = [
+    ("TESTA", "H2O", 53.0, "2024-10-19T17:00:00+00:00"),
+    ("TESTA", "O2", 0.0, "2024-10-19T17:00:00+00:00"),
+    ("TESTB", "H2O", 12.5, "2024-10-19T18:00:00+00:00"),
+]
+
+
+def test_to_pandas() -> None:
+    """Test building a pandas data frame."""
+    builder = MeasurementFrameBuilder()
+    builder.add(ROWS)
+    assert len(builder) == len(ROWS)
+    frame = builder.build()
+    assert list(frame.columns) == [
+        "station_number",
+        "formula",
+        "value",
+        "timestamp_measured",
+    ]
+    assert isinstance(frame["station_number"].dtype, pd.CategoricalDtype)
+    assert isinstance(frame["formula"].dtype, pd.CategoricalDtype)
+    assert list(frame["formula"].cat.categories) == ["H2O", "O2"]
+    assert frame["value"].tolist() == [53.0, 0.0, 12.5]
+    assert frame["timestamp_measured"].tolist() == [
+        pd.Timestamp("2024-10-19T17:00:00+00:00"),
+        pd.Timestamp("2024-10-19T17:00:00+00:00"),
+        pd.Timestamp("2024-10-19T18:00:00+00:00"),
+    ]
+
+
+def test_to_polars() -> None:
+    """Test building a polars data frame."""
+    frame = to_frame(ROWS, backend="polars")
+    assert frame.columns == ["station_number", "formula", "value", "timestamp_measured"]
+    assert frame["station_number"].dtype == pl.Categorical
+    assert frame["station_number"].to_list() == ["TESTA", "TESTA", "TESTB"]
+    assert frame["value"].to_list() == [53.0, 0.0, 12.5]
+    assert frame["timestamp_measured"].dtype == pl.Datetime("us", "UTC")
+    assert str(frame["timestamp_measured"][2]) == "2024-10-19 18:00:00+00:00"
+
+
+def test_unknown_backend() -> None:
+    """Test an error is raised for an unknown backend."""
+    with pytest.raises(LuchtmeetNetError):
+        to_frame(ROWS, backend="spark")
+
+
+@pytest.mark.parametrize(
+    ("backend", "module"), [("pandas", "pandas"), ("polars", "polars")]
+)
+def test_backend_not_installed(
+    monkeypatch: pytest.MonkeyPatch, backend: str, module: str
+) -> None:
+    """Test an error is raised when the backend is not installed."""
+    monkeypatch.setitem(sys.modules, module, None)
+    with pytest.raises(LuchtmeetNetError, match=f"{module} is required"):
+        to_frame(ROWS, backend=backend)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_empty_frame(backend: str) -> None:
+    """Test building a frame without rows."""
+    frame = to_frame([], backend=backend)
+    assert len(frame) == 0
+    assert list(frame.columns) == [
+        "station_number",
+        "formula",
+        "value",
+        "timestamp_measured",
+    ]
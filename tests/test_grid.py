@@ -0,0 +1,45 @@
+"""Tests for the station lookup grid."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from luchtmeetnetapi.cache import STATION_COORDINATES
+from luchtmeetnetapi.grid import StationGrid
+from luchtmeetnetapi.util import get_approximate_distance
+
+
+def _brute_force_distance(latitude: float, longitude: float) -> float:
+    """Get the distance to the closest station by checking all stations."""
+    return min(
+        get_approximate_distance((longitude, latitude), coordinate)
+        for coordinate in STATION_COORDINATES.values()
+    )
+
+
+def test_assign_matches_brute_force() -> None:
+    """Test the grid finds the closest station, also outside of the grid."""
+    grid = StationGrid(STATION_COORDINATES, cell_size=0.05)
+    generator = random.Random(1)  # noqa: S311
+    points = [
+        (generator.uniform(50.5, 53.8), generator.uniform(3.0, 7.5))
+        for _ in range(1000)
+    ]
+    for (latitude, longitude), station in zip(points, grid.assign(points), strict=True):
+        assert station is not None
+        assert get_approximate_distance(
+            (longitude, latitude), STATION_COORDINATES[station]
+        ) == pytest.approx(_brute_force_distance(latitude, longitude))
+
+
+def test_single_and_no_station() -> None:
+    """Test grids with a single station and without stations."""
+    assert StationGrid({"NL01491": (4.4307, 51.93858)}).closest(53.0, 6.0) == (
+        "NL01491"
+    )
+    assert StationGrid({}, cell_size=0.5).assign([(52.0, 5.0), (0.0, 0.0)]) == [
+        None,
+        None,
+    ]
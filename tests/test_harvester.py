@@ -0,0 +1,97 @@
+"""Tests for the harvester."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import multiprocessing
+
+from aioresponses import aioresponses
+import pytest
+
+from luchtmeetnetapi import harvester
+from luchtmeetnetapi.exceptions import LuchtmeetNetError
+from luchtmeetnetapi.harvester import Harvester, HarvestShard, partition
+from luchtmeetnetapi.models import MeasurementData
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+STATIONS = ["TESTA", "TESTB"]
+START = datetime(2024, 10, 1)  # noqa: DTZ001
+END = datetime(2024, 10, 15)  # noqa: DTZ001
+
+
+def _mock_shards(responses: aioresponses, shards: list[HarvestShard]) -> None:
+    """Mock the measurement responses of all shards."""
+    for shard in shards:
+        responses.get(
+            f"{MOCK_URL}/measurements?page=1&station_number={shard.station_number}"
+            f"&start={shard.start}&end={shard.end}",
+            status=200,
+            body=load_fixture("get_measurements.json").replace(
+                "TESTA", shard.station_number
+            ),
+        )
+
+
+def test_partition() -> None:
+    """Test partitioning stations and time range into shards."""
+    shards = partition(STATIONS, START, END, timedelta(days=10), "NO2")
+    assert shards == [
+        HarvestShard("TESTA", "2024-10-01T00:00:00", "2024-10-11T00:00:00", "NO2"),
+        HarvestShard("TESTA", "2024-10-11T00:00:00", "2024-10-15T00:00:00", "NO2"),
+        HarvestShard("TESTB", "2024-10-01T00:00:00", "2024-10-11T00:00:00", "NO2"),
+        HarvestShard("TESTB", "2024-10-11T00:00:00", "2024-10-15T00:00:00", "NO2"),
+    ]
+
+
+def test_merge_orders_and_deduplicates() -> None:
+    """Test merging shard results."""
+    first = MeasurementData("A", 1.0, "2024-10-01T01:00:00+00:00", "NO2")
+    second = MeasurementData("B", 2.0, "2024-10-01T01:00:00+00:00", "NO2")
+    third = MeasurementData("A", 3.0, "2024-10-01T02:00:00+00:00", "NO2")
+    assert list(harvester.merge([[first, third], [second, third]])) == [
+        first,
+        second,
+        third,
+    ]
+
+
+def test_harvest_shard(
+    responses: aioresponses,
+) -> None:
+    """Test harvesting a single shard in a worker."""
+    shard = HarvestShard("TESTA", "2024-10-01T00:00:00", "2024-10-08T00:00:00")
+    _mock_shards(responses, [shard])
+    harvester._init_worker(10.0)
+    try:
+        items = harvester._harvest_shard(shard)
+    finally:
+        harvester._close_worker()
+    assert [item.formula for item in items] == ["H2O", "O2"]
+    with pytest.raises(LuchtmeetNetError):
+        harvester._harvest_shard(shard)
+    harvester._close_worker()
+
+
+@pytest.mark.parametrize("rate_limit", [None, 100.0])
+def test_harvester_run(
+    responses: aioresponses,
+    rate_limit: float | None,
+) -> None:
+    """Test harvesting all shards with worker processes."""
+    client = Harvester(
+        STATIONS,
+        START,
+        END,
+        max_workers=2,
+        rate_limit=rate_limit,
+        mp_context=multiprocessing.get_context("fork"),
+    )
+    _mock_shards(responses, client.shards)
+    items = client.run()
+    assert [(item.station_number, item.formula) for item in items] == [
+        ("TESTA", "H2O"),
+        ("TESTA", "O2"),
+        ("TESTB", "H2O"),
+        ("TESTB", "O2"),
+    ]
@@ -0,0 +1,165 @@
+"""Tests for hedged requests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientError
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.exceptions import LuchtmeetNetConnectionError
+from luchtmeetnetapi.hedging import HedgePolicy, endpoint_of
+from luchtmeetnetapi.transport import Transport, TransportResponse
+from tests import load_fixture
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class ScriptedTransport(Transport):
+    """Transport answering each request after a scripted delay."""
+
+    def __init__(self, *steps: tuple[float, bool]) -> None:
+        """Initialize the transport with a delay and failure per request."""
+        self.steps = list(steps)
+        self.cancelled = 0
+
+    async def get(
+        self, _url: str, _params: Mapping[str, str] | None
+    ) -> TransportResponse:
+        """Answer a request."""
+        delay, fail = self.steps.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if fail:
+            raise ClientError
+        return TransportResponse(
+            200, "application/json", load_fixture("get_station.json")
+        )
+
+
+async def _get_station(
+    transport: ScriptedTransport, policy: HedgePolicy
+) -> LuchtmeetNetClient:
+    """Get a station using a transport and hedge policy."""
+    async with LuchtmeetNetClient() as client:
+        client.transport = transport
+        client.hedge_policy = policy
+        station = await client.get_station("NL01491")
+        assert station.data.organisation == "Provincie"
+        assert client.concurrency_limiter.in_flight == 0
+    return client
+
+
+def test_endpoint_of() -> None:
+    """Test identifiers are left out of endpoints."""
+    assert endpoint_of("stations") == "stations"
+    assert endpoint_of("stations/NL01491") == "stations/{}"
+    assert endpoint_of("stations/NL01491/measurements") == "stations/{}/measurements"
+
+
+def test_observed_hedge_delay() -> None:
+    """Test the hedge delay follows the observed latency quantile."""
+    policy = HedgePolicy(quantile=0.9, min_samples=5, window=10)
+    for latency in range(4):
+        policy.record("lki", latency)
+    assert policy.hedge_delay("lki") is None
+    assert policy.hedge_delay("stations") is None
+    for latency in range(4, 20):
+        policy.record("lki", latency)
+    assert policy.hedge_delay("lki") == 19
+    assert HedgePolicy(delay=0.5).hedge_delay("lki") == 0.5
+
+
+async def test_hedge_wins() -> None:
+    """Test a hedge answering first wins and the slow request is cancelled."""
+    transport = ScriptedTransport((1, False), (0, False))
+    client = await _get_station(transport, HedgePolicy(delay=0.01, max_share=1))
+    assert client.stats.hedges == 1
+    assert client.stats.hedge_wins == 1
+    assert client.stats.requests == 2
+    assert transport.cancelled == 1
+
+
+async def test_hedge_delay_does_not_shrink() -> None:
+    """Test slow requests that lose to their hedge still count for the delay."""
+    policy = HedgePolicy(quantile=0.5, max_share=1, min_samples=2, window=4)
+    policy.record("stations/{}", 0.05)
+    policy.record("stations/{}", 0.05)
+    transport = ScriptedTransport(*[(1, False), (0, False)] * 4)
+    async with LuchtmeetNetClient() as client:
+        client.transport = transport
+        client.hedge_policy = policy
+        for _ in range(4):
+            await client.get_station("NL01491")
+        assert client.stats.hedge_wins == 4
+    delay = policy.hedge_delay("stations/{}")
+    assert delay is not None
+    assert delay >= 0.05
+
+
+async def test_first_request_wins() -> None:
+    """Test the first request still wins when it answers before the hedge."""
+    transport = ScriptedTransport((0.05, False), (1, False))
+    client = await _get_station(transport, HedgePolicy(delay=0.01, max_share=1))
+    assert client.stats.hedges == 1
+    assert client.stats.hedge_wins == 0
+    assert transport.cancelled == 1
+
+
+async def test_fast_request_not_hedged() -> None:
+    """Test requests answering within the delay are not hedged."""
+    transport = ScriptedTransport((0, False))
+    client = await _get_station(transport, HedgePolicy(delay=0.5))
+    assert client.stats.hedges == 0
+    assert client.stats.requests == 1
+
+
+async def test_hedge_share_capped() -> None:
+    """Test no hedges are sent beyond the maximum share of requests."""
+    transport = ScriptedTransport((0.05, False))
+    client = await _get_station(transport, HedgePolicy(delay=0.01, max_share=0))
+    assert client.stats.hedges == 0
+
+
+async def test_no_hedge_without_samples() -> None:
+    """Test requests are not hedged before latency has been observed."""
+    transport = ScriptedTransport((0.05, False))
+    client = await _get_station(transport, HedgePolicy())
+    assert client.stats.hedges == 0
+
+
+async def test_hedge_after_failure() -> None:
+    """Test the hedge answers when the first request fails after hedging."""
+    transport = ScriptedTransport((0.05, True), (0.1, False))
+    client = await _get_station(transport, HedgePolicy(delay=0.01, max_share=1))
+    assert client.stats.hedge_wins == 1
+    assert client.stats.errors == 1
+
+
+async def test_both_requests_fail() -> None:
+    """Test the error is raised when the request and its hedge fail."""
+    transport = ScriptedTransport((0.05, True), (0.05, True))
+    async with LuchtmeetNetClient() as client:
+        client.transport = transport
+        client.hedge_policy = HedgePolicy(delay=0.01, max_share=1)
+        with pytest.raises(LuchtmeetNetConnectionError):
+            await client.get_station("NL01491")
+        assert client.stats.hedges == 1
+        assert client.concurrency_limiter.in_flight == 0
+
+
+async def test_hedge_without_free_slot() -> None:
+    """Test no hedge is sent when there is no free concurrency slot."""
+    transport = ScriptedTransport((0.05, False))
+    async with LuchtmeetNetClient() as client:
+        client.transport = transport
+        client.hedge_policy = HedgePolicy(delay=0.01, max_share=1)
+        client.concurrency_limiter.limit = 1
+        await client.get_station("NL01491")
+        assert client.stats.hedges == 0
@@ -0,0 +1,215 @@
+"""Tests for the interval-aware measurement cache."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from aioresponses import CallbackResult, aioresponses
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.interval_cache import MeasurementIntervalCache
+from luchtmeetnetapi.models import MeasurementData
+from tests import load_fixture, set_pagination
+from tests.const import MOCK_URL
+
+KEY = ("TESTA", "NO2")
+DAY = timedelta(days=1)
+START = datetime(2024, 10, 1, tzinfo=UTC)
+
+
+def _rows(station: str, first_day: int, last_day: int) -> list[MeasurementData]:
+    """Create daily measurements."""
+    return [
+        MeasurementData(station, float(day), f"2024-10-{day:02d}T00:00:00+00:00", "NO2")
+        for day in range(first_day, last_day + 1)
+    ]
+
+
+def test_missing_gaps() -> None:
+    """Test only uncovered parts of a range are missing."""
+    cache = MeasurementIntervalCache()
+    assert cache.missing(KEY, START, START + 10 * DAY) == [(START, START + 10 * DAY)]
+    cache.add(KEY, START + 2 * DAY, START + 4 * DAY, [])
+    cache.add(KEY, START + 6 * DAY, START + 7 * DAY, [])
+    cache.add(KEY, START + 12 * DAY, START + 13 * DAY, [])
+    assert cache.missing(KEY, START, START + 10 * DAY) == [
+        (START, START + 2 * DAY),
+        (START + 4 * DAY, START + 6 * DAY),
+        (START + 7 * DAY, START + 10 * DAY),
+    ]
+    assert cache.missing(KEY, START + 5 * DAY, START + 6 * DAY) == [
+        (START + 5 * DAY, START + 6 * DAY)
+    ]
+    cache.add(KEY, START + 3 * DAY, START + 6 * DAY, [])
+    assert cache.missing(KEY, START + 2 * DAY, START + 7 * DAY) == []
+
+
+def test_get_ordered_rows() -> None:
+    """Test cached rows are returned in order within the range."""
+    cache = MeasurementIntervalCache()
+    assert cache.get(KEY, START, START + 10 * DAY) == []
+    cache.add(KEY, START + 4 * DAY, START + 6 * DAY, _rows("TESTA", 5, 7))
+    cache.add(KEY, START, START + 4 * DAY, _rows("TESTA", 1, 5))
+    assert cache.rows == 7
+    assert [row.value for row in cache.get(KEY, START + DAY, START + 5 * DAY)] == [
+        2.0,
+        3.0,
+        4.0,
+        5.0,
+        6.0,
+    ]
+
+
+def test_recent_range_not_covered() -> None:
+    """Test only the settled part of a range reaching into the future is covered."""
+    cache = MeasurementIntervalCache(settle_margin=timedelta(hours=1))
+    now = datetime.now(UTC)
+    cache.add(KEY, now - DAY, now + DAY, [])
+    gaps = cache.missing(KEY, now - DAY, now + DAY)
+    assert len(gaps) == 1
+    assert now - timedelta(hours=1) <= gaps[0][0] < now - timedelta(minutes=59)
+    assert gaps[0][1] == now + DAY
+    cache.add(KEY, now - timedelta(minutes=30), now, [])
+    assert cache.missing(KEY, now - timedelta(minutes=30), now) == [
+        (now - timedelta(minutes=30), now)
+    ]
+
+
+def test_eviction() -> None:
+    """Test least recently used entries are evicted."""
+    cache = MeasurementIntervalCache(max_rows=5)
+    cache.add(("A", "NO2"), START, START + DAY, _rows("A", 1, 2))
+    cache.add(("B", "NO2"), START, START + DAY, _rows("B", 1, 2))
+    cache.get(("A", "NO2"), START, START + DAY)
+    cache.add(("C", "NO2"), START, START + DAY, _rows("C", 1, 2))
+    assert cache.rows == 4
+    assert cache.get(("B", "NO2"), START, START + DAY) == []
+    assert len(cache.get(("A", "NO2"), START, START + DAY)) == 2
+    cache.add(("D", "NO2"), START, START + 9 * DAY, _rows("D", 1, 10))
+    assert cache.rows == 10
+    cache.clear()
+    assert cache.rows == 0
+    assert cache.missing(("D", "NO2"), START, START + DAY) == [(START, START + DAY)]
+
+
+async def test_client_fetches_only_gaps(
+    responses: aioresponses,
+) -> None:
+    """Test overlapping queries only fetch the missing time range."""
+    fixture = load_fixture("get_measurements.json")
+    for start, end, timestamp in (
+        ("2024-10-05T00:00:00", "2024-10-10T00:00:00", "2024-10-06T00:00:00"),
+        ("2024-10-01T00:00:00", "2024-10-05T00:00:00", "2024-10-02T00:00:00"),
+    ):
+        responses.get(
+            f"{MOCK_URL}/measurements?page=1&station_number=TESTA&formula=H2O"
+            f"&start={start}&end={end}",
+            status=200,
+            body=fixture.replace("2024-10-19T17:00:00", timestamp).replace(
+                '"O2"', '"H2O"'
+            ),
+        )
+    async with LuchtmeetNetClient() as client:
+        client.measurement_cache = MeasurementIntervalCache()
+        week = await client.get_all_measurements(
+            start="2024-10-05T00:00:00",
+            end="2024-10-10T00:00:00",
+            station_number="TESTA",
+            formula="H2O",
+        )
+        assert [row.timestamp_measured for row in week] == ["2024-10-06T00:00:00+00:00"]
+        month = await client.get_all_measurements(
+            start="2024-10-01T00:00:00",
+            end="2024-10-10T00:00:00",
+            station_number="TESTA",
+            formula="H2O",
+        )
+        assert [row.timestamp_measured for row in month] == [
+            "2024-10-02T00:00:00+00:00",
+            "2024-10-06T00:00:00+00:00",
+        ]
+        assert client.stats.requests == 2
+
+
+async def test_client_eviction_during_fetch(
+    responses: aioresponses,
+) -> None:
+    """Test rows cached before fetching a gap are kept when evicted meanwhile."""
+    responses.get(
+        f"{MOCK_URL}/measurements?page=1&station_number=TESTA&formula=H2O"
+        "&start=2024-10-05T00:00:00&end=2024-10-10T00:00:00",
+        status=200,
+        body=load_fixture("get_measurements.json")
+        .replace("2024-10-19T17:00:00", "2024-10-06T00:00:00", 1)
+        .replace('"O2"', '"H2O"'),
+    )
+    async with LuchtmeetNetClient() as client:
+        cache = client.measurement_cache = MeasurementIntervalCache(max_rows=4)
+        cache.add(("TESTA", "H2O"), START, START + 4 * DAY, _rows("TESTA", 2, 3))
+        original_get_all = client._get_all
+
+        async def evicting_get_all(*args: Any, **kwargs: Any) -> Any:
+            cache.add(("TESTB", "H2O"), START, START + 4 * DAY, _rows("TESTB", 1, 4))
+            return await original_get_all(*args, **kwargs)
+
+        client._get_all = evicting_get_all  # type: ignore[method-assign]
+        rows = await client.get_all_measurements(
+            start="2024-10-01T00:00:00",
+            end="2024-10-10T00:00:00",
+            station_number="TESTA",
+            formula="H2O",
+        )
+    assert [row.timestamp_measured for row in rows] == [
+        "2024-10-02T00:00:00+00:00",
+        "2024-10-03T00:00:00+00:00",
+        "2024-10-06T00:00:00+00:00",
+    ]
+    assert cache.get(("TESTA", "H2O"), START, START + 10 * DAY) == rows[2:]
+
+
+async def test_client_partial_deadline_not_cached(
+    responses: aioresponses,
+) -> None:
+    """Test a gap cut short by a partial deadline is fetched again."""
+    fixture = load_fixture("get_measurements.json").replace('"O2"', '"H2O"')
+    for _ in range(2):
+        for page in (1, 2):
+            body = set_pagination(
+                page,
+                fixture.replace("2024-10-19T17:00:00", f"2024-10-0{page}T00:00:00"),
+                last_page=2,
+            )
+
+            async def respond(
+                *_args: object, body: str = body, page: int = page, **_kwargs: object
+            ) -> CallbackResult:
+                if page > 1:
+                    await asyncio.sleep(0.2)
+                return CallbackResult(status=200, body=body)
+
+            responses.get(
+                f"{MOCK_URL}/measurements?page={page}&station_number=TESTA"
+                "&formula=H2O&start=2024-10-01T00:00:00&end=2024-10-10T00:00:00",
+                callback=respond,
+            )
+    query = {
+        "start": "2024-10-01T00:00:00",
+        "end": "2024-10-10T00:00:00",
+        "station_number": "TESTA",
+        "formula": "H2O",
+    }
+    async with LuchtmeetNetClient() as client:
+        client.measurement_cache = MeasurementIntervalCache()
+        with client.deadline(0.1, partial=True) as deadline:
+            partial = await client.get_all_measurements(**query)
+        assert deadline.exceeded
+        assert [row.timestamp_measured for row in partial] == [
+            "2024-10-01T00:00:00+00:00"
+        ]
+        rows = await client.get_all_measurements(**query)
+    assert [row.timestamp_measured for row in rows] == [
+        "2024-10-01T00:00:00+00:00",
+        "2024-10-02T00:00:00+00:00",
+    ]
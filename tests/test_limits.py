@@ -0,0 +1,202 @@
+"""Tests for the request limits."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from luchtmeetnetapi.limits import (
+    REQUEST_FLOW,
+    REQUEST_PRIORITY,
+    AdaptiveConcurrencyLimiter,
+    Priority,
+    RateLimiter,
+    request_priority,
+)
+
+
+async def test_rate_limiter() -> None:
+    """Test requests are spaced evenly."""
+    limiter = RateLimiter(50)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(3):
+        await limiter.acquire()
+    assert loop.time() - started >= 0.04
+
+
+async def test_limit_increases_with_stable_latency() -> None:
+    """Test the limit grows additively while latency is stable."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+    for _ in range(20):
+        await limiter.acquire()
+        limiter.release(0.1)
+    assert limiter.current_limit == 3
+    assert limiter.in_flight == 0
+
+
+async def test_limit_holds_with_rising_latency() -> None:
+    """Test the limit does not grow while latency rises."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+    await limiter.acquire()
+    limiter.release(0.1)
+    for _ in range(5):
+        await limiter.acquire()
+        limiter.release(1.0)
+    assert limiter.current_limit == 2
+    assert limiter.baseline_latency == pytest.approx(0.1 + 0.9 * (1 - 0.99**5))
+
+
+async def test_limit_backs_off_on_overload() -> None:
+    """Test the limit is reduced multiplicatively on overload."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2)
+    await limiter.acquire()
+    limiter.release(0.1, overloaded=True)
+    assert limiter.current_limit == 4
+    for _ in range(3):
+        await limiter.acquire()
+        limiter.release(None, overloaded=True)
+    assert limiter.current_limit == 2
+    await limiter.acquire()
+    limiter.release(None)
+    assert limiter.current_limit == 2
+
+
+async def test_waiting_requests() -> None:
+    """Test requests wait for a free slot in order."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    started: list[int] = []
+
+    async def request(number: int) -> None:
+        await limiter.acquire()
+        started.append(number)
+
+    tasks = [asyncio.create_task(request(number)) for number in range(3)]
+    await asyncio.sleep(0)
+    assert started == []
+    cancelled = tasks.pop(1)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    limiter.release(0.1)
+    await asyncio.sleep(0)
+    assert started == [0]
+    limiter.release(0.1)
+    await asyncio.gather(*tasks)
+    assert started == [0, 2]
+    assert limiter.in_flight == 1
+
+
+async def test_cancel_after_slot_handed_over() -> None:
+    """Test a slot handed to a cancelled request is passed on."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.release(0.1)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await second
+    assert limiter.in_flight == 1
+
+
+async def test_cancel_before_slot_handed_over() -> None:
+    """Test a waiter cancelled before wake up is skipped."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    first.cancel()
+    limiter.release(0.1)
+    await second
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert limiter.in_flight == 1
+
+
+async def test_interactive_requests_skip_ahead() -> None:
+    """Test interactive requests start before waiting bulk requests."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    started: list[str] = []
+
+    async def request(name: str, priority: Priority) -> None:
+        with request_priority(priority):
+            await limiter.acquire()
+        started.append(name)
+
+    # Bulk requests leave one slot free for interactive requests.
+    await request("bulk 0", Priority.BULK)
+    bulk = [
+        asyncio.create_task(request(f"bulk {number}", Priority.BULK))
+        for number in range(1, 3)
+    ]
+    await asyncio.sleep(0)
+    assert started == ["bulk 0"]
+    await request("interactive 0", Priority.INTERACTIVE)
+    interactive = asyncio.create_task(request("interactive 1", Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+    limiter.release(0.1)
+    await asyncio.sleep(0)
+    assert started == ["bulk 0", "interactive 0", "interactive 1"]
+    # Bulk requests start one at a time, in the slot left by the reserve.
+    limiter.release(0.1)
+    limiter.release(0.1)
+    await asyncio.sleep(0)
+    assert started[3:] == ["bulk 1"]
+    limiter.release(0.1)
+    await asyncio.gather(interactive, *bulk)
+    assert started[3:] == ["bulk 1", "bulk 2"]
+    assert REQUEST_PRIORITY.get() is None
+
+
+async def test_cancelled_waiter_at_front() -> None:
+    """Test a cancelled waiter at the front does not block other requests."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire(Priority.INTERACTIVE))
+    second = asyncio.create_task(limiter.acquire(Priority.BULK))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    limiter.release(0.1)
+    await second
+    assert limiter.in_flight == 1
+
+
+async def test_cancelled_waiter_does_not_block_fast_path() -> None:
+    """Test a request starts right away when only cancelled requests wait."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.in_flight = 0
+    waiting.cancel()
+    await limiter.acquire()
+    assert limiter.in_flight == 1
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+
+async def test_flows_take_turns() -> None:
+    """Test waiting flows of the same priority take turns."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    started: list[str] = []
+
+    async def request(name: str, flow: str) -> None:
+        REQUEST_FLOW.set(flow)
+        await limiter.acquire()
+        started.append(name)
+        limiter.release(0.1)
+
+    tasks = [asyncio.create_task(request(f"a{number}", "a")) for number in range(3)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(request(f"b{number}", "b")) for number in range(2)]
+    await asyncio.sleep(0)
+    limiter.release(0.1)
+    await asyncio.gather(*tasks)
+    assert started == ["a0", "b0", "a1", "b1", "a2"]
@@ -0,0 +1,78 @@
+"""Tests for the load test harness."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import threading
+
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient, loadtest
+from luchtmeetnetapi.exceptions import LuchtmeetNetConnectionError
+from luchtmeetnetapi.loadtest import StandInServer, main, run_load_test
+
+
+async def test_run_load_test() -> None:
+    """Test every step reports its calls."""
+    results = await run_load_test([1, 20], duration=0.1, latency=0.001)
+    assert [result.callers for result in results] == [1, 20]
+    for result in results:
+        assert result.requests > 0
+        assert result.errors == 0
+        assert result.throughput > 0
+        assert 0 < result.latency_p50 <= result.latency_p95 <= result.latency_p99
+        assert result.loop_lag_max >= result.loop_lag_p99
+        assert result.max_rss is not None
+        assert result.max_rss > 0
+
+
+async def test_memory_unsupported(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test memory is not reported where resident memory is unknown."""
+    monkeypatch.setattr(loadtest, "STATM_PATH", Path("/nonexistent/statm"))
+    results = await run_load_test([1], duration=0.05, latency=0)
+    assert results[0].max_rss is None
+
+
+async def test_errors_counted() -> None:
+    """Test failing calls are counted as errors."""
+    async with LuchtmeetNetClient() as client:
+        client.request_timeout = 0
+        results = await run_load_test(
+            [2], duration=0.05, latency=0.01, jitter=0.01, client=client
+        )
+        assert results[0].errors == results[0].requests
+        assert results[0].latency_p99 == 0
+
+
+async def test_stand_in_server() -> None:
+    """Test the stand-in server answers known endpoints only."""
+    server = StandInServer(latency=0)
+    url = await server.start()
+    async with LuchtmeetNetClient() as client:
+        client.endpoint = url
+        station = await client.get_station("NL01491")
+        assert station.data.organisation == "DCMR"
+        with pytest.raises(LuchtmeetNetConnectionError):
+            await client.get_component("NO2")
+    await server.stop()
+    await server.stop()
+    assert not any(thread.name == "stand-in-server" for thread in threading.enumerate())
+
+
+async def test_station_operation() -> None:
+    """Test load testing another operation."""
+    results = await run_load_test([1], duration=0.05, latency=0, operation="station")
+    assert results[0].requests > 0
+
+
+def test_main() -> None:
+    """Test the results are printed as a table."""
+    stream = io.StringIO()
+    assert (
+        main(["--callers", "1", "2", "--duration", "0.05", "--latency", "0"], stream)
+        == 0
+    )
+    lines = stream.getvalue().splitlines()
+    assert lines[0].split()[:3] == ["callers", "requests", "errors"]
+    assert [line.split()[0] for line in lines[1:]] == ["1", "2"]
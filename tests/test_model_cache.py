@@ -0,0 +1,85 @@
+"""Tests for the model cache."""
+
+from __future__ import annotations
+
+from aioresponses import aioresponses
+import pytest
+
+from luchtmeetnetapi.api import LuchtmeetNetApi
+from luchtmeetnetapi.model_cache import ModelCache, ModelCacheStats
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+
+def test_entry_bound() -> None:
+    """Test the least recently used model is evicted."""
+    cache = ModelCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    assert cache.stats == ModelCacheStats(hits=3, misses=1, evictions=1)
+
+
+def test_byte_bound() -> None:
+    """Test models are evicted to stay within the byte bound."""
+    cache = ModelCache(max_bytes=100, ttl=None)
+    cache.set("a", 1, 60)
+    cache.set("a", 2, 40)
+    cache.set("b", 3, 50)
+    assert cache.bytes == 90
+    cache.set("c", 4, 30)
+    assert cache.get("a") is None
+    assert cache.bytes == 80
+    cache.set("d", 5, 200)
+    assert len(cache) == 1
+    assert cache.bytes == 200
+    assert cache.stats.evictions == 3
+
+
+def test_ttl_and_invalidate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test models expire and can be invalidated."""
+    now = 1000.0
+    monkeypatch.setattr("luchtmeetnetapi.model_cache.time.monotonic", lambda: now)
+    cache = ModelCache(ttl=10)
+    cache.set("a", 1, 10)
+    cache.set("b", 2, 10)
+    cache.set("c", 3, 10)
+    now += 10
+    assert cache.get("a") is None
+    assert cache.bytes == 20
+    cache.invalidate("b")
+    cache.invalidate("b")
+    assert cache.bytes == 10
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+async def test_api_model_cache(responses: aioresponses) -> None:
+    """Test stations and components are served from the model cache."""
+    responses.get(
+        f"{MOCK_URL}/stations/TESTA",
+        status=200,
+        body=load_fixture("get_station.json"),
+    )
+    responses.get(
+        f"{MOCK_URL}/components/H2O",
+        status=200,
+        body=load_fixture("get_component.json"),
+    )
+    async with LuchtmeetNetApi() as client:
+        client.model_cache = ModelCache()
+        station = await client.get_station("TESTA")
+        assert await client.get_station("TESTA") is station
+        component = await client.get_component("H2O")
+        assert await client.get_component("H2O") is component
+        assert client.stats.requests == 2
+        assert client.model_cache.stats == ModelCacheStats(hits=2, misses=2)
+        assert client.model_cache.bytes == len(load_fixture("get_station.json")) + len(
+            load_fixture("get_component.json")
+        )
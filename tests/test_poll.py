@@ -0,0 +1,95 @@
+"""Tests for polling reference data."""
+
+from __future__ import annotations
+
+from aioresponses import aioresponses
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from tests import FIRST_PAGE, LAST_PAGE, load_fixture, set_pagination
+from tests.const import MOCK_URL
+
+
+def _mock_station_pages(
+    responses: aioresponses, fixture: str, last_fixture: str | None = None
+) -> None:
+    """Mock all station pages once, with another fixture for the last page."""
+    for page in range(FIRST_PAGE, LAST_PAGE + 1):
+        body = fixture if page < LAST_PAGE or last_fixture is None else last_fixture
+        responses.get(
+            f"{MOCK_URL}/stations?page={page}",
+            status=200,
+            body=set_pagination(page, body),
+        )
+
+
+async def test_poll_all_stations(
+    responses: aioresponses,
+) -> None:
+    """Test unchanged pages are reused and reported as unchanged."""
+    fixture = load_fixture("get_stations.json")
+    _mock_station_pages(responses, fixture)
+    _mock_station_pages(responses, fixture)
+    _mock_station_pages(responses, fixture, fixture.replace("NL01491", "NL01490"))
+    async with LuchtmeetNetClient() as client:
+        first = await client.poll_all_stations()
+        assert first.changed
+        second = await client.poll_all_stations()
+        assert not second.changed
+        assert second.data == first.data
+        assert all(new is old for new, old in zip(second.data, first.data, strict=True))
+        third = await client.poll_all_stations()
+        assert third.changed
+        assert third.data[0] is first.data[0]
+        assert [station.number for station in third.data[-2:]] == [
+            "NL01490",
+            "NL01497",
+        ]
+
+
+async def test_poll_fewer_pages(
+    responses: aioresponses,
+) -> None:
+    """Test a poll with fewer pages than the last one is reported as changed."""
+    fixture = load_fixture("get_components.json")
+    for page in range(FIRST_PAGE, LAST_PAGE + 1):
+        responses.get(
+            f"{MOCK_URL}/components?page={page}",
+            status=200,
+            body=set_pagination(page, fixture),
+        )
+    responses.get(
+        f"{MOCK_URL}/components?page=1",
+        status=200,
+        body=set_pagination(FIRST_PAGE, fixture, last_page=FIRST_PAGE),
+    )
+    async with LuchtmeetNetClient() as client:
+        assert (await client.poll_all_components()).changed
+        assert (await client.poll_all_components()).changed
+
+
+async def test_poll_all_organisations(
+    responses: aioresponses,
+) -> None:
+    """Test polling organisations."""
+    responses.get(
+        f"{MOCK_URL}/organisations?page=1",
+        status=200,
+        body=load_fixture("get_organisations.json"),
+        repeat=True,
+    )
+    async with LuchtmeetNetClient() as client:
+        assert (await client.poll_all_organisations()).changed
+        assert not (await client.poll_all_organisations()).changed
+
+
+async def test_poll_partial_result(
+    responses: aioresponses,
+) -> None:
+    """Test a poll cut short by a partial deadline counts as changed."""
+    _mock_station_pages(responses, load_fixture("get_stations.json"))
+    async with LuchtmeetNetClient() as client:
+        assert (await client.poll_all_stations()).changed
+        with client.deadline(0, partial=True):
+            result = await client.poll_all_stations()
+        assert result.changed
+        assert result.data == []
@@ -0,0 +1,43 @@
+"""Tests for the projection decoding."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from luchtmeetnetapi.models import Components, Measurements
+from luchtmeetnetapi.projection import decode_page, project
+from tests import load_fixture
+
+
+class Reading(NamedTuple):
+    """Measurement row used in the tests."""
+
+    station_number: str
+    value: float
+
+
+def test_decode_page_matches_models() -> None:
+    """Test the projected rows match the fields of the models."""
+    text = load_fixture("get_measurements.json")
+    page = decode_page(text, ("station_number", "formula", "value"))
+    expected = Measurements.from_json(text)
+    assert page.pagination == expected.pagination
+    assert page.data == [
+        (item.station_number, item.formula, item.value) for item in expected.data
+    ]
+
+
+def test_decode_page_nested_fields() -> None:
+    """Test projecting nested fields."""
+    text = load_fixture("get_components.json")
+    page = decode_page(text, ("formula", "name.EN"))
+    assert page.data == [
+        (item.formula, item.name.EN) for item in Components.from_json(text).data
+    ]
+
+
+def test_project_single_field_and_row_type() -> None:
+    """Test projecting a single field and into a NamedTuple."""
+    rows = [{"station_number": "TESTA", "value": 53.0, "formula": "H2O"}]
+    assert project(rows, ("value",)) == [(53.0,)]
+    assert project(rows, Reading._fields, Reading) == [Reading("TESTA", 53.0)]
@@ -11,6 +11,7 @@ import pytest
 
 from luchtmeetnetapi.api import LuchtmeetNetApi
 from luchtmeetnetapi.exceptions import LuchtmeetNetConnectionError
+from tests import load_fixture
 from tests.const import MOCK_URL
 
 
@@ -80,3 +81,34 @@ async def test_client_error(
     with pytest.raises(LuchtmeetNetConnectionError):
         async with LuchtmeetNetApi() as client:
             await client.get_stations()
+
+
+async def test_rate_limit(
+    responses: aioresponses,
+) -> None:
+    """Test requests are spaced according to the rate limit."""
+    responses.get(
+        f"{MOCK_URL}/stations?page=1",
+        status=200,
+        body=load_fixture("get_stations.json"),
+        repeat=True,
+    )
+    async with LuchtmeetNetApi() as client:
+        client.rate_limit = 20
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(client.get_stations() for _ in range(3)))
+        assert loop.time() - started >= 0.1
+
+
+async def test_concurrency_limit_backs_off(
+    responses: aioresponses,
+) -> None:
+    """Test server errors reduce the concurrency limit."""
+    responses.get(f"{MOCK_URL}/stations?page=1", status=503)
+    async with LuchtmeetNetApi() as client:
+        initial_limit = client.stats.concurrency_limit
+        with pytest.raises(LuchtmeetNetConnectionError):
+            await client.get_stations()
+        assert client.stats.concurrency_limit == initial_limit // 2
+        assert client.stats.errors == 1
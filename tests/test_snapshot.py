@@ -0,0 +1,99 @@
+"""Tests for network snapshots."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import re
+import sys
+
+from aioresponses import aioresponses
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.snapshot import NetworkSnapshot, build_snapshot
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+MEASUREMENTS = [
+    ("NL01491", "NO2", 20.0, "2024-10-19T16:00:00+00:00"),
+    ("NL01491", "NO2", 25.0, "2024-10-19T17:00:00+00:00"),
+    ("NL01491", "NO2", 15.0, "2024-10-19T15:00:00+00:00"),
+    ("NL01497", "PM10", 10.0, "2024-10-19T17:00:00"),
+]
+LKI = [
+    ("NL01491", 3.0, "2024-10-19T17:00:00+00:00"),
+    ("NL01491", 2.0, "2024-10-19T16:00:00+00:00"),
+    ("NL10131", 5.0, "2024-10-19T17:00:00+00:00"),
+]
+MEASURED = datetime(2024, 10, 19, 17, tzinfo=UTC)
+
+
+def _snapshot() -> NetworkSnapshot:
+    """Build a snapshot of two listed stations."""
+    return build_snapshot(["NL01491", "NL49002"], MEASUREMENTS, LKI)
+
+
+def test_build_snapshot() -> None:
+    """Test the latest value of every cell is kept."""
+    snapshot = _snapshot()
+    assert snapshot.stations == ["NL01491", "NL49002", "NL01497", "NL10131"]
+    assert snapshot.formulas == ["NO2", "PM10"]
+    assert list(snapshot.mask) == [1, 0, 0, 0, 0, 1, 0, 0]
+    assert snapshot.value("NL01491", "NO2") == 25
+    assert snapshot.timestamp("NL01491", "NO2") == MEASURED
+    assert snapshot.value("NL01491", "PM10") is None
+    assert snapshot.timestamp("NL01491", "PM10") is None
+    assert snapshot.value("NL00000", "NO2") is None
+    assert snapshot.station("NL01497") == {"PM10": 10}
+    assert snapshot.station("NL00000") == {}
+    assert snapshot.station_lki("NL01491") == (3, MEASURED)
+    assert snapshot.station_lki("NL10131") == (5, MEASURED)
+    assert snapshot.station_lki("NL49002") is None
+
+
+def test_serialize_snapshot() -> None:
+    """Test a snapshot survives serialization."""
+    snapshot = _snapshot()
+    restored = NetworkSnapshot.from_bytes(snapshot.to_bytes())
+    assert restored == snapshot
+    assert restored.station("NL01491") == {"NO2": 25}
+
+
+def test_deserialize_other_byteorder(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test arrays are swapped when serialized on a host of another byte order."""
+    snapshot = _snapshot()
+    other = "big" if sys.byteorder == "little" else "little"
+    monkeypatch.setattr("luchtmeetnetapi.snapshot.sys.byteorder", other)
+    data = snapshot.to_bytes()
+    monkeypatch.undo()
+    restored = NetworkSnapshot.from_bytes(data)
+    restored.readings.byteswap()
+    assert restored.readings == snapshot.readings
+
+
+async def test_get_network_snapshot(
+    responses: aioresponses,
+) -> None:
+    """Test the snapshot is built from bulk queries."""
+    responses.get(
+        f"{MOCK_URL}/stations?page=1",
+        status=200,
+        body=load_fixture("get_stations.json"),
+    )
+    responses.get(
+        re.compile(rf"{re.escape(MOCK_URL)}/measurements\?page=1&start=.*$"),
+        status=200,
+        body=load_fixture("get_measurements.json"),
+    )
+    responses.get(
+        re.compile(rf"{re.escape(MOCK_URL)}/lki\?page=1&start=.*$"),
+        status=200,
+        body=load_fixture("get_lki.json"),
+    )
+    async with LuchtmeetNetClient() as client:
+        snapshot = await client.get_network_snapshot()
+    assert snapshot.stations == ["NL01491", "NL01497", "TESTA"]
+    assert snapshot.station("TESTA") == {"H2O": 53, "O2": 0}
+    lki = snapshot.station_lki("TESTA")
+    assert lki is not None
+    assert lki[0] == 4
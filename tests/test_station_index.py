@@ -0,0 +1,96 @@
+"""Tests for the station index."""
+
+from __future__ import annotations
+
+from aioresponses import aioresponses
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.station_index import StationIndex
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+# NL01491 only measures H2O, NL01497 measures H2O and O2
+STATIONS = {
+    "NL01491": ("[4.4307, 51.93858]", '["H2O"]'),
+    "NL01497": ("[3.99972, 51.933517]", '["H2O", "O2"]'),
+}
+
+
+def _mock_stations(responses: aioresponses) -> None:
+    """Mock the station list and the details of each station."""
+    responses.get(
+        f"{MOCK_URL}/stations?page=1",
+        status=200,
+        body=load_fixture("get_stations.json"),
+        repeat=True,
+    )
+    fixture = load_fixture("get_station.json")
+    for number, (coordinates, components) in STATIONS.items():
+        body = fixture.replace(
+            "[\n                5.6462,\n                52.1009\n            ]",
+            coordinates,
+        ).replace('[\n            "H2O",\n            "O2"\n        ]', components)
+        responses.get(
+            f"{MOCK_URL}/stations/{number}", status=200, body=body, repeat=True
+        )
+
+
+async def test_station_index(
+    responses: aioresponses,
+) -> None:
+    """Test nearest station queries are served from memory after warm up."""
+    _mock_stations(responses)
+    async with LuchtmeetNetClient() as client:
+        index = StationIndex(client)
+        assert index.expired
+        await index.ensure_fresh()
+        await index.ensure_fresh()
+        assert not index.expired
+        assert client.stats.requests == 3
+        assert index.stations["NL01497"].coordinate == (3.99972, 51.933517)
+        assert index.measuring("H2O") == ["NL01491", "NL01497"]
+        assert index.measuring("NO2") == []
+        nearest = index.nearest(51.93858, 4.4307)
+        assert [number for number, _ in nearest] == ["NL01491", "NL01497"]
+        assert nearest[0][1] == 0
+        assert nearest[1][1] == pytest.approx(29.6, abs=0.1)
+        assert index.closest(51.93858, 4.4307, formula="O2") == "NL01497"
+        assert index.closest(51.93858, 4.4307, formula="O2", max_distance=10) is None
+        assert index.closest(51.93858, 4.4307, formula="NO2") is None
+        assert client.stats.requests == 3
+
+
+async def test_get_closest_station_by_formula(
+    responses: aioresponses,
+) -> None:
+    """Test the closest station measuring a component is returned."""
+    _mock_stations(responses)
+    async with LuchtmeetNetClient() as client:
+        assert await client.get_closest_station(51.93858, 4.4307) == "NL01491"
+        assert (
+            await client.get_closest_station(51.93858, 4.4307, formula="O2")
+            == "NL01497"
+        )
+        assert await client.get_closest_station(52.5, 4.4307, max_distance=20) is None
+        assert client.stats.requests == 4
+
+
+async def test_assign_stations(
+    responses: aioresponses,
+) -> None:
+    """Test assigning points to stations with a reused grid."""
+    _mock_stations(responses)
+    async with LuchtmeetNetClient() as client:
+        points = [(51.93858, 4.4307), (51.9, 3.9), (60.0, 10.0)]
+        assert await client.assign_stations(points) == [
+            "NL01491",
+            "NL01497",
+            "NL01491",
+        ]
+        assert await client.assign_stations(points, formula="O2") == ["NL01497"] * 3
+        assert client.station_index is not None
+        grid = await client.station_index.grid("O2")
+        assert await client.station_index.grid("O2") is grid
+        assert await client.assign_stations([], formula="NO2") == []
+        assert client.stats.requests == 3
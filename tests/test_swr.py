@@ -0,0 +1,178 @@
+"""Tests for stale-while-revalidate serving of latest values."""
+
+from __future__ import annotations
+
+import asyncio
+
+from aioresponses import aioresponses
+import orjson
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.deadline import deadline
+from luchtmeetnetapi.exceptions import LuchtmeetNetDeadlineError
+from luchtmeetnetapi.swr import StaleCacheStats, StaleWhileRevalidateCache
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+STATION_ID = "TESTA"
+
+
+class Source:
+    """Source of values, counting and optionally failing or delaying fetches."""
+
+    def __init__(self, delay: float = 0) -> None:
+        """Initialize the source."""
+        self.delay = delay
+        self.fetches = 0
+        self.fail = False
+
+    async def fetch(self) -> int:
+        """Fetch the next value."""
+        self.fetches += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            msg = "Upstream failed"
+            raise RuntimeError(msg)
+        return self.fetches
+
+
+async def test_fresh_value() -> None:
+    """Test fresh values are returned without fetching."""
+    source = Source()
+    cache = StaleWhileRevalidateCache(fresh_for=60)
+    assert await cache.get("key", source.fetch) == 1
+    assert await cache.get("key", source.fetch) == 1
+    assert source.fetches == 1
+    assert cache.stats == StaleCacheStats(fresh_hits=1, misses=1, refreshes=1)
+
+
+async def test_stale_value_refreshed_once() -> None:
+    """Test stale values are returned at once and refreshed in the background."""
+    source = Source(delay=0.01)
+    cache = StaleWhileRevalidateCache(fresh_for=0, max_stale=60)
+    assert await cache.get("key", source.fetch) == 1
+    results = await asyncio.gather(*(cache.get("key", source.fetch) for _ in range(5)))
+    assert results == [1] * 5
+    assert source.fetches == 2
+    await asyncio.sleep(0.05)
+    assert await cache.get("key", source.fetch) == 2
+    assert cache.stats.stale_hits == 6
+
+
+async def test_missing_value_single_flight() -> None:
+    """Test concurrent callers of a missing value share one fetch."""
+    source = Source(delay=0.01)
+    cache = StaleWhileRevalidateCache(fresh_for=0, max_stale=0)
+    results = await asyncio.gather(*(cache.get("key", source.fetch) for _ in range(5)))
+    assert results == [1] * 5
+    assert source.fetches == 1
+    assert await cache.get("key", source.fetch) == 2
+
+
+async def test_failed_refresh_keeps_value() -> None:
+    """Test a failed background refresh keeps serving the stale value."""
+    source = Source()
+    cache = StaleWhileRevalidateCache(fresh_for=0, max_stale=60)
+    assert await cache.get("key", source.fetch) == 1
+    source.fail = True
+    assert await cache.get("key", source.fetch) == 1
+    await asyncio.sleep(0.01)
+    assert cache.stats.refresh_errors == 1
+    cache.invalidate("key")
+    with pytest.raises(RuntimeError):
+        await cache.get("key", source.fetch)
+    assert cache.stats.refresh_errors == 2
+
+
+async def test_cancelled_caller() -> None:
+    """Test a cancelled caller does not cancel the fetch of other callers."""
+    source = Source(delay=0.05)
+    cache = StaleWhileRevalidateCache()
+    first = asyncio.create_task(cache.get("key", source.fetch))
+    second = asyncio.create_task(cache.get("key", source.fetch))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == 1
+    assert first.cancelled()
+
+
+async def test_missing_value_deadline() -> None:
+    """Test a caller waiting for a missing value gives up at its deadline."""
+    source = Source(delay=0.2)
+    cache = StaleWhileRevalidateCache()
+    with pytest.raises(LuchtmeetNetDeadlineError), deadline(0.05):
+        await cache.get("key", source.fetch)
+    assert await cache.get("key", source.fetch) == 1
+    assert source.fetches == 1
+
+
+async def test_close() -> None:
+    """Test closing cancels running refreshes."""
+    source = Source(delay=1)
+    cache = StaleWhileRevalidateCache()
+    task = asyncio.create_task(cache.get("key", source.fetch))
+    await asyncio.sleep(0.01)
+    cache.close()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cache.stats.refresh_errors == 0
+
+
+async def test_max_entries() -> None:
+    """Test the least recently refreshed values are removed first."""
+    source = Source()
+    cache = StaleWhileRevalidateCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        await cache.get(key, source.fetch)
+    assert await cache.get("b", source.fetch) == 2
+    assert await cache.get("a", source.fetch) == 4
+    cache.invalidate()
+    assert await cache.get("c", source.fetch) == 5
+
+
+async def test_get_latest_station_measurements(
+    responses: aioresponses,
+) -> None:
+    """Test the latest measurements are served from the latest cache."""
+    page = orjson.loads(load_fixture("get_station_measurements.json"))
+    page["data"].append(
+        {"value": 50.0, "formula": "H2O", "timestamp_measured": "2024-10-19T16:00:00"}
+    )
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}/measurements"
+        "?page=1&order=timestamp_measured&order_direction=desc",
+        status=200,
+        body=orjson.dumps(page).decode(),
+    )
+    async with LuchtmeetNetClient() as client:
+        client.latest_cache = StaleWhileRevalidateCache()
+        for _ in range(2):
+            latest = await client.get_latest_station_measurements(STATION_ID)
+            assert [(item.formula, item.value) for item in latest] == [
+                ("H2O", 53.0),
+                ("O2", 0.0),
+            ]
+        assert client.stats.requests == 1
+
+
+async def test_get_latest_lki(
+    responses: aioresponses,
+) -> None:
+    """Test the latest LKI of a station is returned."""
+    url = (
+        f"{MOCK_URL}/lki?station_number={STATION_ID}&page=1"
+        "&order_by=timestamp_measured&order_direction=desc"
+    )
+    responses.get(url, status=200, body=load_fixture("get_lki.json"))
+    empty = orjson.loads(load_fixture("get_lki.json"))
+    empty["data"] = []
+    responses.get(url, status=200, body=orjson.dumps(empty).decode())
+    async with LuchtmeetNetClient() as client:
+        latest = await client.get_latest_lki(STATION_ID)
+        assert latest is not None
+        assert (latest.timestamp_measured, latest.value) == (
+            "2024-10-12T22:00:00+00:00",
+            4,
+        )
+        assert await client.get_latest_lki(STATION_ID) is None
@@ -0,0 +1,129 @@
+"""Tests for the sync client methods."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from aiohttp.hdrs import METH_GET
+from aioresponses import aioresponses
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient, LuchtmeetNetSyncClient
+from luchtmeetnetapi.exceptions import LuchtmeetNetError
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+STATION_ID = "TESTA"
+
+
+def test_get_station(
+    responses: aioresponses,
+) -> None:
+    """Test retrieving a station with a blocking call."""
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}",
+        status=200,
+        body=load_fixture("get_station.json"),
+    )
+    with LuchtmeetNetSyncClient() as client:
+        station = client.get_station(STATION_ID)
+        assert station.data.location == "Nederland"
+        responses.assert_called_once_with(
+            f"{MOCK_URL}/stations/{STATION_ID}", METH_GET, params=None
+        )
+    assert client.client.session is None
+
+
+def test_concurrent_calls_share_session(
+    responses: aioresponses,
+) -> None:
+    """Test calls from many threads share one loop and session."""
+    responses.get(
+        f"{MOCK_URL}/stations?page=1",
+        status=200,
+        body=load_fixture("get_stations.json"),
+        repeat=True,
+    )
+    with LuchtmeetNetSyncClient() as client:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: client.get_all_stations(), range(16)))
+        session = client.client.session
+        assert session is not None
+        assert client.get_all_stations() == results[0]
+        assert client.client.session is session
+    assert all(result == results[0] for result in results)
+
+
+def test_get_all_station_rows(
+    responses: aioresponses,
+) -> None:
+    """Test retrieving projected rows with a blocking call."""
+    responses.get(
+        f"{MOCK_URL}/stations?page=1",
+        status=200,
+        body=load_fixture("get_stations.json"),
+    )
+    with LuchtmeetNetSyncClient() as client:
+        assert client.get_all_station_rows(("number",)) == [
+            ("NL01491",),
+            ("NL01497",),
+        ]
+
+
+def test_get_all_measurements_frame(
+    responses: aioresponses,
+) -> None:
+    """Test retrieving a data frame with a blocking call."""
+    pytest.importorskip("pandas")
+    responses.get(
+        f"{MOCK_URL}/measurements?page=1",
+        status=200,
+        body=load_fixture("get_measurements.json"),
+    )
+    with LuchtmeetNetSyncClient() as client:
+        frame = client.get_all_measurements_frame()
+    assert frame["formula"].tolist() == ["H2O", "O2"]
+
+
+def test_blocking_call_from_event_loop() -> None:
+    """Test blocking calls are rejected on the client event loop."""
+
+    class NestedClient(LuchtmeetNetClient):
+        """Client calling back into the sync client."""
+
+        sync_client: LuchtmeetNetSyncClient
+
+        async def get_all_stations(self, organisation_id: str | None = None) -> Any:
+            """Call a blocking method from the loop."""
+            return self.sync_client.get_stations(organisation_id=organisation_id)
+
+    nested = NestedClient()
+    with LuchtmeetNetSyncClient(nested) as client:
+        nested.sync_client = client
+        with pytest.raises(LuchtmeetNetError):
+            client.get_all_stations()
+
+
+def test_close_without_start() -> None:
+    """Test closing a client that never ran a call."""
+    client = LuchtmeetNetSyncClient()
+    client.close()
+    client.close()
+
+
+def test_call_after_close(
+    responses: aioresponses,
+) -> None:
+    """Test calls are rejected once the client is closed."""
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}",
+        status=200,
+        body=load_fixture("get_station.json"),
+    )
+    client = LuchtmeetNetSyncClient()
+    client.client.rate_limit = 100
+    client.get_station(STATION_ID)
+    client.close()
+    with pytest.raises(LuchtmeetNetError, match="closed"):
+        client.get_station(STATION_ID)
@@ -0,0 +1,118 @@
+"""Tests for the request transports."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from aioresponses import aioresponses
+import pytest
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from luchtmeetnetapi.exceptions import LuchtmeetNetConnectionError
+from luchtmeetnetapi.transport import (
+    AiohttpTransport,
+    RecordingTransport,
+    ReplayTransport,
+)
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+STATION_ID = "TESTA"
+
+
+async def _record(responses: aioresponses, cassette: Path) -> None:
+    """Record a cassette with a station and the station list."""
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}",
+        status=200,
+        body=load_fixture("get_station.json"),
+    )
+    responses.get(
+        f"{MOCK_URL}/stations?page=1",
+        status=200,
+        body=load_fixture("get_stations.json"),
+    )
+    responses.get(f"{MOCK_URL}/stations?page=1", status=500, body="Oops")
+    async with LuchtmeetNetClient() as client:
+        client.transport = RecordingTransport(cassette)
+        await client.get_station(STATION_ID)
+        await client.get_stations()
+        with pytest.raises(LuchtmeetNetConnectionError):
+            await client.get_stations()
+
+
+async def test_record_and_replay(
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test replaying recorded responses without network access."""
+    cassette = tmp_path / "cassette.jsonl.gz"
+    await _record(responses, cassette)
+    responses.clear()
+
+    async with LuchtmeetNetClient() as client:
+        client.transport = ReplayTransport(cassette)
+        station = await client.get_station(STATION_ID)
+        assert station.data.location == "Nederland"
+        stations = await client.get_stations()
+        assert [station.number for station in stations.data] == ["NL01491", "NL01497"]
+        for _ in range(2):
+            with pytest.raises(LuchtmeetNetConnectionError):
+                await client.get_stations()
+        with pytest.raises(LuchtmeetNetConnectionError):
+            await client.get_station("UNKNOWN")
+        assert client.session is None
+
+
+async def test_replay_with_latency(
+    responses: aioresponses,
+    tmp_path: Path,
+) -> None:
+    """Test replaying with scaled recorded latency."""
+
+    async def delayed_callback(*_args: object, **_kwargs: object) -> None:
+        """Delay the recorded response."""
+        await asyncio.sleep(0.05)
+
+    cassette = tmp_path / "cassette.jsonl.gz"
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}",
+        status=200,
+        body=load_fixture("get_station.json"),
+        callback=delayed_callback,
+    )
+    transport = RecordingTransport(cassette, AiohttpTransport())
+    async with LuchtmeetNetClient() as client:
+        client.transport = transport
+        await client.get_station(STATION_ID)
+    assert transport.recordings[0].elapsed >= 0.05
+
+    async with LuchtmeetNetClient() as client:
+        client.transport = ReplayTransport(cassette, latency_scale=2)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await client.get_station(STATION_ID)
+        assert loop.time() - started >= 0.1
+
+
+async def test_transport_with_external_session(
+    responses: aioresponses,
+) -> None:
+    """Test a session given to the transport is not closed."""
+    responses.get(
+        f"{MOCK_URL}/stations/{STATION_ID}",
+        status=200,
+        body=load_fixture("get_station.json"),
+    )
+    async with LuchtmeetNetClient() as client:
+        client.transport = AiohttpTransport()
+        await client.get_station(STATION_ID)
+        session = client.transport.session
+        assert session is not None
+        external = AiohttpTransport(session)
+        await external.close()
+        assert not session.closed
@@ -1,8 +1,14 @@
 """Tests for the util methods."""
 
+from datetime import UTC, datetime
+
 import pytest
 
-from luchtmeetnetapi.util import get_approximate_distance
+from luchtmeetnetapi.util import (
+    format_timestamp,
+    get_approximate_distance,
+    parse_timestamp,
+)
 
 
 def test_approximate_distance_calculation() -> None:
@@ -13,3 +19,19 @@ def test_approximate_distance_calculation() -> None:
     assert get_approximate_distance(
         (5.5433281, 51.69818779), (5.5433281, 51.69818779)
     ) == pytest.approx(0.0, 0.001)
+
+
+def test_format_timestamp() -> None:
+    """Test formatting timestamps for the API."""
+    assert (
+        format_timestamp(datetime(2024, 10, 19, 17, 5))  # noqa: DTZ001
+        == "2024-10-19T17:05:00"
+    )
+
+
+def test_parse_timestamp() -> None:
+    """Test parsing timestamps of the API."""
+    expected = datetime(2024, 10, 19, 17, tzinfo=UTC)
+    assert parse_timestamp("2024-10-19T17:00:00+00:00") == expected
+    assert parse_timestamp("2024-10-19T19:00:00+02:00") == expected
+    assert parse_timestamp("2024-10-19T17:00:00") == expected
@@ -0,0 +1,133 @@
+"""Tests for watching station measurements."""
+
+from __future__ import annotations
+
+import asyncio
+
+from aioresponses import aioresponses
+
+from luchtmeetnetapi import LuchtmeetNetClient
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+STATION_ID = "TESTA"
+WATCH_URL = (
+    f"{MOCK_URL}/stations/{STATION_ID}/measurements"
+    "?page=1&order=timestamp_measured&order_direction=desc"
+)
+INTERVAL = 0.01
+
+
+def _request_count(responses: aioresponses) -> int:
+    """Count all requests made."""
+    return sum(len(calls) for calls in responses.requests.values())
+
+
+def _mock_polls(responses: aioresponses, url: str = WATCH_URL) -> None:
+    """Mock an unchanged, failed and changed poll."""
+    fixture = load_fixture("get_station_measurements.json")
+    responses.get(url, status=200, body=fixture)
+    responses.get(url, status=200, body=fixture)
+    responses.get(url, status=500)
+    responses.get(url, status=200, body=fixture.replace("53.0", "54.0"), repeat=True)
+
+
+async def test_watch_shared_poller(
+    responses: aioresponses,
+) -> None:
+    """Test subscribers share one poller and only receive changes."""
+    _mock_polls(responses)
+    async with LuchtmeetNetClient() as client:
+        first = client.watch(STATION_ID, interval=INTERVAL)
+        second = client.watch(STATION_ID, interval=INTERVAL)
+        initial = await first.__anext__()
+        assert [(item.formula, item.value) for item in initial] == [
+            ("H2O", 53.0),
+            ("O2", 0.0),
+        ]
+        assert await second.__anext__() == initial
+        changed = await first.__anext__()
+        assert [(item.formula, item.value) for item in changed] == [("H2O", 54.0)]
+        assert await second.__anext__() == changed
+        assert _request_count(responses) == 4
+        assert len(client._pollers) == 1
+
+        await first.aclose()
+        assert len(client._pollers) == 1
+        await second.aclose()
+        assert client._pollers == {}
+
+
+async def test_watch_formula(
+    responses: aioresponses,
+) -> None:
+    """Test watching a single formula."""
+    _mock_polls(responses, f"{WATCH_URL}&formula=H2O")
+    async with LuchtmeetNetClient() as client:
+        watcher = client.watch(STATION_ID, ["H2O"], interval=INTERVAL)
+        assert [item.formula for item in await watcher.__anext__()] == ["H2O"]
+        await watcher.aclose()
+
+
+async def test_watch_formulas(
+    responses: aioresponses,
+) -> None:
+    """Test watching a set of formulas."""
+    _mock_polls(responses)
+    async with LuchtmeetNetClient() as client:
+        watcher = client.watch(STATION_ID, ["H2O", "NO2"], interval=INTERVAL)
+        assert [item.formula for item in await watcher.__anext__()] == ["H2O"]
+        assert [item.value for item in await watcher.__anext__()] == [54.0]
+        await watcher.aclose()
+
+
+async def test_close_stops_pollers(
+    responses: aioresponses,
+) -> None:
+    """Test closing the client stops running pollers."""
+    _mock_polls(responses)
+    client = LuchtmeetNetClient()
+    watcher = client.watch(STATION_ID, interval=INTERVAL)
+    await watcher.__anext__()
+    await client.close()
+    assert client._pollers == {}
+    await asyncio.sleep(INTERVAL * 3)
+    assert _request_count(responses) == 1
+    await watcher.aclose()
+
+
+async def test_watch_unexpected_error(
+    responses: aioresponses,
+) -> None:
+    """Test an unexpected polling error is raised to all watchers."""
+    responses.get(WATCH_URL, status=200, body="not json")
+    async with LuchtmeetNetClient() as client:
+        first = client.watch(STATION_ID, interval=INTERVAL)
+        second = client.watch(STATION_ID, interval=INTERVAL)
+        results = await asyncio.gather(
+            first.__anext__(), second.__anext__(), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        assert client._pollers == {}
+
+
+async def test_watch_ends_on_close(
+    responses: aioresponses,
+) -> None:
+    """Test watches end when the client is closed."""
+    _mock_polls(responses)
+    client = LuchtmeetNetClient()
+    watching = asyncio.Event()
+
+    async def consume() -> int:
+        received = 0
+        async for _ in client.watch(STATION_ID, interval=INTERVAL):
+            received += 1
+            watching.set()
+        return received
+
+    task = asyncio.create_task(consume())
+    await watching.wait()
+    await client.close()
+    assert await asyncio.wait_for(task, 1) >= 1
+    assert client._pollers == {}